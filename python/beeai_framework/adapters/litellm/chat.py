@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import logging
 from abc import ABC
 from collections.abc import AsyncGenerator
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import litellm
 from litellm import (  # type: ignore
@@ -28,12 +30,15 @@ from litellm.types.utils import StreamingChoices
 from openai.lib._pydantic import to_strict_json_schema
 from pydantic import BaseModel
 
+from beeai_framework.adapters.litellm.http_pool import HTTPClientPool
 from beeai_framework.backend.chat import (
     ChatModel,
 )
 from beeai_framework.backend.errors import ChatModelError
 from beeai_framework.backend.message import (
+    AnyMessage,
     AssistantMessage,
+    ContentSnapshot,
     MessageToolCallContent,
     ToolMessage,
 )
@@ -52,6 +57,25 @@ from beeai_framework.utils.dicts import exclude_keys, exclude_none, include_keys
 
 logger = Logger(__name__)
 
+# memoized provider payload parts, keyed weakly so that messages and dynamically created schemas can be collected
+_message_payloads: WeakKeyDictionary[AnyMessage, tuple[ContentSnapshot, list[dict[str, Any]]]] = WeakKeyDictionary()
+_tool_schemas: WeakKeyDictionary[type[BaseModel], dict[str, Any]] = WeakKeyDictionary()
+
+# providers which LiteLLM calls through the OpenAI SDK (they use the `litellm.aclient_session`) and through its own
+# HTTP handler (they accept it as the `client`), the other ones keep their LiteLLM-managed clients
+_OPENAI_SDK_PROVIDERS = {"openai", "azure"}
+_HTTP_HANDLER_PROVIDERS = {"anthropic", "bedrock", "groq", "vertex_ai", "watsonx", "xai"}
+
+_DEFAULT_BASE_URLS = {
+    "openai": "https://api.openai.com/v1",
+    "anthropic": "https://api.anthropic.com",
+    "groq": "https://api.groq.com/openai/v1",
+    "xai": "https://api.x.ai/v1",
+}
+
+# fields which are always overridden by the transformed values (dumping messages and tools is expensive)
+_TRANSFORMED_FIELDS = {"messages", "tools", "tool_choice", "response_format", "abort_signal"}
+
 
 class LiteLLMChatModel(ChatModel, ABC):
     @property
@@ -85,14 +109,14 @@ class LiteLLMChatModel(ChatModel, ABC):
         input: ChatModelInput,
         run: RunContext,
     ) -> ChatModelOutput:
-        litellm_input = self._transform_input(input) | {"stream": False}
+        litellm_input = self._transform_input(input) | {"stream": False} | self._http_client_options()
         response = await acompletion(**litellm_input)
         response_output = self._transform_output(response)
         logger.debug(f"Inference response output:\n{response_output}")
         return response_output
 
     async def _create_stream(self, input: ChatModelInput, _: RunContext) -> AsyncGenerator[ChatModelOutput]:
-        litellm_input = self._transform_input(input) | {"stream": True}
+        litellm_input = self._transform_input(input) | {"stream": True} | self._http_client_options()
         response = await acompletion(**litellm_input)
 
         is_empty = True
@@ -125,42 +149,31 @@ class LiteLLMChatModel(ChatModel, ABC):
             # TODO: validate result matches expected schema
             return ChatModelStructureOutput(object=result)
 
+    async def warmup(self, *, connections: int = 1) -> None:
+        pool = HTTPClientPool.shared()
+        base_url = self._base_url()
+        if pool is None or base_url is None:
+            return
+        await pool.warmup([base_url], connections=connections)
+
+    def _base_url(self) -> str | None:
+        for key in ["api_base", "base_url", "url"]:
+            if self._settings.get(key):
+                return str(self._settings[key])
+        return _DEFAULT_BASE_URLS.get(self._litellm_provider_id)
+
+    def _http_client_options(self) -> dict[str, Any]:
+        pool = HTTPClientPool.shared()
+        if pool is None or "client" in self._settings:
+            return {}
+        if self._litellm_provider_id in _OPENAI_SDK_PROVIDERS:
+            pool.install()
+        elif self._litellm_provider_id in _HTTP_HANDLER_PROVIDERS:
+            return {"client": pool.handler}
+        return {}
+
     def _transform_input(self, input: ChatModelInput) -> dict[str, Any]:
-        messages: list[dict[str, Any]] = []
-        for message in input.messages:
-            if isinstance(message, ToolMessage):
-                for content in message.content:
-                    messages.append(
-                        {
-                            "tool_call_id": content.tool_call_id,
-                            "role": "tool",
-                            "name": content.tool_name,
-                            "content": content.result,
-                        }
-                    )
-            elif isinstance(message, AssistantMessage):
-                messages.append(
-                    exclude_none(
-                        {
-                            "role": "assistant",
-                            "content": [t.model_dump() for t in message.get_text_messages()] or None,
-                            "tool_calls": [
-                                {
-                                    "id": call.id,
-                                    "type": "function",
-                                    "function": {
-                                        "arguments": call.args,
-                                        "name": call.tool_name,
-                                    },
-                                }
-                                for call in message.get_tool_calls()
-                            ]
-                            or None,
-                        }
-                    )
-                )
-            else:
-                messages.append(message.to_plain())
+        messages = [payload for message in input.messages for payload in self._transform_message(message)]
 
         tools = (
             [
@@ -178,16 +191,21 @@ class LiteLLMChatModel(ChatModel, ABC):
             else None
         )
 
+        # a single dump replaces separate ones with the exclude_unset / exclude_none flags
+        values = input.model_dump(exclude=_TRANSFORMED_FIELDS)
+        unset_values = {key: value for key, value in values.items() if key in input.model_fields_set}
+        supported_params = set(self.supported_params)
+
         settings = exclude_keys(
-            self._settings | input.model_dump(exclude_unset=True),
-            {*self.supported_params, "abort_signal", "model", "messages", "tools"},
+            self._settings | unset_values,
+            {*supported_params, "abort_signal", "model", "messages", "tools"},
         )
         params = include_keys(
-            input.model_dump(exclude_none=True)  # get all parameters with default values
+            exclude_none(values)  # get all parameters with default values
             | self._settings  # get constructor overrides
             | self.parameters.model_dump(exclude_unset=True)  # get default parameters
-            | input.model_dump(exclude_none=True, exclude_unset=True),  # get custom manually set parameters
-            set(self.supported_params),
+            | exclude_none(unset_values),  # get custom manually set parameters
+            supported_params,
         )
 
         tool_choice = (
@@ -210,6 +228,56 @@ class LiteLLMChatModel(ChatModel, ABC):
             }
         )
 
+    def _transform_message(self, message: AnyMessage) -> list[dict[str, Any]]:
+        """Converts the message to the provider payload, memoized until its content changes (including in place).
+
+        Shallow copies are returned, so that the provider can adjust the top-level keys of the payload. Messages
+        holding mutable values (see `ContentSnapshot`) are converted every time.
+        """
+        snapshot = ContentSnapshot.take(message.content)
+        if snapshot is None:
+            return self._format_message(message)
+
+        cached = _message_payloads.get(message)
+        if cached is None or not snapshot.matches(cached[0]):
+            cached = _message_payloads[message] = (snapshot, self._format_message(message))
+        return [dict(payload) for payload in cached[1]]
+
+    def _format_message(self, message: AnyMessage) -> list[dict[str, Any]]:
+        if isinstance(message, ToolMessage):
+            return [
+                {
+                    "tool_call_id": content.tool_call_id,
+                    "role": "tool",
+                    "name": content.tool_name,
+                    "content": content.result,
+                }
+                for content in message.content
+            ]
+        elif isinstance(message, AssistantMessage):
+            return [
+                exclude_none(
+                    {
+                        "role": "assistant",
+                        "content": [t.model_dump() for t in message.get_text_messages()] or None,
+                        "tool_calls": [
+                            {
+                                "id": call.id,
+                                "type": "function",
+                                "function": {
+                                    "arguments": call.args,
+                                    "name": call.tool_name,
+                                },
+                            }
+                            for call in message.get_tool_calls()
+                        ]
+                        or None,
+                    }
+                )
+            ]
+        else:
+            return [message.to_plain()]
+
     def _transform_output(self, chunk: ModelResponse | ModelResponseStream) -> ChatModelOutput:
         choice = chunk.choices[0]
         finish_reason = choice.finish_reason
@@ -243,7 +311,11 @@ class LiteLLMChatModel(ChatModel, ABC):
 
     def _format_tool_model(self, model: type[BaseModel]) -> dict[str, Any]:
         # Original OpenAI API requires more strict schema in order to perform well and pass the validation.
-        return to_strict_json_schema(model)
+        # Generating it is expensive, so it is done once per schema class (copies protect the cached one).
+        schema = _tool_schemas.get(model)
+        if schema is None:
+            schema = _tool_schemas[model] = to_strict_json_schema(model)
+        return copy.deepcopy(schema)
 
     def _format_response_model(self, model: type[BaseModel] | dict[str, Any]) -> type[BaseModel] | dict[str, Any]:
         return model
@@ -0,0 +1,259 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
+
+import httpx
+import litellm
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+from pydantic import BaseModel
+
+from beeai_framework.logger import Logger
+
+logger = Logger(__name__)
+
+
+class HTTPClientPoolStats(BaseModel):
+    requests: int = 0
+    new_connections: int = 0
+    """Requests which had to open a new connection."""
+    reused_connections: int = 0
+    """Requests served over an already open (kept-alive) connection."""
+    active_requests: int = 0
+    failed_requests: int = 0
+
+
+class HTTPClientPool:
+    """Pool of keep-alive HTTP connections shared by the LiteLLM-based chat models.
+
+    Every event loop gets its own `httpx.AsyncClient` (connections cannot be shared across loops). The pool is opt-in,
+    enable it with `HTTPClientPool.set_shared()` and the models pick it up through `HTTPClientPool.shared()`. Pass
+    `None` to leave the connection management to LiteLLM again.
+
+    For providers based on the OpenAI SDK the pool is installed as `litellm.aclient_session`, which is global to the
+    process, so LiteLLM calls made outside the framework use it as well. The pool belongs to whoever enabled it, the
+    models never close it.
+
+    `max_connections_per_host` limits the concurrent requests to a single host, the other ones wait for a free slot.
+    `http2` requires the `h2` package.
+    """
+
+    _shared: ClassVar["HTTPClientPool | None"] = None
+
+    def __init__(
+        self,
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        max_connections_per_host: int | None = None,
+        keepalive_expiry: float | None = 30,
+        http2: bool = False,
+        timeout: float | None = 600,
+    ) -> None:
+        if max_connections_per_host is not None and max_connections_per_host < 1:
+            raise ValueError("The 'max_connections_per_host' must be at least 1.")
+
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._max_connections_per_host = max_connections_per_host
+        self._http2 = http2
+        self._timeout = timeout
+        self._clients: WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, AsyncHTTPHandler]] = (
+            WeakKeyDictionary()
+        )
+        self._stats = HTTPClientPoolStats()
+
+    @classmethod
+    def shared(cls) -> "HTTPClientPool | None":
+        return cls._shared
+
+    @classmethod
+    def set_shared(cls, pool: "HTTPClientPool | None") -> None:
+        if cls._shared is not None and cls._shared is not pool:
+            cls._shared._uninstall()
+        cls._shared = pool
+
+    @property
+    def stats(self) -> HTTPClientPoolStats:
+        return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        self._stats = HTTPClientPoolStats(active_requests=self._stats.active_requests)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The client of the running event loop."""
+        return self._get_clients()[0]
+
+    @property
+    def handler(self) -> AsyncHTTPHandler:
+        """The client of the running event loop wrapped for LiteLLM providers that do not use the OpenAI SDK."""
+        return self._get_clients()[1]
+
+    def install(self) -> None:
+        """Makes LiteLLM use the pool for providers based on the OpenAI SDK (e.g., OpenAI, Azure OpenAI, Ollama)."""
+        client = self.client
+        if litellm.aclient_session is not client:
+            if litellm.aclient_session is not None:
+                # the SDK clients cached by LiteLLM are bound to the previous session
+                litellm.in_memory_llm_clients_cache.flush_cache()  # type: ignore[no-untyped-call]
+            litellm.aclient_session = client
+
+    async def warmup(self, urls: Sequence[str], *, connections: int = 1) -> None:
+        """Opens (up to) `connections` connections to each URL in advance, so that the first requests reuse them."""
+        client = self.client
+
+        async def request(url: str) -> None:
+            try:
+                response = await client.head(url)
+                await response.aclose()
+            except httpx.HTTPError as e:
+                logger.warning(f"Warming up the connection to '{url}' failed: {e}")
+
+        await asyncio.gather(*(request(url) for url in urls for _ in range(connections)))
+
+    async def close(self) -> None:
+        """Closes the connections of the running event loop; new ones are opened on the next request."""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.pop(loop, None)
+        if clients is None:
+            return
+        if litellm.aclient_session is clients[0]:
+            litellm.aclient_session = None
+            litellm.in_memory_llm_clients_cache.flush_cache()  # type: ignore[no-untyped-call]
+        await clients[0].aclose()
+
+    def _uninstall(self) -> None:
+        if any(litellm.aclient_session is client for client, _ in self._clients.values()):
+            litellm.aclient_session = None
+            litellm.in_memory_llm_clients_cache.flush_cache()  # type: ignore[no-untyped-call]
+
+    def _get_clients(self) -> tuple[httpx.AsyncClient, AsyncHTTPHandler]:
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            transport = _PoolTransport(
+                httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2),
+                self._record,
+                self._max_connections_per_host,
+            )
+            client = httpx.AsyncClient(transport=transport, timeout=self._timeout, follow_redirects=True)
+            handler = AsyncHTTPHandler()
+            handler.client = client
+            clients = self._clients[loop] = (client, handler)
+        return clients
+
+    def _record(self, event: str) -> None:
+        if event == "start":
+            self._stats.requests += 1
+            self._stats.active_requests += 1
+        elif event == "end":
+            self._stats.active_requests -= 1
+        elif event == "failed":
+            self._stats.active_requests -= 1
+            self._stats.failed_requests += 1
+        elif event == "new":
+            self._stats.new_connections += 1
+        elif event == "reused":
+            self._stats.reused_connections += 1
+
+
+class _PoolTransport(httpx.AsyncBaseTransport):
+    """Counts new and reused connections (using the httpcore trace hooks) and limits the concurrency per host."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, record: Callable[[str], None], max_per_host: int | None
+    ) -> None:
+        self._transport = transport
+        self._record = record
+        self._max_per_host = max_per_host
+        self._host_slots: dict[tuple[str, str, int | None], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._get_slot(request.url)
+        if slot is not None:
+            await slot.acquire()
+
+        connected = False
+        previous_trace: Callable[[str, dict[str, Any]], Awaitable[None]] | None = request.extensions.get("trace")
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            nonlocal connected
+            if name == "connection.connect_tcp.started":
+                connected = True
+            if previous_trace is not None:
+                await previous_trace(name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        self._record("start")
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._record("failed")
+            if slot is not None:
+                slot.release()
+            raise
+
+        self._record("new" if connected else "reused")
+        response.stream = _ReleasingStream(response.stream, slot, self._record)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _get_slot(self, url: httpx.URL) -> asyncio.Semaphore | None:
+        if self._max_per_host is None:
+            return None
+        key = (url.scheme, url.host, url.port)
+        slot = self._host_slots.get(key)
+        if slot is None:
+            slot = self._host_slots[key] = asyncio.Semaphore(self._max_per_host)
+        return slot
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees the host slot once the response is read or closed."""
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream | httpx.AsyncByteStream,
+        slot: asyncio.Semaphore | None,
+        record: Callable[[str], None],
+    ) -> None:
+        self._stream = stream
+        self._slot = slot
+        self._record: Callable[[str], None] | None = record
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        assert isinstance(self._stream, httpx.AsyncByteStream)
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            if isinstance(self._stream, httpx.AsyncByteStream):
+                await self._stream.aclose()
+        finally:
+            if self._record is not None:
+                self._record("end")
+                self._record = None
+                if self._slot is not None:
+                    self._slot.release()
@@ -0,0 +1,90 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import re
+from collections.abc import Callable, Sequence
+
+from beeai_framework.backend.message import AnyMessage, MessageTextContent
+from beeai_framework.backend.types import ChatModelInput
+
+CacheKeyNormalizer = Callable[[ChatModelInput], ChatModelInput]
+"""Rewrites the input of `ChatModel.create` before its cache key is computed (the request itself stays intact)."""
+
+
+def strip_patterns(*patterns: str | re.Pattern[str], roles: Sequence[str] | None = None) -> CacheKeyNormalizer:
+    """Removes the parts of the message texts matching any of the patterns (optionally only for the given roles)."""
+    compiled = [re.compile(pattern) if isinstance(pattern, str) else pattern for pattern in patterns]
+    role_names = {str(role) for role in roles} if roles is not None else None
+
+    def strip(text: str) -> str:
+        for pattern in compiled:
+            text = pattern.sub("", text)
+        return text
+
+    def normalize(input: ChatModelInput) -> ChatModelInput:
+        messages = [
+            _replace_texts(message, strip) if role_names is None or str(message.role) in role_names else message
+            for message in input.messages
+        ]
+        return _with_messages(input, messages)
+
+    return normalize
+
+
+def exclude_messages(predicate: Callable[[AnyMessage], bool]) -> CacheKeyNormalizer:
+    """Leaves out the messages matching the predicate, e.g., `lambda msg: msg.meta.get("tempMessage", False)`.
+
+    Note that an agent retrying with extra (temporary) messages would then be answered from the cache.
+    """
+
+    def normalize(input: ChatModelInput) -> ChatModelInput:
+        return _with_messages(input, [message for message in input.messages if not predicate(message)])
+
+    return normalize
+
+
+strip_framework_timestamps = strip_patterns(
+    # ReActAgent user prompt, e.g., "\n\nThis message was created at 2025-01-01T10:00:00+00:00"
+    re.compile(r"\n\nThis message was created at \S+"),
+    # ReActAgent (Granite) and ToolCallingAgent system prompts
+    re.compile(r"(?<=The current date and time is: ).+"),
+)
+"""Strips the current date and time the framework's agent templates put into the prompts."""
+
+DEFAULT_CACHE_KEY_NORMALIZERS: list[CacheKeyNormalizer] = [strip_framework_timestamps]
+
+
+def normalize_cache_input(input: ChatModelInput, normalizers: Sequence[CacheKeyNormalizer]) -> ChatModelInput:
+    for normalizer in normalizers:
+        input = normalizer(input)
+    return input
+
+
+def _replace_texts(message: AnyMessage, fn: Callable[[str], str]) -> AnyMessage:
+    content = list(message.content)
+    changed = False
+    for index, item in enumerate(content):
+        if isinstance(item, MessageTextContent) and (text := fn(item.text)) != item.text:
+            content[index] = MessageTextContent(text=text)
+            changed = True
+    return message.clone(content) if changed else message
+
+
+def _with_messages(input: ChatModelInput, messages: list[AnyMessage]) -> ChatModelInput:
+    if len(messages) == len(input.messages) and all(
+        new is old for new, old in zip(messages, input.messages, strict=True)
+    ):
+        return input
+    return input.model_copy(update={"messages": messages})
@@ -12,16 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Sequence
+from contextlib import aclosing, asynccontextmanager
 from functools import cached_property
 from typing import Any, Literal, TypeVar
 
 from pydantic import BaseModel, Field
 
+from beeai_framework.backend.cache_keys import (
+    DEFAULT_CACHE_KEY_NORMALIZERS,
+    CacheKeyNormalizer,
+    normalize_cache_input,
+)
+from beeai_framework.backend.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencySlot
 from beeai_framework.backend.constants import ProviderName
-from beeai_framework.backend.errors import ChatModelError
+from beeai_framework.backend.errors import ChatModelError, ConcurrencyLimitExceededError
 from beeai_framework.backend.events import (
+    ChatModelConcurrencyEvent,
     ChatModelErrorEvent,
     ChatModelNewTokenEvent,
     ChatModelStartEvent,
@@ -29,20 +38,27 @@ from beeai_framework.backend.events import (
     chat_model_event_types,
 )
 from beeai_framework.backend.message import AnyMessage, SystemMessage
+from beeai_framework.backend.rate_limiter import RateLimiter, RateLimitPermit
 from beeai_framework.backend.types import (
+    ChatModelBatchResult,
     ChatModelCache,
+    ChatModelCompactOutput,
     ChatModelInput,
     ChatModelOutput,
     ChatModelParameters,
     ChatModelStructureInput,
     ChatModelStructureOutput,
+    ChatModelUsage,
 )
 from beeai_framework.backend.utils import load_model, parse_broken_json, parse_model
-from beeai_framework.cache.base import BaseCache
 from beeai_framework.cache.null_cache import NullCache
+from beeai_framework.cache.prefix_cache import PrefixCache
+from beeai_framework.cache.semantic_cache import SemanticCache
+from beeai_framework.cache.single_flight import SingleFlight
 from beeai_framework.cancellation import AbortController, AbortSignal
 from beeai_framework.context import Run, RunContext
 from beeai_framework.emitter import Emitter
+from beeai_framework.errors import FrameworkError
 from beeai_framework.logger import Logger
 from beeai_framework.retryable import Retryable, RetryableConfig, RetryableContext, RetryableInput
 from beeai_framework.template import PromptTemplate, PromptTemplateInput
@@ -56,6 +72,13 @@ ChatModelFinishReason: Literal["stop", "length", "function_call", "content_filte
 logger = Logger(__name__)
 
 
+class _ProviderCall:
+    """Outcome of a call to the provider, reported to the limiters."""
+
+    def __init__(self) -> None:
+        self.usage: ChatModelUsage | None = None
+
+
 class ChatModel(ABC):
     @property
     @abstractmethod
@@ -70,6 +93,9 @@ class ChatModel(ABC):
     def __init__(self) -> None:
         self.parameters = ChatModelParameters()
         self.cache: ChatModelCache = NullCache[list[ChatModelOutput]]()
+        self.cache_key_normalizers: list[CacheKeyNormalizer] = list(DEFAULT_CACHE_KEY_NORMALIZERS)
+        self.rate_limiter: RateLimiter | None = None
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
 
     @cached_property
     def emitter(self) -> Emitter:
@@ -183,43 +209,53 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
             tool_choice=tool_choice,
             **kwargs,
         )
+        return self._create_run(model_input)
 
+    def _create_run(self, model_input: ChatModelInput) -> Run[ChatModelOutput]:
         async def handler(context: RunContext) -> ChatModelOutput:
-            cache_key = BaseCache.generate_key(model_input, {"messages": [m.to_plain() for m in model_input.messages]})
-            cache_hit = await self.cache.get(cache_key)
+            cache_key = await self._resolve_cache_key(model_input) if self.cache.enabled else None
+            cache_hit = await self.cache.get(cache_key) if cache_key is not None else None
 
             try:
                 await context.emitter.emit("start", ChatModelStartEvent(input=model_input))
                 chunks: list[ChatModelOutput] = []
 
                 if model_input.stream:
-                    generator = (
-                        to_async_generator(cache_hit) if cache_hit else self._create_stream(model_input, context)
-                    )
-                    abort_controller: AbortController = AbortController()
-                    async for value in generator:
-                        chunks.append(value)
-                        await context.emitter.emit(
-                            "new_token", ChatModelNewTokenEvent(value=value, abort=lambda: abort_controller.abort())
+                    if cache_hit:
+                        generator = to_async_generator(self._replay_chunks(cache_hit))
+                    elif cache_key is not None:
+                        generator = self._flights.stream(
+                            cache_key, lambda: self._create_stream_cached(cache_key, model_input, context)
                         )
-                        if abort_controller.signal.aborted:
-                            break
+                    else:
+                        generator = self._create_stream_limited(model_input, context)
+
+                    abort_controller: AbortController = AbortController()
+                    async with aclosing(generator):
+                        async for value in generator:
+                            chunks.append(value)
+                            await context.emitter.emit(
+                                "new_token", ChatModelNewTokenEvent(value=value, abort=lambda: abort_controller.abort())
+                            )
+                            if abort_controller.signal.aborted:
+                                break
 
-                    if not cache_hit:
-                        await self.cache.set(cache_key, chunks)
                     result = ChatModelOutput.from_chunks(chunks)
                 else:
                     if cache_hit:
                         result = cache_hit[0]
+                    elif cache_key is not None:
+                        result = await self._flights.do(
+                            cache_key, lambda: self._create_cached(cache_key, model_input, context)
+                        )
                     else:
-                        result = await self._create(model_input, context)
-                        await self.cache.set(cache_key, [result])
+                        result = await self._create_limited(model_input, context)
 
                 await context.emitter.emit("success", ChatModelSuccessEvent(value=result))
                 return result
             except Exception as ex:
                 error = ChatModelError.ensure(ex, model=self)
-                if cache_hit:
+                if cache_hit and cache_key is not None:
                     await self.cache.delete(cache_key)
                 await context.emitter.emit("error", ChatModelErrorEvent(input=model_input, error=error))
                 raise error
@@ -229,10 +265,149 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
         return RunContext.enter(
             self,
             handler,
-            signal=abort_signal,
+            signal=model_input.abort_signal,
             run_params=model_input.model_dump(),
         )
 
+    @cached_property
+    def _flights(self) -> SingleFlight[ChatModelOutput]:
+        # concurrent calls with the same cache key share one call to the provider
+        return SingleFlight()
+
+    async def _create_cached(self, key: str, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        result = await self._create_limited(input, run)
+        await self.cache.set(key, [result])
+        return result
+
+    async def _create_stream_cached(
+        self, key: str, input: ChatModelInput, run: RunContext
+    ) -> AsyncGenerator[ChatModelOutput]:
+        chunks: list[ChatModelOutput] = []
+        async for chunk in self._create_stream_limited(input, run):
+            chunks.append(chunk)
+            yield chunk
+
+        compact = ChatModelCompactOutput.compact(chunks)
+        await self.cache.set(key, [compact] if compact is not None else chunks)
+
+    async def _create_limited(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        async with self._limit([input], run) as call:
+            result = await self._create(input, run)
+            call.usage = result.usage
+            return result
+
+    async def _create_stream_limited(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        async with self._limit([input], run) as call, aclosing(self._create_stream(input, run)) as stream:
+            async for chunk in stream:
+                call.usage = chunk.usage or call.usage
+                yield chunk
+
+    @asynccontextmanager
+    async def _limit(
+        self, inputs: Sequence[ChatModelInput | ChatModelStructureInput[Any]], run: RunContext
+    ) -> AsyncIterator["_ProviderCall"]:
+        """Waits for the rate and concurrency limiters (if any) and reports the outcome of the call to them."""
+        call = _ProviderCall()
+        permit: RateLimitPermit | None = None
+        if self.rate_limiter is not None:
+            estimates = [self.rate_limiter.estimate(input) for input in inputs]
+            permit = await self.rate_limiter.acquire_tokens(
+                sum(tokens for tokens, _ in estimates),
+                group=run.group_id,
+                prompt_chars=sum(chars for _, chars in estimates),
+            )
+
+        slot: ConcurrencySlot | None = None
+        success = overloaded = False
+        try:
+            if self.concurrency_limiter is not None:
+                slot = await self._acquire_slot(self.concurrency_limiter, run)
+            yield call
+            success = True
+        except Exception as e:
+            self._check_rate_limit_error(e)
+            overloaded = self._is_transient_error(e.__cause__ if isinstance(e, FrameworkError) else e)
+            raise
+        finally:
+            if slot is not None:
+                limit = slot.limiter.limit
+                slot.release(usage=call.usage, success=success, overloaded=overloaded)
+                if slot.limiter.limit != limit:
+                    await self._emit_concurrency(slot.limiter, run)
+            if permit is not None:
+                permit.settle(call.usage)
+
+    async def _acquire_slot(self, limiter: AdaptiveConcurrencyLimiter, run: RunContext) -> ConcurrencySlot:
+        # the queue depth is reported whenever a request joins or leaves the queue
+        queued = False
+
+        async def on_queued() -> None:
+            nonlocal queued
+            queued = True
+            await self._emit_concurrency(limiter, run)
+
+        try:
+            slot = await limiter.acquire(on_queued=on_queued)
+        except ConcurrencyLimitExceededError:
+            await self._emit_concurrency(limiter, run)
+            raise
+        except BaseException:
+            if queued:
+                await self._emit_concurrency(limiter, run)
+            raise
+
+        if slot.queued:
+            await self._emit_concurrency(limiter, run)
+        return slot
+
+    async def _emit_concurrency(self, limiter: AdaptiveConcurrencyLimiter, run: RunContext) -> None:
+        stats = limiter.stats
+        await run.emitter.emit(
+            "concurrency",
+            ChatModelConcurrencyEvent(
+                limit=stats.limit, in_flight=stats.in_flight, queued=stats.queued, rejected=stats.rejected
+            ),
+        )
+
+    def _check_rate_limit_error(self, error: Exception) -> None:
+        if self.rate_limiter is None:
+            return
+
+        # the provider's error may be wrapped (e.g., in a ChatModelError), so the whole chain of causes is checked
+        cause: BaseException | None = error
+        seen: set[int] = set()
+        while cause is not None and id(cause) not in seen and getattr(cause, "status_code", None) != 429:
+            seen.add(id(cause))
+            cause = cause.__cause__
+        if cause is None or id(cause) in seen:
+            return
+
+        response = getattr(cause, "response", None)
+        retry_after = getattr(response, "headers", {}).get("retry-after")
+        try:
+            self.rate_limiter.pause(float(retry_after) if retry_after is not None else None)
+        except ValueError:
+            self.rate_limiter.pause()
+
+    @staticmethod
+    def _replay_chunks(outputs: list[ChatModelOutput]) -> Iterator[ChatModelOutput]:
+        for output in outputs:
+            if isinstance(output, ChatModelCompactOutput):
+                yield from output.iter_chunks()
+            else:
+                yield output
+
+    def _generate_key(self, input: ChatModelInput) -> str:
+        # the key of the whole conversation is the last of its prefix keys (see PrefixCache)
+        return PrefixCache.generate_prefix_keys(input)[-1]
+
+    async def _resolve_cache_key(self, input: ChatModelInput) -> str:
+        input = normalize_cache_input(input, self.cache_key_normalizers)
+        key = self._generate_key(input)
+        if isinstance(self.cache, SemanticCache):
+            return await self.cache.resolve_key(input, key)
+        return key
+
     def create_structure(
         self,
         *,
@@ -246,7 +421,8 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
         )
 
         async def handler(context: RunContext) -> ChatModelStructureOutput:
-            return await self._create_structure(model_input, context)
+            async with self._limit([model_input], context):
+                return await self._create_structure(model_input, context)
 
         return RunContext.enter(
             self,
@@ -255,15 +431,206 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
             run_params=model_input.model_dump(),
         )
 
+    async def create_batch(
+        self,
+        inputs: Iterable[ChatModelInput | list[AnyMessage]] | AsyncIterable[ChatModelInput | list[AnyMessage]],
+        *,
+        concurrency: int = 10,
+        ordered: bool = False,
+        max_retries: int = 0,
+        batch_size: int | None = None,
+        abort_signal: AbortSignal | None = None,
+    ) -> AsyncGenerator[ChatModelBatchResult]:
+        """Runs many independent inputs and yields their results as they finish (or in the input order).
+
+        Inputs are consumed lazily and at most `concurrency` of them are in progress (or waiting to be yielded) at
+        a time. Cached outputs are served without calling the provider. Every input is retried up to `max_retries`
+        times on transient errors (timeouts, rate limits, server errors); a failure of one input does not stop the
+        batch, its result carries the error instead. With `batch_size`, inputs missing in the cache are grouped and
+        passed to the provider's native batch endpoint (see `_create_batch`), if it has any.
+        """
+        if concurrency < 1:
+            raise ValueError("The 'concurrency' must be at least 1.")
+
+        slots = asyncio.Semaphore(concurrency)
+        results: asyncio.Queue[ChatModelBatchResult | BaseException | None] = asyncio.Queue()
+        tasks: set[asyncio.Task[None]] = set()
+
+        def spawn(coroutine: Any) -> None:
+            task = asyncio.create_task(coroutine)
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        async def run_item(index: int, input: ChatModelInput) -> None:
+            async def executor(_: RetryableContext) -> ChatModelOutput:
+                try:
+                    return await self._create_run(input)
+                except FrameworkError as e:
+                    if self._is_transient_error(e.__cause__):
+                        e.retryable = True
+                    raise
+
+            try:
+                output = await Retryable(
+                    RetryableInput(
+                        executor=executor, config=RetryableConfig(max_retries=max_retries, signal=abort_signal)
+                    )
+                ).get()
+                await results.put(ChatModelBatchResult(index=index, input=input, output=output))
+            except Exception as e:
+                error = ChatModelError.ensure(e, model=self)
+                await results.put(ChatModelBatchResult(index=index, input=input, error=error))
+
+        async def run_chunk(chunk: list[tuple[int, ChatModelInput, str | None]]) -> None:
+            async def handler(context: RunContext) -> list[ChatModelOutput]:
+                chunk_inputs = [input for _, input, _ in chunk]
+                async with self._limit(chunk_inputs, context) as call:
+                    outputs = await self._create_batch(chunk_inputs, context) or []
+                    usages = [output.usage for output in outputs if output.usage is not None]
+                    if usages and len(usages) == len(outputs):
+                        call.usage = ChatModelUsage(
+                            prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+                            completion_tokens=sum(usage.completion_tokens for usage in usages),
+                            total_tokens=sum(usage.total_tokens for usage in usages),
+                        )
+                    return outputs
+
+            try:
+                outputs = await RunContext.enter(self, handler, signal=abort_signal)
+            except Exception as e:
+                logger.warning(f"Native batch of {len(chunk)} inputs failed, running them one by one: {e}")
+                outputs = []
+
+            if len(outputs) != len(chunk):
+                for index, input, _ in chunk:
+                    spawn(run_item(index, input))
+                return
+
+            for (index, input, key), output in zip(chunk, outputs, strict=True):
+                if key is not None:
+                    await self.cache.set(key, [output])
+                await results.put(ChatModelBatchResult(index=index, input=input, output=output))
+
+        async def dispatch() -> None:
+            chunk: list[tuple[int, ChatModelInput, str | None]] = []
+
+            def flush() -> None:
+                if chunk:
+                    spawn(run_chunk(chunk[:]))
+                    chunk.clear()
+
+            index = 0
+            async for item in inputs if isinstance(inputs, AsyncIterable) else to_async_generator(inputs):
+                if batch_size is not None and slots.locked():
+                    flush()  # the chunk would not fill up before a slot is freed
+                await slots.acquire()
+                if abort_signal is not None:
+                    abort_signal.throw_if_aborted()
+
+                input = ChatModelInput(messages=item) if isinstance(item, list) else item
+                if abort_signal is not None and input.abort_signal is None:
+                    input = input.model_copy(update={"abort_signal": abort_signal})
+
+                key = await self._resolve_cache_key(input) if self.cache.enabled else None
+                cached = await self.cache.get(key) if key is not None else None
+                if cached:
+                    output = cached[0] if len(cached) == 1 else ChatModelOutput.from_chunks(cached)
+                    await results.put(ChatModelBatchResult(index=index, input=input, output=output, cached=True))
+                elif batch_size is not None:
+                    chunk.append((index, input, key))
+                    if len(chunk) >= batch_size:
+                        flush()
+                else:
+                    spawn(run_item(index, input))
+                index += 1
+
+            flush()
+            while tasks:
+                await asyncio.gather(*tasks)
+
+        async def produce() -> None:
+            try:
+                await dispatch()
+                await results.put(None)
+            except BaseException as e:
+                await results.put(e)
+                raise
+
+        producer = asyncio.create_task(produce())
+        buffered: dict[int, ChatModelBatchResult] = {}
+        next_index = 0
+        try:
+            while (result := await results.get()) is not None:
+                if isinstance(result, BaseException):
+                    raise result
+                if not ordered:
+                    yield result
+                    slots.release()
+                    continue
+
+                buffered[result.index] = result
+                while next_index in buffered:
+                    yield buffered.pop(next_index)
+                    slots.release()
+                    next_index += 1
+        finally:
+            producer.cancel()
+            for task in [*tasks]:
+                task.cancel()
+            await asyncio.gather(producer, *tasks, return_exceptions=True)
+
+    async def _create_batch(self, inputs: list[ChatModelInput], run: RunContext) -> list[ChatModelOutput] | None:
+        """Provider hook for native batch endpoints used by `create_batch`.
+
+        Returns one output per input (in the same order) or `None` if the inputs cannot be batched, in which case
+        they are run one by one.
+        """
+        return None
+
+    @staticmethod
+    def _is_transient_error(error: BaseException | None) -> bool:
+        if isinstance(error, FrameworkError):
+            return False
+        status_code = getattr(error, "status_code", None)
+        return isinstance(error, TimeoutError | ConnectionError) or (
+            isinstance(status_code, int) and (status_code in {408, 429} or status_code >= 500)
+        )
+
+    async def warmup(self, *, connections: int = 1) -> None:
+        """Opens connections to the provider in advance, so that the first requests do not wait for them."""
+        return None
+
+    async def close(self) -> None:
+        """Releases the network resources (e.g., idle connections) held for the model."""
+        return None
+
     def config(
         self,
         *,
         parameters: ChatModelParameters | Callable[[ChatModelParameters], ChatModelParameters] | None = None,
         cache: ChatModelCache | Callable[[ChatModelCache], ChatModelCache] | None = None,
+        cache_key_normalizers: Sequence[CacheKeyNormalizer]
+        | Callable[[list[CacheKeyNormalizer]], Sequence[CacheKeyNormalizer]]
+        | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ) -> None:
         if cache is not None:
             self.cache = cache(self.cache) if callable(cache) else cache
 
+        if cache_key_normalizers is not None:
+            self.cache_key_normalizers = list(
+                cache_key_normalizers(self.cache_key_normalizers)
+                if callable(cache_key_normalizers)
+                else cache_key_normalizers
+            )
+
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+
+        if concurrency_limiter is not None:
+            self.concurrency_limiter = concurrency_limiter
+
         if parameters is not None:
             self.parameters = parameters(self.parameters) if callable(parameters) else parameters
 
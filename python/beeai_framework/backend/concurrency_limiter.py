@@ -0,0 +1,201 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel
+
+from beeai_framework.backend.errors import ConcurrencyLimitExceededError
+from beeai_framework.backend.types import ChatModelUsage
+from beeai_framework.logger import Logger
+
+logger = Logger(__name__)
+
+
+class ConcurrencyLimiterStats(BaseModel):
+    limit: int
+    in_flight: int = 0
+    queued: int = 0
+    completed: int = 0
+    overloaded: int = 0
+    """Requests which failed because the provider was overloaded (timeouts, rate limits, server errors)."""
+    rejected: int = 0
+    """Requests rejected because the queue was full."""
+
+
+class ConcurrencySlot:
+    """Permission to send a single request, to be released with its outcome once the request finishes."""
+
+    def __init__(
+        self, limiter: "AdaptiveConcurrencyLimiter", *, started_at: float, saturated: bool, queued: bool = False
+    ) -> None:
+        self.limiter = limiter
+        self.started_at = started_at
+        self.saturated = saturated
+        self.queued = queued
+        """Whether the request waited in the queue."""
+        self.released = False
+
+    def release(self, *, usage: ChatModelUsage | None = None, success: bool = True, overloaded: bool = False) -> None:
+        """Frees the slot and adjusts the limit.
+
+        Pass `overloaded` for errors signalling that the provider cannot keep up, and `success=False` for the other
+        failures (they do not affect the limit). Calling it more than once has no effect.
+        """
+        if not self.released:
+            self.released = True
+            self.limiter._release(self, usage=usage, success=success, overloaded=overloaded)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of requests in flight and adapts the limit to the provider's capacity (AIMD).
+
+    The limit grows additively (by one per limit's worth of successful requests) while all slots are in use and the
+    latency stays flat. It is cut multiplicatively when the provider is overloaded (timeouts, rate limits, server
+    errors), or by `latency_backoff` once the latency exceeds `latency_tolerance` times the baseline (the lowest
+    latency observed recently). The latency is normalized by the number of generated tokens when the usage is known.
+    At most one cut happens per round of requests, since the requests in flight observed the same overload.
+
+    Requests over the limit wait in a FIFO queue, or are rejected with `ConcurrencyLimitExceededError` once
+    `max_queue` requests are waiting.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_backoff: float = 0.9,
+        latency_tolerance: float = 2.0,
+        max_queue: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("The limits must satisfy 1 <= 'min_limit' <= 'initial_limit' <= 'max_limit'.")
+        if not 0 < backoff < 1 or not 0 < latency_backoff < 1:
+            raise ValueError("The 'backoff' and 'latency_backoff' must be within (0, 1).")
+        if latency_tolerance <= 1:
+            raise ValueError("The 'latency_tolerance' must be greater than 1.")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_backoff = latency_backoff
+        self.latency_tolerance = latency_tolerance
+        self.max_queue = max_queue
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._baseline: float | None = None
+        self._decreased_at = -math.inf
+        self._stats = ConcurrencyLimiterStats(limit=initial_limit)
+
+    @property
+    def limit(self) -> int:
+        return math.floor(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def stats(self) -> ConcurrencyLimiterStats:
+        return self._stats.model_copy(update={"limit": self.limit, "in_flight": self._in_flight, "queued": self.queued})
+
+    def reset_stats(self) -> None:
+        self._stats = ConcurrencyLimiterStats(limit=self.limit)
+
+    async def acquire(self, *, on_queued: Callable[[], Awaitable[None]] | None = None) -> ConcurrencySlot:
+        """Waits for a free slot. The `on_queued` callback is awaited once the request joins the queue."""
+        queued = bool(self._waiters) or self._in_flight >= self.limit
+        if queued:
+            if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+                self._stats.rejected += 1
+                raise ConcurrencyLimitExceededError(
+                    context={"limit": self.limit, "in_flight": self._in_flight, "queued": len(self._waiters)}
+                )
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                if on_queued is not None:
+                    await on_queued()
+                await waiter
+            except BaseException:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    self._in_flight -= 1  # the slot was handed over already
+                    self._wake()
+                raise
+        else:
+            self._in_flight += 1
+
+        return ConcurrencySlot(
+            self,
+            started_at=self._clock(),
+            saturated=self._in_flight >= self.limit or bool(self._waiters),
+            queued=queued,
+        )
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _release(self, slot: ConcurrencySlot, *, usage: ChatModelUsage | None, success: bool, overloaded: bool) -> None:
+        self._in_flight -= 1
+        if overloaded:
+            self._stats.overloaded += 1
+            self._decrease(slot, self.backoff)
+        elif success:
+            self._stats.completed += 1
+            latency = self._clock() - slot.started_at
+            if usage is not None and usage.completion_tokens > 0:
+                latency /= usage.completion_tokens
+
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                # the baseline slowly follows the latency, so that a single fast outlier does not stick
+                self._baseline += 0.01 * (latency - self._baseline)
+
+            if latency > self._baseline * self.latency_tolerance:
+                self._decrease(slot, self.latency_backoff)
+            elif slot.saturated or self._waiters:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+        self._wake()
+
+    def _decrease(self, slot: ConcurrencySlot, factor: float) -> None:
+        # the requests which started before the last cut were sent at the higher limit
+        if slot.started_at < self._decreased_at:
+            return
+
+        self._decreased_at = self._clock()
+        self._limit = max(self.min_limit, self._limit * factor)
+        logger.debug(f"Concurrency limit decreased to {self.limit}.")
@@ -57,6 +57,17 @@ class ChatModelError(BackendError):
         return super().ensure(error, message=message, context=model_context)
 
 
+class ConcurrencyLimitExceededError(BackendError):
+    def __init__(
+        self,
+        message: str = "Too many requests are waiting for the chat model",
+        *,
+        cause: Exception | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(message, is_fatal=False, is_retryable=True, cause=cause, context=context)
+
+
 class MessageError(FrameworkError):
     def __init__(
         self,
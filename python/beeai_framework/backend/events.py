@@ -39,10 +39,18 @@ class ChatModelErrorEvent(BaseModel):
     error: InstanceOf[FrameworkError]
 
 
+class ChatModelConcurrencyEvent(BaseModel):
+    limit: int
+    in_flight: int
+    queued: int
+    rejected: int
+
+
 chat_model_event_types: dict[str, type] = {
     "new_token": ChatModelNewTokenEvent,
     "success": ChatModelSuccessEvent,
     "start": ChatModelStartEvent,
     "error": ChatModelErrorEvent,
+    "concurrency": ChatModelConcurrencyEvent,
     "finish": NoneType,
 }
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import enum
 import json
+import operator
 from abc import ABC
 from collections.abc import Sequence
 from datetime import UTC, datetime
@@ -23,6 +25,7 @@ from typing import Any, Generic, Literal, Self, TypeAlias, TypeVar, cast
 from litellm.types.llms.openai import ChatCompletionImageUrlObject
 from pydantic import BaseModel, ConfigDict
 
+from beeai_framework.cache.keys import encode_value, hash_bytes
 from beeai_framework.utils.lists import cast_list
 from beeai_framework.utils.models import to_any_model, to_model
 
@@ -72,6 +75,49 @@ class MessageToolCallContent(BaseModel):
     args: str
 
 
+class ContentSnapshot:
+    """References to the content items of a message and (recursively) to their field values.
+
+    Memoized computations over the content compare snapshots to detect changes made in place, e.g., an item being
+    replaced or its field being assigned. Snapshots are compared by identity and keep the referenced objects alive,
+    so that their ids cannot be reused.
+    """
+
+    __slots__ = ("_refs",)
+
+    def __init__(self, refs: list[object]) -> None:
+        self._refs = refs
+
+    @classmethod
+    def take(cls, content: Sequence[BaseModel]) -> "ContentSnapshot | None":
+        """Returns `None` if the content holds mutable values (e.g., a dictionary) whose changes cannot be detected."""
+        refs: list[object] = []
+        for item in content:
+            if not _collect_refs(item, refs):
+                return None
+        return cls(refs)
+
+    def matches(self, other: "ContentSnapshot | None") -> bool:
+        return (
+            other is not None
+            and len(self._refs) == len(other._refs)
+            and all(map(operator.is_, self._refs, other._refs))
+        )
+
+
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, bytes, type(None), datetime})
+
+
+def _collect_refs(model: BaseModel, refs: list[object]) -> bool:
+    refs.append(model)
+    for value in model.__dict__.values():
+        if type(value) in _IMMUTABLE_TYPES or isinstance(value, enum.Enum):
+            refs.append(value)
+        elif not isinstance(value, BaseModel) or not _collect_refs(value, refs):
+            return False
+    return True
+
+
 class MessageInput(BaseModel):
     role: Role | str
     text: str
@@ -86,6 +132,7 @@ class Message(ABC, Generic[T]):
     def __init__(self, content: list[T], meta: MessageMeta | None = None) -> None:
         self.content = content
         self.meta = meta or {}
+        self._digest: tuple[ContentSnapshot, bytes] | None = None
         if not self.meta.get("createdAt"):
             self.meta["createdAt"] = datetime.now(tz=UTC)
 
@@ -99,6 +146,32 @@ class Message(ABC, Generic[T]):
     def merge(self, other: "Message[T]") -> None:
         self.meta.update(other.meta)
         self.content.extend(other.content)
+        self._digest = None
+
+    def clone(self, content: list[T] | None = None) -> Self:
+        """Returns a shallow copy of the message, optionally with a different content."""
+        instance = copy.copy(self)
+        instance.content = list(self.content if content is None else content)
+        instance.meta = dict(self.meta)
+        instance._digest = None
+        return instance
+
+    def cache_digest(self) -> bytes:
+        """Returns a digest of the role and the content (meta is excluded), used for building cache keys.
+
+        The digest is memoized, so that growing conversations only hash new messages. The memo is dropped once the
+        content changes (including in place), messages holding mutable values are hashed every time.
+        """
+        snapshot = ContentSnapshot.take(self.content)
+        if snapshot is not None and self._digest is not None and snapshot.matches(self._digest[0]):
+            return self._digest[1]
+
+        buffer = bytearray()
+        encode_value(str(self.role), buffer)
+        encode_value(self.content, buffer)
+        digest = hash_bytes(buffer)
+        self._digest = (snapshot, digest) if snapshot is not None else None
+        return digest
 
     @property
     def text(self) -> str:
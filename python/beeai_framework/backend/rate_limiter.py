@@ -0,0 +1,257 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput, ChatModelUsage
+from beeai_framework.logger import Logger
+
+logger = Logger(__name__)
+
+
+class RateLimiterStats(BaseModel):
+    requests: int = 0
+    tokens: int = 0
+    """Tokens spent by the finished requests (the reported usage, or the estimate when the usage is missing)."""
+    throttled_requests: int = 0
+    """Requests which had to wait for the budget."""
+    wait_time: float = 0
+    """Total time (in seconds) the requests waited for the budget."""
+    rate_limit_errors: int = 0
+    """Rate limit errors (HTTP 429) returned by the provider."""
+
+
+class TokenBucket:
+    """Budget which refills continuously at `rate` units per second up to `capacity`.
+
+    A request may be admitted once the bucket holds at least as much as it needs (or is full), which means the level
+    can go negative for requests bigger than the bucket. Such a debt is paid off before the next request is admitted.
+    """
+
+    def __init__(self, *, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("The 'rate' and 'capacity' must be positive.")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._level = capacity
+        self._updated_at = clock()
+
+    @property
+    def level(self) -> float:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        return self._level
+
+    def delay(self, amount: float) -> float:
+        """Seconds until `amount` can be consumed."""
+        missing = min(amount, self.capacity) - self.level
+        return max(0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        self._level = self.level - amount
+
+    def refund(self, amount: float) -> None:
+        """Returns (or, with a negative amount, additionally charges) the budget of an already admitted request."""
+        self._level = min(self.capacity, self.level + amount)
+
+    def drain(self) -> None:
+        self._level = min(self.level, 0)
+
+
+class RateLimitPermit:
+    """Budget reserved for a single request, to be settled with the usage reported by the provider."""
+
+    def __init__(self, limiter: "RateLimiter", *, tokens: int, prompt_chars: int) -> None:
+        self.limiter = limiter
+        self.tokens = tokens
+        self.prompt_chars = prompt_chars
+        self.settled = False
+
+    def settle(self, usage: ChatModelUsage | None = None) -> None:
+        """Adjusts the budget and the estimates to the actual usage. Calling it more than once has no effect."""
+        if not self.settled:
+            self.settled = True
+            self.limiter._settle(self, usage)
+
+
+class RateLimiter:
+    """Client-side scheduler which keeps the requests of a chat model within the provider's rate limits.
+
+    Requests are admitted once both the requests-per-minute and tokens-per-minute budgets allow it. Because the token
+    usage is only known after the response, every request reserves an estimate (derived from its prompt and the
+    usage observed so far) which is corrected once the provider reports the actual usage.
+
+    Waiting requests are grouped by their run (concurrent agents have different groups) and the groups take turns,
+    so an agent issuing many requests does not starve the others. A rate limit error returned by the provider pauses
+    the admission for the time given by its `Retry-After` header (or until the budget refills).
+
+    `headroom` is the fraction of the limits to use and `burst` the fraction of the per-minute budget which can be
+    spent at once. Share an instance between models that share the provider's limits (e.g., the same API key).
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        headroom: float = 0.9,
+        burst: float = 0.1,
+        completion_tokens: int = 256,
+        chars_per_token: float = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if requests_per_minute is None and tokens_per_minute is None:
+            raise ValueError("At least one of 'requests_per_minute' and 'tokens_per_minute' must be set.")
+        if not 0 < headroom <= 1 or not 0 < burst <= 1:
+            raise ValueError("The 'headroom' and 'burst' must be within (0, 1].")
+
+        def create_bucket(limit: int | None) -> TokenBucket | None:
+            if limit is None:
+                return None
+            budget = limit * headroom
+            return TokenBucket(rate=budget / 60, capacity=max(1, budget * burst), clock=clock)
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = create_bucket(requests_per_minute)
+        self._tokens = create_bucket(tokens_per_minute)
+        self._clock = clock
+        self._chars_per_token = chars_per_token
+        self._completion_tokens = float(completion_tokens)
+        self._paused_until = 0.0
+        self._queues: OrderedDict[str | None, deque[asyncio.Future[None]]] = OrderedDict()
+        self._turn: asyncio.Future[None] | None = None
+        self._stats = RateLimiterStats()
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        self._stats = RateLimiterStats()
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting for the budget."""
+        return sum(len(queue) for queue in self._queues.values()) + (self._turn is not None)
+
+    def estimate(self, input: ChatModelInput | ChatModelStructureInput[Any]) -> tuple[int, int]:
+        """Returns the estimated tokens of the request together with the length of its prompt."""
+        chars = sum(len(message.text) for message in input.messages)
+        if isinstance(input, ChatModelInput):
+            chars += sum(len(tool.name) + len(tool.description) for tool in input.tools or [])
+        completion = self._completion_tokens
+        if input.max_tokens is not None:
+            completion = min(completion, input.max_tokens)
+        return math.ceil(chars / self._chars_per_token + completion), chars
+
+    async def acquire(
+        self, input: ChatModelInput | ChatModelStructureInput[Any], *, group: str | None = None
+    ) -> RateLimitPermit:
+        """Waits until the request fits in the budget and reserves it."""
+        tokens, chars = self.estimate(input)
+        return await self.acquire_tokens(tokens, group=group, prompt_chars=chars)
+
+    async def acquire_tokens(self, tokens: int, *, group: str | None = None, prompt_chars: int = 0) -> RateLimitPermit:
+        """Waits until a request of the given number of tokens fits in the budget and reserves it."""
+        turn = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(group, deque()).append(turn)
+        self._next_turn()
+
+        started_at = self._clock()
+        throttled = not turn.done()  # the turn was not granted at once
+        try:
+            await turn
+            delay = self._delay(tokens)
+            while delay > 0:
+                throttled = True
+                await asyncio.sleep(delay)
+                delay = self._delay(tokens)
+
+            if self._requests is not None:
+                self._requests.consume(1)
+            if self._tokens is not None:
+                self._tokens.consume(tokens)
+        finally:
+            if turn is self._turn:
+                self._turn = None
+            else:
+                self._remove(group, turn)
+            self._next_turn()
+
+        self._stats.requests += 1
+        if throttled:
+            self._stats.throttled_requests += 1
+            self._stats.wait_time += self._clock() - started_at
+        return RateLimitPermit(self, tokens=tokens, prompt_chars=prompt_chars)
+
+    def pause(self, seconds: float | None = None) -> None:
+        """Stops admitting requests (after a rate limit error) for the given time or until the budget refills."""
+        self._stats.rate_limit_errors += 1
+        if seconds is not None:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+        for bucket in (self._requests, self._tokens):
+            if bucket is not None:
+                bucket.drain()
+        logger.debug(f"Rate limit reached, pausing requests for {seconds if seconds is not None else 'a while'}.")
+
+    def _delay(self, tokens: int) -> float:
+        delays = [self._paused_until - self._clock()]
+        if self._requests is not None:
+            delays.append(self._requests.delay(1))
+        if self._tokens is not None:
+            delays.append(self._tokens.delay(tokens))
+        return max(delays)
+
+    def _next_turn(self) -> None:
+        """Gives the turn to the head of the next group (round-robin)."""
+        while self._turn is None and self._queues:
+            group, queue = self._queues.popitem(last=False)
+            turn = queue.popleft()
+            if queue:
+                self._queues[group] = queue
+            if not turn.done():
+                self._turn = turn
+                turn.set_result(None)
+
+    def _remove(self, group: str | None, turn: asyncio.Future[None]) -> None:
+        queue = self._queues.get(group)
+        if queue is not None and turn in queue:
+            queue.remove(turn)
+            if not queue:
+                del self._queues[group]
+
+    def _settle(self, permit: RateLimitPermit, usage: ChatModelUsage | None) -> None:
+        if usage is None or not usage.total_tokens:
+            self._stats.tokens += permit.tokens
+            return
+
+        self._stats.tokens += usage.total_tokens
+        if self._tokens is not None:
+            self._tokens.refund(permit.tokens - usage.total_tokens)
+
+        # exponential moving averages of the observed usage make the next estimates closer
+        if permit.prompt_chars and usage.prompt_tokens:
+            self._chars_per_token += 0.2 * (permit.prompt_chars / usage.prompt_tokens - self._chars_per_token)
+        self._completion_tokens += 0.2 * (usage.completion_tokens - self._completion_tokens)
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Iterator, Sequence
 from typing import Any, Generic, Literal, Self, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, InstanceOf
 
-from beeai_framework.backend.message import AnyMessage, AssistantMessage, MessageToolCallContent
+from beeai_framework.backend.message import AnyMessage, AssistantMessage, MessageTextContent, MessageToolCallContent
 from beeai_framework.cache.base import BaseCache
 from beeai_framework.cancellation import AbortSignal
+from beeai_framework.errors import FrameworkError
 from beeai_framework.tools.tool import AnyTool
 from beeai_framework.utils.lists import flatten
 
@@ -106,4 +108,87 @@ class ChatModelOutput(BaseModel):
         return "".join([x.text for x in list(filter(lambda x: isinstance(x, AssistantMessage), self.messages))])
 
 
+class ChatModelCompactOutput(ChatModelOutput):
+    """Compact form of a streamed output that is used for caching.
+
+    Instead of one output (and message) per chunk, it holds the merged text and tool calls together with the chunk
+    boundaries, which are used to re-chunk the output on replay.
+    """
+
+    chunk_offsets: list[int] | None = None
+    """End offset of the text of every chunk within the merged text (replayed as a single chunk when missing)."""
+    tool_call_chunks: list[int] = Field(default_factory=list)
+    """Index of the chunk every tool call came with."""
+
+    @classmethod
+    def compact(cls, chunks: Sequence[ChatModelOutput]) -> Self | None:
+        """Creates the compact form of the chunks or returns `None` if they contain other than assistant messages."""
+        texts: list[str] = []
+        tool_calls: list[MessageToolCallContent] = []
+        offsets: list[int] = []
+        tool_call_chunks: list[int] = []
+        length = 0
+        for index, chunk in enumerate(chunks):
+            for message in chunk.messages:
+                if not isinstance(message, AssistantMessage):
+                    return None
+
+                for content in message.content:
+                    if isinstance(content, MessageTextContent):
+                        texts.append(content.text)
+                        length += len(content.text)
+                    else:
+                        tool_calls.append(content)
+                        tool_call_chunks.append(index)
+            offsets.append(length)
+
+        merged = ChatModelOutput.from_chunks(list(chunks))
+        text = "".join(texts)
+        contents: list[MessageTextContent | MessageToolCallContent] = [MessageTextContent(text=text)] if text else []
+        return cls(
+            messages=[AssistantMessage([*contents, *tool_calls])] if contents or tool_calls else [],
+            usage=merged.usage,
+            finish_reason=merged.finish_reason,
+            chunk_offsets=offsets,
+            tool_call_chunks=tool_call_chunks,
+        )
+
+    def iter_chunks(self) -> Iterator[ChatModelOutput]:
+        """Re-chunks the output along the original chunk boundaries."""
+        if self.chunk_offsets is None:
+            yield ChatModelOutput(messages=self.messages[:], usage=self.usage, finish_reason=self.finish_reason)
+            return
+
+        text = self.get_text_content()
+        tool_calls = self.get_tool_calls()
+        last = len(self.chunk_offsets) - 1
+        start = tool_call_index = 0
+        for index, end in enumerate(self.chunk_offsets):
+            contents: list[MessageTextContent | MessageToolCallContent] = (
+                [MessageTextContent(text=text[start:end])] if end > start else []
+            )
+            while tool_call_index < len(tool_calls) and self.tool_call_chunks[tool_call_index] == index:
+                contents.append(tool_calls[tool_call_index].model_copy())
+                tool_call_index += 1
+
+            yield ChatModelOutput(
+                messages=[AssistantMessage(contents)] if contents else [],
+                usage=self.usage if index == last else None,
+                finish_reason=self.finish_reason if index == last else None,
+            )
+            start = end
+
+
+class ChatModelBatchResult(BaseModel):
+    """Result of a single input of `ChatModel.create_batch`, either the `output` or the `error` is set."""
+
+    index: int
+    """Position of the input in the batch."""
+    input: InstanceOf[ChatModelInput]
+    output: InstanceOf[ChatModelOutput] | None = None
+    error: InstanceOf[FrameworkError] | None = None
+    cached: bool = False
+    """Whether the output has been served from the cache."""
+
+
 ChatModelCache = BaseCache[list[ChatModelOutput]]
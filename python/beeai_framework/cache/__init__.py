@@ -14,8 +14,40 @@
 
 
 from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.errors import CacheError
+from beeai_framework.cache.file_cache import FileCache
 from beeai_framework.cache.null_cache import NullCache
-from beeai_framework.cache.sliding_cache import SlidingCache
+from beeai_framework.cache.prefix_cache import PrefixCache, PrefixCacheMatch, PrefixCacheStats
+from beeai_framework.cache.redis_cache import RedisCache
+from beeai_framework.cache.redis_server import RedisServer
+from beeai_framework.cache.semantic_cache import SemanticCache, SemanticCacheStats, ngram_embedding
+from beeai_framework.cache.single_flight import SingleFlight
+from beeai_framework.cache.sliding_cache import SlidingCache, SlidingCacheStats
+from beeai_framework.cache.tiered_cache import TieredCache, TieredCacheStats, TieredCacheWritePolicy
 from beeai_framework.cache.unconstrained_cache import UnconstrainedCache
+from beeai_framework.cache.vector_index import BruteForceIndex, HNSWIndex, VectorIndex
 
-__all__ = ["BaseCache", "NullCache", "SlidingCache", "UnconstrainedCache"]
+__all__ = [
+    "BaseCache",
+    "BruteForceIndex",
+    "CacheError",
+    "FileCache",
+    "HNSWIndex",
+    "NullCache",
+    "PrefixCache",
+    "PrefixCacheMatch",
+    "PrefixCacheStats",
+    "RedisCache",
+    "RedisServer",
+    "SemanticCache",
+    "SemanticCacheStats",
+    "SingleFlight",
+    "SlidingCache",
+    "SlidingCacheStats",
+    "TieredCache",
+    "TieredCacheStats",
+    "TieredCacheWritePolicy",
+    "UnconstrainedCache",
+    "VectorIndex",
+    "ngram_embedding",
+]
@@ -14,12 +14,13 @@
 
 
 from abc import ABC, abstractmethod
-from collections import OrderedDict
-from hashlib import sha512
+from hashlib import blake2b
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
+from beeai_framework.cache.keys import DIGEST_SIZE, encode_value, merge_arguments
+
 T = TypeVar("T")
 
 
@@ -59,13 +60,11 @@ class BaseCache(ABC, Generic[T]):
         pass
 
     @staticmethod
-    def generate_key(*args: dict[str, Any] | BaseModel) -> str:
-        cache_key_dict: dict[str, Any] = {}
-        for arg in args:
-            arg = arg or {}
-            arg_dict = arg if isinstance(arg, dict) else arg.model_dump(exclude_none=True)
-            cache_key_dict |= arg_dict
-
-        cache_key_dict = OrderedDict(sorted(cache_key_dict.items()))
-        cache_key_str = str(cache_key_dict).encode("utf-8", errors="ignore")
-        return str(int.from_bytes(sha512(cache_key_str).digest()))
+    def generate_key(*args: dict[str, Any] | BaseModel | None) -> str:
+        """Merges the arguments (later ones take precedence) and hashes their canonical binary encoding.
+
+        Fields of models which are `None` or empty are ignored. The result is a short hexadecimal string.
+        """
+        buffer = bytearray()
+        encode_value(merge_arguments(*args), buffer)
+        return blake2b(buffer, digest_size=DIGEST_SIZE).hexdigest()
@@ -0,0 +1,245 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.serialization import deserialize, serialize
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    expires_at REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS stats (id INTEGER PRIMARY KEY CHECK (id = 0), total_size INTEGER NOT NULL);
+INSERT OR IGNORE INTO stats (id, total_size) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE stats SET total_size = total_size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE stats SET total_size = total_size - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE stats SET total_size = total_size - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+class FileCache(BaseCache[T]):
+    """Persistent cache stored in a single SQLite database file.
+
+    Values (e.g., `list[ChatModelOutput]` or `ToolOutput`) are pickled and compressed. The key index is a B-tree
+    which SQLite reads through a memory map. The database runs in the WAL mode, so that multiple worker processes
+    on the same host can share one cache file safely.
+
+    When `max_size` (in bytes of stored values) is exceeded, the least recently accessed entries are evicted.
+    Entries expire after `ttl` seconds, if provided.
+
+    Only open cache files you trust, values are deserialized with `pickle`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        compress: bool = True,
+        mmap_size: int = 64 * 1024 * 1024,
+        timeout: float = 30,
+    ) -> None:
+        super().__init__()
+        if max_size is not None and max_size < 1:
+            raise ValueError("The 'max_size' must be greater than zero.")
+
+        self._path = Path(path)
+        self._max_size = max_size
+        self._ttl = ttl
+        self._compress = compress
+        self._mmap_size = mmap_size
+        self._timeout = timeout
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    async def size(self) -> int:
+        def size(connection: sqlite3.Connection) -> int:
+            row = connection.execute(
+                "SELECT COUNT(*) FROM entries WHERE expires_at IS NULL OR expires_at > ?", (time.time(),)
+            ).fetchone()
+            return int(row[0])
+
+        return await self._execute(size)
+
+    async def total_size(self) -> int:
+        """Returns the size (in bytes) of all stored values."""
+
+        def total_size(connection: sqlite3.Connection) -> int:
+            return int(connection.execute("SELECT total_size FROM stats WHERE id = 0").fetchone()[0])
+
+        return await self._execute(total_size)
+
+    async def set(self, key: str, value: T) -> None:
+        data = self._serialize(value)
+
+        def set(connection: sqlite3.Connection) -> None:
+            now = time.time()
+            with _Transaction(connection):
+                # an upsert (unlike INSERT OR REPLACE) fires the update trigger, which keeps the total size correct
+                connection.execute(
+                    "INSERT INTO entries (key, value, size, accessed_at, expires_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                    "accessed_at = excluded.accessed_at, expires_at = excluded.expires_at",
+                    (key, data, len(data), now, now + self._ttl if self._ttl else None),
+                )
+                self._evict(connection, now)
+
+        await self._execute(set)
+
+    async def get(self, key: str) -> T | None:
+        def get(connection: sqlite3.Connection) -> bytes | None:
+            now = time.time()
+            row = connection.execute(
+                "SELECT value, accessed_at FROM entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            data, accessed_at = row
+            # the access time only drives the eviction order, there is no need to write it on every read
+            if now - accessed_at > 1:
+                with _Transaction(connection):
+                    connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(data)
+
+        data = await self._execute(get)
+        return self._deserialize(data) if data is not None else None
+
+    async def has(self, key: str) -> bool:
+        def has(connection: sqlite3.Connection) -> bool:
+            row = connection.execute(
+                "SELECT 1 FROM entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)", (key, time.time())
+            ).fetchone()
+            return row is not None
+
+        return await self._execute(has)
+
+    async def delete(self, key: str) -> bool:
+        def delete(connection: sqlite3.Connection) -> bool:
+            with _Transaction(connection):
+                return connection.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+        return await self._execute(delete)
+
+    async def clear(self) -> None:
+        def clear(connection: sqlite3.Connection) -> None:
+            with _Transaction(connection):
+                connection.execute("DELETE FROM entries")
+
+        await self._execute(clear)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def _execute(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        def run() -> R:
+            with self._lock:
+                return fn(self._connect())
+
+        return await asyncio.to_thread(run)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(f"PRAGMA mmap_size = {int(self._mmap_size)}")
+            with _Transaction(connection):
+                for statement in _split_schema(_SCHEMA):
+                    connection.execute(statement)
+            self._connection = connection
+        return self._connection
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        if self._max_size is None:
+            return
+
+        excess = int(connection.execute("SELECT total_size FROM stats WHERE id = 0").fetchone()[0]) - self._max_size
+        if excess <= 0:
+            return
+
+        evicted: list[tuple[str]] = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def _serialize(self, value: T) -> bytes:
+        return serialize(value, compress=self._compress)
+
+    def _deserialize(self, data: bytes) -> T:
+        value: T = deserialize(data)
+        return value
+
+
+class _Transaction:
+    """Write transaction which takes the database lock upfront, so that concurrent writers wait instead of failing."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> None:
+        self._connection.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        self._connection.execute("COMMIT" if exc_type is None else "ROLLBACK")
+
+
+def _split_schema(schema: str) -> list[str]:
+    statements: list[str] = []
+    current = ""
+    for line in schema.strip().splitlines():
+        current += line + "\n"
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ""
+    return statements
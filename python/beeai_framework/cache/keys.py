@@ -0,0 +1,190 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import datetime
+import enum
+from collections.abc import Callable, Sequence
+from hashlib import blake2b
+from typing import Any
+
+from pydantic import BaseModel
+
+DIGEST_SIZE = 16
+
+
+def hash_bytes(data: bytes | bytearray) -> bytes:
+    return blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def hash_value(value: Any) -> bytes:
+    """Computes a stable digest of the canonical binary encoding of the value."""
+    buffer = bytearray()
+    encode_value(value, buffer)
+    return hash_bytes(buffer)
+
+
+def merge_arguments(*args: dict[str, Any] | BaseModel | None) -> dict[str, Any]:
+    """Merges dictionaries and models, later arguments take precedence.
+
+    Fields of models which are `None` or empty collections (e.g., `tools=[]`) are ignored.
+    """
+    merged: dict[str, Any] = {}
+    for arg in args:
+        if isinstance(arg, BaseModel):
+            for name in type(arg).model_fields:
+                value = getattr(arg, name)
+                if value is not None and not (isinstance(value, list | dict | tuple | set) and not value):
+                    merged[name] = value
+        elif arg:
+            merged |= arg
+    return merged
+
+
+def generate_prefix_keys(*args: dict[str, Any] | BaseModel | None, field: str = "messages") -> list[str]:
+    """Generates a key for every prefix of the sequence stored under `field` of the merged arguments.
+
+    Keys are built as a rolling hash, the remaining arguments form the seed and every item extends the hash of the
+    previous prefix. The last key covers the whole sequence.
+    """
+    merged = merge_arguments(*args)
+    items: Sequence[Any] = merged.pop(field, None) or []
+
+    buffer = bytearray()
+    encode_value(merged, buffer)
+    digest = hash_bytes(buffer)
+
+    keys: list[str] = []
+    for item in items:
+        cache_digest = getattr(type(item), "cache_digest", None)
+        digest = hash_bytes(digest + (cache_digest(item) if cache_digest is not None else hash_value(item)))
+        keys.append(digest.hex())
+    return keys
+
+
+def encode_value(value: Any, buffer: bytearray) -> None:
+    """Appends a canonical (type-tagged and length-prefixed) binary encoding of the value to the buffer.
+
+    Dictionaries are encoded with sorted keys and pydantic models field by field (fields set to `None` are omitted),
+    so equal inputs always produce equal bytes regardless of insertion order or process. Objects providing
+    a `cache_digest()` method (e.g., messages, tools) are encoded by their (typically memoized) digest.
+    """
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        encoder(value, buffer)
+        return
+
+    cache_digest = getattr(type(value), "cache_digest", None)
+    if cache_digest is not None:
+        buffer += b"h"
+        buffer += cache_digest(value)
+    elif isinstance(value, BaseModel):
+        _encode_model(value, buffer)
+    elif isinstance(value, enum.Enum):
+        encode_value(value.value, buffer)
+    elif isinstance(value, dict):
+        _encode_dict(value, buffer)
+    elif isinstance(value, list | tuple):
+        _encode_list(value, buffer)
+    elif isinstance(value, set | frozenset):
+        _encode_set(value, buffer)
+    elif isinstance(value, str):
+        _encode_str(value, buffer)
+    elif isinstance(value, int | float):
+        _encode_number(value, buffer)
+    elif isinstance(value, type):
+        _encode_str(f"{value.__module__}.{value.__qualname__}", buffer, tag=b"c")
+    elif isinstance(value, datetime.datetime | datetime.date):
+        _encode_str(value.isoformat(), buffer, tag=b"t")
+    else:
+        _encode_str(str(value), buffer, tag=b"o")
+
+
+def _encode_str(value: str, buffer: bytearray, tag: bytes = b"s") -> None:
+    data = value.encode("utf-8", errors="surrogatepass")
+    buffer += tag
+    buffer += str(len(data)).encode()
+    buffer += b":"
+    buffer += data
+
+
+def _encode_bytes(value: bytes, buffer: bytearray) -> None:
+    buffer += b"b"
+    buffer += str(len(value)).encode()
+    buffer += b":"
+    buffer += value
+
+
+def _encode_number(value: int | float, buffer: bytearray) -> None:
+    buffer += b"i" if isinstance(value, int) else b"f"
+    buffer += repr(value).encode()
+    buffer += b";"
+
+
+def _encode_bool(value: bool, buffer: bytearray) -> None:
+    buffer += b"T" if value else b"F"
+
+
+def _encode_none(value: None, buffer: bytearray) -> None:
+    buffer += b"N"
+
+
+def _encode_list(value: list[Any] | tuple[Any, ...], buffer: bytearray) -> None:
+    buffer += b"l"
+    for item in value:
+        encode_value(item, buffer)
+    buffer += b"e"
+
+
+def _encode_set(value: set[Any] | frozenset[Any], buffer: bytearray) -> None:
+    items: list[bytes] = []
+    for item in value:
+        item_buffer = bytearray()
+        encode_value(item, item_buffer)
+        items.append(bytes(item_buffer))
+
+    buffer += b"u"
+    for item in sorted(items):
+        buffer += item
+    buffer += b"e"
+
+
+def _encode_dict(value: dict[Any, Any], buffer: bytearray) -> None:
+    buffer += b"d"
+    for key, item in sorted(value.items(), key=lambda pair: str(pair[0])):
+        encode_value(key, buffer)
+        encode_value(item, buffer)
+    buffer += b"e"
+
+
+def _encode_model(value: BaseModel, buffer: bytearray) -> None:
+    cls = type(value)
+    _encode_str(cls.__qualname__, buffer, tag=b"m")
+    fields = {name: getattr(value, name) for name in cls.model_fields}
+    if value.model_extra:
+        fields.update(value.model_extra)
+    _encode_dict({name: field for name, field in fields.items() if field is not None}, buffer)
+
+
+_ENCODERS: dict[type, Callable[[Any, bytearray], None]] = {
+    str: _encode_str,
+    bytes: _encode_bytes,
+    int: _encode_number,
+    float: _encode_number,
+    bool: _encode_bool,
+    type(None): _encode_none,
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_dict,
+}
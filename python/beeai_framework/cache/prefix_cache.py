@@ -0,0 +1,112 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.keys import generate_prefix_keys
+from beeai_framework.cache.unconstrained_cache import UnconstrainedCache
+
+T = TypeVar("T")
+
+
+class PrefixCacheStats(BaseModel):
+    hits: int = 0
+    partial_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.partial_hits + self.misses
+
+
+class PrefixCacheMatch(BaseModel, Generic[T]):
+    key: str
+    length: int
+    """Number of leading messages covered by the cached entry."""
+    value: T
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class PrefixCache(BaseCache[T]):
+    """Cache layer for conversations whose keys are rolling hashes of the message prefix.
+
+    Entries are stored in the wrapped cache under the same keys the `ChatModel` uses, so the layer can be passed
+    to `ChatModel.config(cache=...)` directly. On top of exact lookups, it finds the longest cached prefix of a
+    conversation, e.g., to reuse the result of a previously seen part of a conversation.
+    """
+
+    def __init__(self, cache: BaseCache[T] | None = None) -> None:
+        super().__init__()
+        self._cache: BaseCache[T] = cache or UnconstrainedCache()
+        self._stats = PrefixCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    @property
+    def stats(self) -> PrefixCacheStats:
+        return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        self._stats = PrefixCacheStats()
+
+    @staticmethod
+    def generate_prefix_keys(*args: dict[str, Any] | BaseModel | None) -> list[str]:
+        """Generates keys of all message prefixes of the input (e.g., `ChatModelInput`), the shortest first."""
+        return generate_prefix_keys(*args, {"abort_signal": None})
+
+    async def longest_prefix(self, *args: dict[str, Any] | BaseModel | None) -> PrefixCacheMatch[T] | None:
+        """Finds the entry covering the longest prefix of the messages of the input (e.g., `ChatModelInput`)."""
+        keys = self.generate_prefix_keys(*args)
+        for length in range(len(keys), 0, -1):
+            key = keys[length - 1]
+            value = await self._cache.get(key)
+            if value is not None:
+                if length == len(keys):
+                    self._stats.hits += 1
+                else:
+                    self._stats.partial_hits += 1
+                return PrefixCacheMatch[T](key=key, length=length, value=value)
+
+        self._stats.misses += 1
+        return None
+
+    async def size(self) -> int:
+        return await self._cache.size()
+
+    async def set(self, key: str, value: T) -> None:
+        await self._cache.set(key, value)
+
+    async def get(self, key: str) -> T | None:
+        value = await self._cache.get(key)
+        if value is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        return value
+
+    async def has(self, key: str) -> bool:
+        return await self._cache.has(key)
+
+    async def delete(self, key: str) -> bool:
+        return await self._cache.delete(key)
+
+    async def clear(self) -> None:
+        await self._cache.clear()
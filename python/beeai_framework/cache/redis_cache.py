@@ -0,0 +1,246 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import contextlib
+import re
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any, TypeVar
+from urllib.parse import unquote, urlparse
+
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.errors import CacheError
+from beeai_framework.cache.resp import CommandArg, Reply, RespError, encode_command, read_reply
+from beeai_framework.cache.serialization import deserialize, serialize
+
+T = TypeVar("T")
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, commands: Sequence[Sequence[CommandArg]]) -> list[Reply]:
+        """Sends all commands at once and reads their replies afterward (pipelining)."""
+        self.writer.write(b"".join(encode_command(*command) for command in commands))
+        await self.writer.drain()
+        return [await read_reply(self.reader) for _ in commands]
+
+    def close(self) -> None:
+        with contextlib.suppress(RuntimeError):  # the event loop of the connection may be closed already
+            self.writer.close()
+
+
+class _ConnectionPool:
+    def __init__(self, url: str, *, max_connections: int, timeout: float) -> None:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise ValueError(f"Unsupported URL scheme '{parsed.scheme}', use 'redis://' or 'rediss://'.")
+        if max_connections < 1:
+            raise ValueError("The 'max_connections' must be greater than zero.")
+
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._ssl = parsed.scheme == "rediss"
+        self._username = unquote(parsed.username) if parsed.username else None
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.strip("/") or 0)
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._idle: list[_Connection] = []
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def execute(self, *commands: Sequence[CommandArg]) -> list[Reply]:
+        async with self._connection() as connection, asyncio.timeout(self._timeout):
+            replies = await connection.execute(commands)
+
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise CacheError(f"Redis command failed: {reply}", is_retryable=False, cause=reply)
+        return replies
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+            with contextlib.suppress(Exception):
+                await connection.writer.wait_closed()
+
+    @contextlib.asynccontextmanager
+    async def _connection(self) -> AsyncIterator[_Connection]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # connections (and the semaphore) are bound to the event loop they were created in
+            for connection in self._idle:
+                connection.close()
+            self._idle.clear()
+            self._semaphore = asyncio.Semaphore(self._max_connections)
+            self._loop = loop
+
+        assert self._semaphore is not None
+        async with self._semaphore:
+            try:
+                async with asyncio.timeout(self._timeout):
+                    connection = self._idle.pop() if self._idle else await self._connect()
+            except (OSError, EOFError, TimeoutError) as e:
+                raise self._unavailable(e)
+
+            try:
+                yield connection
+            except BaseException as e:
+                # the connection may have unread replies, so it cannot be reused
+                connection.close()
+                if isinstance(e, OSError | EOFError | TimeoutError):
+                    raise self._unavailable(e)
+                raise
+            else:
+                self._idle.append(connection)
+
+    def _unavailable(self, error: Exception) -> CacheError:
+        return CacheError(f"Redis server at {self._host}:{self._port} is unavailable.", cause=error)
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(self._host, self._port, ssl=self._ssl or None)
+        connection = _Connection(reader, writer)
+        commands: list[list[CommandArg]] = []
+        if self._password is not None:
+            commands.append(["AUTH", self._username, self._password] if self._username else ["AUTH", self._password])
+        if self._db:
+            commands.append(["SELECT", self._db])
+
+        replies = await connection.execute(commands) if commands else []
+        error = next((reply for reply in replies if isinstance(reply, RespError)), None)
+        if error is not None:
+            connection.close()
+            raise CacheError(f"Redis connection setup failed: {error}", is_retryable=False, cause=error)
+        return connection
+
+
+class RedisCache(BaseCache[T]):
+    """Cache stored in a server speaking the Redis protocol (Redis, Valkey, KeyDB, ...), shared by all its clients.
+
+    Values are pickled and compressed when larger than `compression_threshold` bytes. Keys are prefixed with the
+    `namespace`, so that multiple caches can share one database. Commands are sent over a pool of at most
+    `max_connections` connections, multi-key operations are pipelined.
+
+    Only connect to servers you trust, values are deserialized with `pickle`.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        *,
+        namespace: str = "beeai",
+        ttl: float | None = None,
+        compress: bool = True,
+        compression_threshold: int = 256,
+        max_connections: int = 10,
+        timeout: float = 5,
+    ) -> None:
+        super().__init__()
+        self._pool = _ConnectionPool(url, max_connections=max_connections, timeout=timeout)
+        self._namespace = namespace
+        self._ttl = ttl
+        self._compress = compress
+        self._compression_threshold = compression_threshold
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    async def size(self) -> int:
+        """Returns the number of entries in the namespace. Keys are scanned, so the call is linear in their number."""
+        count = 0
+        async for keys in self._scan():
+            count += len(keys)
+        return count
+
+    async def set(self, key: str, value: T, *, ttl: float | None = None) -> None:
+        """Stores the value, optionally with its own time to live (in seconds) instead of the cache's one."""
+        await self._pool.execute(self._set_command(key, value, ttl))
+
+    async def set_many(self, items: Mapping[str, T], *, ttl: float | None = None) -> None:
+        """Stores all the values within a single round trip."""
+        if items:
+            await self._pool.execute(*(self._set_command(key, value, ttl) for key, value in items.items()))
+
+    async def get(self, key: str) -> T | None:
+        [data] = await self._pool.execute(["GET", self._key(key)])
+        return self._deserialize(data)
+
+    async def get_many(self, keys: Sequence[str]) -> list[T | None]:
+        """Retrieves the values of all the keys within a single round trip."""
+        if not keys:
+            return []
+
+        [values] = await self._pool.execute(["MGET", *(self._key(key) for key in keys)])
+        assert isinstance(values, list)
+        return [self._deserialize(data) for data in values]
+
+    async def has(self, key: str) -> bool:
+        [count] = await self._pool.execute(["EXISTS", self._key(key)])
+        return count == 1
+
+    async def delete(self, key: str) -> bool:
+        return await self.delete_many([key]) > 0
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        """Deletes all the keys within a single round trip and returns the number of deleted entries."""
+        if not keys:
+            return 0
+
+        [count] = await self._pool.execute(["DEL", *(self._key(key) for key in keys)])
+        assert isinstance(count, int)
+        return count
+
+    async def clear(self) -> None:
+        """Deletes all the entries in the namespace."""
+        async for keys in self._scan():
+            if keys:
+                await self._pool.execute(["UNLINK", *keys])
+
+    async def close(self) -> None:
+        """Closes the idle connections."""
+        await self._pool.close()
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+
+    def _set_command(self, key: str, value: T, ttl: float | None) -> list[CommandArg]:
+        data = serialize(value, compress=self._compress, compression_threshold=self._compression_threshold)
+        command: list[CommandArg] = ["SET", self._key(key), data]
+        ttl = ttl if ttl is not None else self._ttl
+        if ttl:
+            command += ["PX", max(1, round(ttl * 1000))]
+        return command
+
+    def _deserialize(self, data: Any) -> T | None:
+        if data is None:
+            return None
+        value: T = deserialize(data)
+        return value
+
+    async def _scan(self) -> AsyncIterator[list[bytes]]:
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self._namespace) + ":*"
+        cursor: bytes = b"0"
+        while True:
+            [reply] = await self._pool.execute(["SCAN", cursor, "MATCH", pattern, "COUNT", 1000])
+            assert isinstance(reply, list) and isinstance(reply[0], bytes) and isinstance(reply[1], list)
+            cursor, keys = reply[0], reply[1]
+            yield keys  # type: ignore[misc]
+            if cursor == b"0":
+                break
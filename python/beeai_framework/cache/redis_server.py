@@ -0,0 +1,213 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import contextlib
+import re
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
+from beeai_framework.cache.resp import Reply, RespError, encode_reply, read_command
+
+
+class RedisServer:
+    """In-process server speaking the Redis protocol, e.g., for testing `RedisCache` without a real Redis instance.
+
+    It implements the basic string commands (`GET`, `SET`, `MGET`, `DEL`, `EXISTS`, `SCAN`, ...) on top of
+    dictionaries and listens on a local TCP port.
+    """
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 0, password: str | None = None) -> None:
+        self._host = host
+        self._port = port
+        self._password = password
+        self._server: asyncio.Server | None = None
+        self._databases: dict[int, dict[bytes, tuple[bytes, float | None]]] = {}
+        self._connections: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+        self.commands_count = 0
+        """Number of commands received so far."""
+        self.connections_count = 0
+        """Number of connections accepted so far."""
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("The server has not been started.")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        credentials = f":{self._password}@" if self._password else ""
+        return f"redis://{credentials}{host}:{port}/0"
+
+    async def start(self) -> None:
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle, self._host, self._port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()
+            # handlers finish once they read the end of their (closed) connections
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections_count += 1
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections[task] = writer
+        session = _Session(authenticated=self._password is None)
+        try:
+            while (command := await read_command(reader)) is not None:
+                self.commands_count += 1
+                writer.write(encode_reply(self._execute(session, command)))
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _execute(self, session: "_Session", command: list[bytes]) -> Reply:
+        name, args = command[0].decode().upper(), command[1:]
+        if name == "AUTH":
+            if self._password is None:
+                return RespError("ERR AUTH <password> called without any password configured for the default user.")
+            if args[-1].decode() != self._password:
+                return RespError("WRONGPASS invalid username-password pair or user is disabled.")
+            session.authenticated = True
+            return "OK"
+        if not session.authenticated:
+            return RespError("NOAUTH Authentication required.")
+
+        handler: Callable[[_Session, list[bytes]], Reply] | None = getattr(self, f"_command_{name.lower()}", None)
+        if handler is None:
+            return RespError(f"ERR unknown command '{name}'")
+        try:
+            return handler(session, args)
+        except (IndexError, ValueError):
+            return RespError(f"ERR syntax error in '{name}'")
+
+    def _items(self, session: "_Session") -> dict[bytes, tuple[bytes, float | None]]:
+        return self._databases.setdefault(session.db, {})
+
+    def _lookup(self, session: "_Session", key: bytes) -> bytes | None:
+        items = self._items(session)
+        item = items.get(key)
+        if item is None:
+            return None
+
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del items[key]
+            return None
+        return value
+
+    def _command_ping(self, session: "_Session", args: list[bytes]) -> Reply:
+        return args[0] if args else "PONG"
+
+    def _command_select(self, session: "_Session", args: list[bytes]) -> Reply:
+        session.db = int(args[0])
+        return "OK"
+
+    def _command_get(self, session: "_Session", args: list[bytes]) -> Reply:
+        return self._lookup(session, args[0])
+
+    def _command_mget(self, session: "_Session", args: list[bytes]) -> Reply:
+        return [self._lookup(session, key) for key in args]
+
+    def _command_set(self, session: "_Session", args: list[bytes]) -> Reply:
+        key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+        expires_at: float | None = None
+        if b"EX" in options:
+            expires_at = time.monotonic() + float(options[options.index(b"EX") + 1])
+        elif b"PX" in options:
+            expires_at = time.monotonic() + float(options[options.index(b"PX") + 1]) / 1000
+
+        exists = self._lookup(session, key) is not None
+        if (b"NX" in options and exists) or (b"XX" in options and not exists):
+            return None
+
+        self._items(session)[key] = (value, expires_at)
+        return "OK"
+
+    def _command_exists(self, session: "_Session", args: list[bytes]) -> Reply:
+        return sum(self._lookup(session, key) is not None for key in args)
+
+    def _command_del(self, session: "_Session", args: list[bytes]) -> Reply:
+        items = self._items(session)
+        return sum(self._lookup(session, key) is not None and items.pop(key) is not None for key in args)
+
+    _command_unlink = _command_del
+
+    def _command_scan(self, session: "_Session", args: list[bytes]) -> Reply:
+        # the whole keyspace is returned at once, which the protocol allows (COUNT is only a hint)
+        options = [arg.upper() for arg in args]
+        pattern = _compile_glob(args[options.index(b"MATCH") + 1] if b"MATCH" in options else b"*")
+        keys = [
+            key for key in list(self._items(session)) if self._lookup(session, key) is not None and pattern.match(key)
+        ]
+        return [b"0", list(keys)]
+
+    def _command_dbsize(self, session: "_Session", args: list[bytes]) -> Reply:
+        return sum(self._lookup(session, key) is not None for key in list(self._items(session)))
+
+    def _command_flushdb(self, session: "_Session", args: list[bytes]) -> Reply:
+        self._items(session).clear()
+        return "OK"
+
+
+class _Session:
+    def __init__(self, *, authenticated: bool) -> None:
+        self.authenticated = authenticated
+        self.db = 0
+
+
+def _compile_glob(pattern: bytes) -> re.Pattern[bytes]:
+    """Translates the glob-style pattern of Redis (with backslash escapes) to a regular expression."""
+    regex = bytearray()
+    index = 0
+    while index < len(pattern):
+        char = pattern[index : index + 1]
+        if char == b"\\" and index + 1 < len(pattern):
+            index += 1
+            regex += re.escape(pattern[index : index + 1])
+        elif char == b"*":
+            regex += b".*"
+        elif char == b"?":
+            regex += b"."
+        elif char == b"[" and (end := pattern.find(b"]", index + 1)) > index:
+            regex += b"[" + pattern[index + 1 : end].replace(b"\\", b"\\\\") + b"]"
+            index = end
+        else:
+            regex += re.escape(char)
+        index += 1
+    return re.compile(bytes(regex) + b"\\Z", re.DOTALL)
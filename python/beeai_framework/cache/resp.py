@@ -0,0 +1,83 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Minimal implementation of the Redis serialization protocol (RESP2) shared by `RedisCache` and `RedisServer`."""
+
+import asyncio
+from typing import TypeAlias
+
+Reply: TypeAlias = "bytes | str | int | RespError | list[Reply] | None"
+CommandArg: TypeAlias = bytes | str | int | float
+
+_CRLF = b"\r\n"
+
+
+class RespError(Exception):
+    """Error reply of the server (e.g., `ERR unknown command`)."""
+
+
+def encode_command(*args: CommandArg) -> bytes:
+    """Encodes the command as an array of bulk strings."""
+    buffer = bytearray(b"*%d\r\n" % len(args))
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        buffer += b"$%d\r\n" % len(data)
+        buffer += data
+        buffer += _CRLF
+    return bytes(buffer)
+
+
+def encode_reply(reply: Reply) -> bytes:
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, RespError):
+        return b"-" + str(reply).encode() + _CRLF
+    if isinstance(reply, str):
+        return b"+" + reply.encode() + _CRLF
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n" % len(reply) + reply + _CRLF
+    return b"*%d\r\n" % len(reply) + b"".join(encode_reply(item) for item in reply)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Reply:
+    """Reads one reply. Error replies are returned (not raised), so that the rest of a pipeline can be read."""
+    line = await reader.readuntil(_CRLF)
+    kind, value = line[:1], line[1:-2]
+    if kind == b"+":
+        return value.decode()
+    if kind == b"-":
+        return RespError(value.decode())
+    if kind == b":":
+        return int(value)
+    if kind == b"$":
+        length = int(value)
+        return None if length < 0 else (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(value)
+        return None if length < 0 else [await read_reply(reader) for _ in range(length)]
+    raise ValueError(f"Unsupported RESP reply type: {line!r}")
+
+
+async def read_command(reader: asyncio.StreamReader) -> list[bytes] | None:
+    """Reads one command sent by a client, returns `None` once the connection gets closed."""
+    try:
+        command = await read_reply(reader)
+    except asyncio.IncompleteReadError:
+        return None
+
+    if not isinstance(command, list) or not all(isinstance(arg, bytes) for arg in command):
+        raise ValueError("Commands must be sent as arrays of bulk strings.")
+    return command  # type: ignore[return-value]
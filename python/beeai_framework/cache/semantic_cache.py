@@ -0,0 +1,214 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import re
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel
+
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.unconstrained_cache import UnconstrainedCache
+from beeai_framework.cache.vector_index import BruteForceIndex, VectorIndex, normalize_vector
+from beeai_framework.utils.asynchronous import ensure_async
+
+if TYPE_CHECKING:
+    from beeai_framework.backend.message import AnyMessage
+
+T = TypeVar("T")
+
+EmbeddingFn = Callable[[str], Sequence[float] | Awaitable[Sequence[float]]]
+
+TIMESTAMP_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?",
+)
+"""Matches ISO 8601 timestamps, e.g., the creation time the ReAct agent adds to user prompts."""
+
+
+def ngram_embedding(text: str, *, dimensions: int = 256, n: int = 3) -> list[float]:
+    """Embeds the text as hashed counts of its character n-grams.
+
+    It needs no model and catches prompts differing in whitespace, casing or a few characters only. It does not
+    capture meaning: prompts differing in a single word ("yes" / "no") or number are close, the closer the longer the
+    text they share (e.g., a system prompt). Use a proper embedding model to match prompts with the same meaning but
+    different wording.
+    """
+    vector = [0.0] * dimensions
+    text = f" {text.lower()} "
+    for index in range(max(len(text) - n + 1, 1)):
+        vector[zlib.crc32(text[index : index + n].encode()) % dimensions] += 1
+    return vector
+
+
+class SemanticCacheStats(BaseModel):
+    exact_matches: int = 0
+    semantic_matches: int = 0
+    """Lookups resolved to the key of a similar conversation."""
+    misses: int = 0
+
+
+class SemanticCache(BaseCache[T]):
+    """Cache layer for `ChatModel` that also matches conversations which are similar, not just identical.
+
+    Messages are normalized (whitespace is collapsed and the `exclude` patterns, e.g., timestamps, are removed),
+    embedded with the `embedding` function and stored in an in-process vector index (one per combination of the
+    other parameters, such as tools or temperature, which still need to match exactly). When a conversation is
+    missing in the wrapped cache, the key of the most similar indexed conversation is used if their similarity is at
+    least `threshold`. A conversation is indexed once its output is stored, so that only cached outputs are matched.
+
+    Conversations containing tool calls or tool results are looked up by their exact key only. Their meaning often
+    lies in a few characters of a tool argument or result (e.g., a temperature), which the similarity cannot tell.
+
+    A wrong match returns the answer to a different question. With the default `ngram_embedding`, conversations
+    sharing a long prefix (e.g., a system prompt) and differing in a word or a number reach a similarity of 0.95 and
+    more, keep the `threshold` at 0.99 or higher (or use a proper embedding model) and do not use the cache where
+    such a mix-up is harmful.
+
+    At most `capacity` conversations are indexed, the oldest are dropped first.
+    """
+
+    def __init__(
+        self,
+        embedding: EmbeddingFn = ngram_embedding,
+        *,
+        cache: BaseCache[T] | None = None,
+        threshold: float = 0.99,
+        index: Callable[[], VectorIndex] = BruteForceIndex,
+        exclude: Sequence[str | re.Pattern[str]] = (TIMESTAMP_PATTERN,),
+        capacity: int = 10_000,
+    ) -> None:
+        super().__init__()
+        if not -1 <= threshold <= 1:
+            raise ValueError("The 'threshold' must be between -1 and 1.")
+
+        self._cache: BaseCache[T] = cache or UnconstrainedCache()
+        self._embedding = ensure_async(embedding)
+        self._threshold = threshold
+        self._index_factory = index
+        self._exclude = [re.compile(pattern) if isinstance(pattern, str) else pattern for pattern in exclude]
+        self._capacity = capacity
+        self._indexes: dict[str, VectorIndex] = {}
+        self._indexed: OrderedDict[str, str] = OrderedDict()  # key -> partition
+        self._pending: OrderedDict[str, tuple[str, list[float]]] = OrderedDict()  # key -> (partition, vector)
+        self._stats = SemanticCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    @property
+    def stats(self) -> SemanticCacheStats:
+        return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        self._stats = SemanticCacheStats()
+
+    def normalize(self, text: str) -> str:
+        for pattern in self._exclude:
+            text = pattern.sub("", text)
+        return " ".join(text.split())
+
+    async def resolve_key(self, input: BaseModel, key: str) -> str:
+        """Returns the key under which the output for the input (e.g., `ChatModelInput`) is (or will be) cached.
+
+        That is the exact `key` if it is cached already or if no similar conversation is indexed; then the
+        conversation gets indexed under the `key` once its output is stored.
+        """
+        if await self._cache.has(key):
+            self._stats.exact_matches += 1
+            return key
+
+        messages: list[AnyMessage] = getattr(input, "messages", [])
+        if any(_is_tool_content(content) for message in messages for content in message.content):
+            self._stats.misses += 1
+            return key
+
+        partition = self.generate_key(input, {"messages": None, "abort_signal": None})
+        vector = normalize_vector(await self._embedding(self._render(messages)))
+
+        while (index := self._indexes.get(partition)) is not None:
+            matches = index.search(vector, 1)
+            if not matches or matches[0][1] < self._threshold or matches[0][0] == key:
+                break
+
+            match = matches[0][0]
+            if await self._cache.has(match):
+                self._stats.semantic_matches += 1
+                return match
+            self._remove(match)  # evicted (or expired) in the wrapped cache
+
+        self._stats.misses += 1
+        self._pending[key] = (partition, vector)
+        self._pending.move_to_end(key)
+        while len(self._pending) > self._capacity:
+            self._pending.popitem(last=False)
+        return key
+
+    async def size(self) -> int:
+        return await self._cache.size()
+
+    async def set(self, key: str, value: T) -> None:
+        await self._cache.set(key, value)
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            self._add(key, *pending)
+
+    async def get(self, key: str) -> T | None:
+        return await self._cache.get(key)
+
+    async def has(self, key: str) -> bool:
+        return await self._cache.has(key)
+
+    async def delete(self, key: str) -> bool:
+        self._pending.pop(key, None)
+        self._remove(key)
+        return await self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._indexes.clear()
+        self._indexed.clear()
+        self._pending.clear()
+        await self._cache.clear()
+
+    def _render(self, messages: Sequence[Any]) -> str:
+        return "\n".join(f"{message.role}: {self.normalize(message.text)}" for message in messages)
+
+    def _add(self, key: str, partition: str, vector: list[float]) -> None:
+        self._remove(key)  # re-indexed after its output was evicted
+        index = self._indexes.get(partition)
+        if index is None:
+            index = self._indexes[partition] = self._index_factory()
+
+        index.add(key, vector)
+        self._indexed[key] = partition
+        self._indexed.move_to_end(key)
+        while len(self._indexed) > self._capacity:
+            self._remove(next(iter(self._indexed)))
+
+    def _remove(self, key: str) -> None:
+        partition = self._indexed.pop(key, None)
+        if partition is None:
+            return
+
+        index = self._indexes[partition]
+        index.remove(key)
+        if not len(index):
+            del self._indexes[partition]
+
+
+def _is_tool_content(content: Any) -> bool:
+    return getattr(content, "type", None) in {"tool-call", "tool-result"}
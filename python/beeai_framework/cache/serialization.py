@@ -0,0 +1,41 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pickle
+import zlib
+from typing import Any
+
+_RAW = b"\x00"
+_COMPRESSED = b"\x01"
+
+
+def serialize(value: Any, *, compress: bool = True, compression_threshold: int = 0) -> bytes:
+    """Pickles the value and compresses it with zlib if it is at least `compression_threshold` bytes long.
+
+    The first byte of the result tells whether the payload is compressed, the compressed payload is kept only if it
+    is actually smaller.
+    """
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if compress and len(data) >= compression_threshold:
+        compressed = zlib.compress(data)
+        if len(compressed) < len(data):
+            return _COMPRESSED + compressed
+    return _RAW + data
+
+
+def deserialize(data: bytes) -> Any:
+    """Restores a value created by `serialize`. Only deserialize data you trust, values are unpickled."""
+    payload = memoryview(data)[1:]
+    return pickle.loads(zlib.decompress(payload) if data[:1] == _COMPRESSED else payload)
@@ -0,0 +1,156 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self.task: asyncio.Task[None] | None = None
+        self.waiters = 0
+        self.abandoned = False
+
+
+class _StreamCall(Generic[T]):
+    def __init__(self) -> None:
+        self.chunks: list[T] = []
+        self.changed = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+        self.waiters = 0
+        self.done = False
+        self.error: BaseException | None = None
+        self.abandoned = False
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls sharing the same key so that only one of them does the actual work.
+
+    The first caller starts the work in a separate task and every caller that arrives with the same key while the
+    work is in progress awaits the same result (or error). The work is cancelled once all callers have left.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call[T]] = {}
+        self._streams: dict[str, _StreamCall[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls) + len(self._streams)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._calls or key in self._streams
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Returns the result of `fn`, sharing it with concurrent callers of the same key.
+
+        When the caller which started the work leaves (e.g., gets aborted) and the work fails afterward,
+        the error is not shared; the remaining callers start over instead.
+        """
+        while True:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                call.task = asyncio.create_task(self._execute(key, call, fn))
+
+            call.waiters += 1
+            try:
+                return await asyncio.shield(call.future)
+            except BaseException as e:
+                if leader or not call.abandoned or not self._failed_with(call, e):
+                    raise
+            finally:
+                call.waiters -= 1
+                if leader and not call.future.done():
+                    call.abandoned = True
+                if call.waiters == 0 and call.task is not None and not call.task.done():
+                    call.future.cancel()
+                    call.task.cancel()
+
+    @staticmethod
+    def _failed_with(call: _Call[T], error: BaseException) -> bool:
+        return call.future.done() and not call.future.cancelled() and call.future.exception() is error
+
+    async def _execute(self, key: str, call: _Call[T], fn: Callable[[], Awaitable[T]]) -> None:
+        try:
+            result = await fn()
+            if not call.future.done():
+                call.future.set_result(result)
+        except BaseException as e:
+            if not call.future.done():
+                call.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    async def stream(self, key: str, fn: Callable[[], AsyncIterator[T]]) -> AsyncGenerator[T]:
+        """Yields the items produced by `fn`, sharing them with concurrent callers of the same key.
+
+        Callers that join later replay the items produced so far and then receive new ones as they arrive.
+        When the caller which started the stream leaves and the stream fails afterward, the error is not shared;
+        the remaining callers start over instead, skipping the items they have already received.
+        """
+        index = 0
+        while True:
+            call = self._streams.get(key)
+            leader = call is None
+            if call is None:
+                call = self._streams[key] = _StreamCall()
+                call.task = asyncio.create_task(self._produce(key, call, fn))
+
+            call.waiters += 1
+            try:
+                while True:
+                    while index < len(call.chunks):
+                        yield call.chunks[index]
+                        index += 1
+
+                    if call.done:
+                        break
+
+                    await call.changed.wait()
+            finally:
+                call.waiters -= 1
+                if leader and not call.done:
+                    call.abandoned = True
+                if call.waiters == 0 and call.task is not None and not call.task.done():
+                    call.task.cancel()
+
+            if call.error is None:
+                return
+            if leader or not call.abandoned:
+                raise call.error
+
+    async def _produce(self, key: str, call: _StreamCall[T], fn: Callable[[], AsyncIterator[T]]) -> None:
+        try:
+            async for chunk in fn():
+                call.chunks.append(chunk)
+                call.changed.set()
+                call.changed.clear()
+        except BaseException as e:
+            call.error = e
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            call.done = True
+            call.changed.set()
+            if self._streams.get(key) is call:
+                del self._streams[key]
@@ -13,27 +13,155 @@
 # limitations under the License.
 
 
-from typing import TypeVar
+import math
+import sys
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
 
-from cachetools import Cache, LRUCache, TTLCache
+from cachetools import TLRUCache
+from pydantic import BaseModel
 
 from beeai_framework.cache.base import BaseCache
 
 T = TypeVar("T")
 
 
+class SlidingCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Number of entries removed to stay within the size limits."""
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+    """Total size of the stored entries, as reported by the sizer (zero when the entries are not sized)."""
+
+
+def estimate_size(value: Any) -> int:
+    """Estimates the memory footprint of the value in bytes by walking its containers, models and attributes.
+
+    Objects referenced multiple times are counted once.
+    """
+    size = 0
+    seen: set[int] = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type) or callable(obj):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+            if isinstance(obj, BaseModel) and obj.__pydantic_extra__:
+                stack.append(obj.__pydantic_extra__)
+
+    return size
+
+
+class _Entry(Generic[T]):
+    __slots__ = ("size", "ttl", "value")
+
+    def __init__(self, value: T, size: int, ttl: float | None) -> None:
+        self.value = value
+        self.size = size
+        self.ttl = ttl
+
+
+class _Items(TLRUCache[str, _Entry[T]]):
+    def __init__(self, max_bytes: float) -> None:
+        super().__init__(maxsize=max_bytes, ttu=self._ttu, getsizeof=self._getsizeof)
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _ttu(_: str, entry: _Entry[T], now: float) -> float:
+        return now + entry.ttl if entry.ttl else math.inf
+
+    @staticmethod
+    def _getsizeof(entry: _Entry[T]) -> int:
+        return entry.size
+
+    def popitem(self) -> tuple[str, _Entry[T]]:
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time: float | None = None) -> list[tuple[str, _Entry[T]]]:
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        return expired
+
+
 class SlidingCache(BaseCache[T]):
-    """Cache implementation using a sliding window strategy."""
+    """Cache implementation using a sliding window strategy.
+
+    The least recently used entries are evicted once the cache holds more than `size` entries or once the total
+    size of the entries exceeds `max_bytes`, whichever comes first. Entries are sized by `sizer` (the estimated
+    memory footprint by default). Without `max_bytes` and an explicit `sizer`, entries are not sized at all.
+    """
 
-    def __init__(self, size: int, ttl: float | None = None) -> None:
+    def __init__(
+        self,
+        size: int | None = None,
+        ttl: float | None = None,
+        *,
+        max_bytes: int | None = None,
+        sizer: Callable[[T], int] | None = None,
+    ) -> None:
         super().__init__()
-        self._items: Cache[str, T] = TTLCache(maxsize=size, ttl=ttl) if ttl else LRUCache(maxsize=size)
+        if size is None and max_bytes is None:
+            raise ValueError("At least one of 'size' and 'max_bytes' must be provided.")
 
-    async def set(self, key: str, value: T) -> None:
-        self._items[key] = value
+        self._size = size
+        self._ttl = ttl
+        self._sizer: Callable[[T], int] | None = sizer or (estimate_size if max_bytes is not None else None)
+        self._items: _Items[T] = _Items(max_bytes if max_bytes is not None else math.inf)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> SlidingCacheStats:
+        return SlidingCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._items.evictions,
+            expirations=self._items.expirations,
+            entries=len(self._items),
+            bytes=int(self._items.currsize),
+        )
+
+    def reset_stats(self) -> None:
+        self._hits = self._misses = self._items.evictions = self._items.expirations = 0
+
+    async def set(self, key: str, value: T, *, ttl: float | None = None) -> None:
+        """Stores the value, optionally with its own time to live (in seconds) instead of the cache's one."""
+        size = self._sizer(value) if self._sizer is not None else 0
+        entry = _Entry(value, size, ttl if ttl is not None else self._ttl)
+        try:
+            self._items[key] = entry
+        except ValueError:  # the entry alone exceeds 'max_bytes'
+            if self._items.pop(key, None) is not None:
+                self._items.evictions += 1
+            return
+
+        while self._size is not None and len(self._items) > self._size:
+            self._items.popitem()
 
     async def get(self, key: str) -> T | None:
-        return self._items.get(key, default=None)
+        entry = self._items.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return entry.value
 
     async def has(self, key: str) -> bool:
         return key in self._items
@@ -0,0 +1,169 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from typing import Literal, TypeVar
+
+from pydantic import BaseModel
+
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.sliding_cache import SlidingCache
+from beeai_framework.logger import Logger
+
+T = TypeVar("T")
+
+logger = Logger(__name__)
+
+TieredCacheWritePolicy = Literal["write_through", "write_behind"]
+
+
+class TieredCacheStats(BaseModel):
+    l1_hits: int = 0
+    l2_hits: int = 0
+    negative_hits: int = 0
+    """Lookups answered by the record of a known miss, without asking the second tier."""
+    misses: int = 0
+
+
+class TieredCache(BaseCache[T]):
+    """Two-tier cache composing a fast local cache (L1) with a slower shared or persistent one (L2).
+
+    Reads go to L1 first and fall back to L2 (read-through); entries found in L2 are promoted to L1. Writes go to
+    both tiers, either synchronously (`write_through`) or to L1 right away and to L2 in the background
+    (`write_behind`, see `flush`). When `negative_ttl` is set, keys missing in both tiers are remembered for that
+    many seconds, so that repeated lookups of them do not reach L2.
+    """
+
+    def __init__(
+        self,
+        l1: BaseCache[T],
+        l2: BaseCache[T],
+        *,
+        write_policy: TieredCacheWritePolicy = "write_through",
+        promote: bool = True,
+        negative_ttl: float | None = None,
+        negative_size: int = 10_000,
+    ) -> None:
+        super().__init__()
+        if write_policy not in ("write_through", "write_behind"):
+            raise ValueError(f"Unsupported write policy '{write_policy}'.")
+
+        self._l1 = l1
+        self._l2 = l2
+        self._write_policy = write_policy
+        self._promote = promote
+        self._misses: SlidingCache[bool] | None = (
+            SlidingCache(size=negative_size, ttl=negative_ttl) if negative_ttl else None
+        )
+        self._pending: dict[str, T] = {}
+        self._flusher: asyncio.Task[None] | None = None
+        self._stats = TieredCacheStats()
+
+    @property
+    def l1(self) -> BaseCache[T]:
+        return self._l1
+
+    @property
+    def l2(self) -> BaseCache[T]:
+        return self._l2
+
+    @property
+    def stats(self) -> TieredCacheStats:
+        return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        self._stats = TieredCacheStats()
+
+    async def size(self) -> int:
+        """Returns the size of L2, which holds all the entries."""
+        await self.flush()
+        return await self._l2.size()
+
+    async def set(self, key: str, value: T) -> None:
+        if self._misses is not None:
+            await self._misses.delete(key)
+
+        if self._write_policy == "write_behind":
+            await self._l1.set(key, value)
+            self._pending[key] = value
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._write_pending())
+        else:
+            await self._l2.set(key, value)
+            await self._l1.set(key, value)
+
+    async def get(self, key: str) -> T | None:
+        value = await self._l1.get(key)
+        if value is not None:
+            self._stats.l1_hits += 1
+            return value
+
+        value = self._pending.get(key)
+        if value is not None:
+            self._stats.l1_hits += 1
+            return value
+
+        if self._misses is not None and await self._misses.has(key):
+            self._stats.negative_hits += 1
+            return None
+
+        value = await self._l2.get(key)
+        if value is None:
+            self._stats.misses += 1
+            if self._misses is not None:
+                await self._misses.set(key, True)
+            return None
+
+        self._stats.l2_hits += 1
+        if self._promote:
+            await self._l1.set(key, value)
+        return value
+
+    async def has(self, key: str) -> bool:
+        if key in self._pending or await self._l1.has(key):
+            return True
+        if self._misses is not None and await self._misses.has(key):
+            return False
+        return await self._l2.has(key)
+
+    async def delete(self, key: str) -> bool:
+        await self.flush()
+        deleted_l1 = await self._l1.delete(key)
+        deleted_l2 = await self._l2.delete(key)
+        return deleted_l1 or deleted_l2
+
+    async def clear(self) -> None:
+        await self.flush()
+        await self._l1.clear()
+        await self._l2.clear()
+        if self._misses is not None:
+            await self._misses.clear()
+
+    async def flush(self) -> None:
+        """Waits until the values written behind are stored in L2."""
+        if self._flusher is not None and not self._flusher.done():
+            await asyncio.shield(self._flusher)
+
+    async def _write_pending(self) -> None:
+        while self._pending:
+            key, value = next(iter(self._pending.items()))
+            try:
+                await self._l2.set(key, value)
+            except Exception as e:
+                logger.error(f"Failed to write the entry '{key}' to the second tier of the cache: {e}")
+            finally:
+                # the value may have been replaced in the meantime, then it gets written again
+                if self._pending.get(key) is value:
+                    del self._pending[key]
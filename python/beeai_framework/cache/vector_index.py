@@ -0,0 +1,234 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import heapq
+import importlib
+import math
+import operator
+import random
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    _numpy: Any = importlib.import_module("numpy")
+except ImportError:
+    _numpy = None
+
+
+def normalize_vector(vector: Sequence[float]) -> list[float]:
+    """Scales the vector to unit length, so that the dot product of two vectors is their cosine similarity."""
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else [float(value) for value in vector]
+
+
+def _dot(first: Sequence[float], second: Sequence[float]) -> float:
+    return float(sum(map(operator.mul, first, second)))
+
+
+class VectorIndex(ABC):
+    """In-process index of unit-length vectors searched by the cosine similarity."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def add(self, id: str, vector: Sequence[float]) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def search(self, vector: Sequence[float], k: int = 1) -> list[tuple[str, float]]:
+        """Returns up to `k` pairs of the id and the similarity of the closest vectors, the most similar first."""
+
+
+class BruteForceIndex(VectorIndex):
+    """Exact index comparing the query with every vector, vectorized with NumPy when it is installed."""
+
+    def __init__(self) -> None:
+        self._vectors: dict[str, list[float]] = {}
+        self._ids: list[str] = []
+        self._matrix: Any = None
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def add(self, id: str, vector: Sequence[float]) -> None:
+        self._vectors[id] = list(vector)
+        self._matrix = None
+
+    def remove(self, id: str) -> bool:
+        if self._vectors.pop(id, None) is None:
+            return False
+        self._matrix = None
+        return True
+
+    def search(self, vector: Sequence[float], k: int = 1) -> list[tuple[str, float]]:
+        if not self._vectors:
+            return []
+
+        if _numpy is None:
+            return heapq.nlargest(
+                k, ((id, _dot(vector, other)) for id, other in self._vectors.items()), key=operator.itemgetter(1)
+            )
+
+        if self._matrix is None:
+            self._ids = list(self._vectors)
+            self._matrix = _numpy.array(list(self._vectors.values()), dtype=_numpy.float32)
+        similarities = self._matrix @ _numpy.asarray(vector, dtype=_numpy.float32)
+        best = _numpy.argsort(-similarities)[:k]
+        return [(self._ids[index], float(similarities[index])) for index in best]
+
+
+class HNSWIndex(VectorIndex):
+    """Approximate index based on Hierarchical Navigable Small World graphs.
+
+    Searching visits only a small part of the vectors, so it scales to large indexes better than `BruteForceIndex`,
+    at the cost of occasionally missing the closest vector. `m` is the number of links of every node, `ef_construction`
+    and `ef_search` are the sizes of the candidate lists when adding and searching (larger is slower but more precise).
+    """
+
+    def __init__(
+        self, *, m: int = 16, ef_construction: int = 100, ef_search: int = 50, seed: int | None = None
+    ) -> None:
+        if m < 2:
+            raise ValueError("The 'm' must be at least 2.")
+
+        self._m = m
+        self._ef_construction = ef_construction
+        self._ef_search = ef_search
+        self._level_factor = 1 / math.log(m)
+        self._random = random.Random(seed)
+        self._vectors: dict[str, list[float]] = {}
+        self._layers: list[dict[str, set[str]]] = []
+        self._entry: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def add(self, id: str, vector: Sequence[float]) -> None:
+        if id in self._vectors:
+            self.remove(id)
+
+        vector = list(vector)
+        self._vectors[id] = vector
+        level = int(-math.log(1 - self._random.random()) * self._level_factor)
+        while len(self._layers) <= level:
+            self._layers.append({})
+        for layer in self._layers[: level + 1]:
+            layer[id] = set()
+
+        if self._entry is None:
+            self._entry = id
+            return
+
+        entry = self._entry
+        entry_level = self._level_of(entry)
+        for layer_index in range(entry_level, level, -1):
+            entry = self._search_layer(vector, [entry], 1, layer_index)[0][1]
+
+        for layer_index in range(min(level, entry_level), -1, -1):
+            candidates = self._search_layer(vector, [entry], self._ef_construction, layer_index)
+            layer = self._layers[layer_index]
+            max_links = self._max_links(layer_index)
+            for _, neighbor in candidates[:max_links]:
+                layer[id].add(neighbor)
+                layer[neighbor].add(id)
+                if len(layer[neighbor]) > max_links:
+                    self._prune(neighbor, layer, max_links)
+            entry = candidates[0][1]
+
+        if level > entry_level:
+            self._entry = id
+
+    def remove(self, id: str) -> bool:
+        if self._vectors.pop(id, None) is None:
+            return False
+
+        for layer_index, layer in enumerate(self._layers):
+            neighbors = layer.pop(id, None)
+            if neighbors is None:
+                continue
+            for neighbor in neighbors:
+                layer[neighbor].discard(id)
+            # reconnect the former neighbors, so that the graph stays navigable
+            max_links = self._max_links(layer_index)
+            for neighbor in neighbors:
+                for other in neighbors:
+                    if other != neighbor and len(layer[neighbor]) < max_links and len(layer[other]) < max_links:
+                        layer[neighbor].add(other)
+                        layer[other].add(neighbor)
+
+        while self._layers and not self._layers[-1]:
+            self._layers.pop()
+        if self._entry == id:
+            self._entry = next(iter(self._layers[-1]), None) if self._layers else None
+        return True
+
+    def search(self, vector: Sequence[float], k: int = 1) -> list[tuple[str, float]]:
+        if self._entry is None:
+            return []
+
+        entry = self._entry
+        for layer_index in range(len(self._layers) - 1, 0, -1):
+            entry = self._search_layer(vector, [entry], 1, layer_index)[0][1]
+        candidates = self._search_layer(vector, [entry], max(self._ef_search, k), 0)
+        return [(id, similarity) for similarity, id in candidates[:k]]
+
+    def _level_of(self, id: str) -> int:
+        return max(index for index, layer in enumerate(self._layers) if id in layer)
+
+    def _max_links(self, layer_index: int) -> int:
+        return self._m * 2 if layer_index == 0 else self._m
+
+    def _prune(self, id: str, layer: dict[str, set[str]], max_links: int) -> None:
+        vector = self._vectors[id]
+        kept = heapq.nlargest(max_links, layer[id], key=lambda other: _dot(vector, self._vectors[other]))
+        for dropped in layer[id].difference(kept):
+            layer[dropped].discard(id)
+        layer[id] = set(kept)
+
+    def _search_layer(
+        self, vector: Sequence[float], entries: list[str], ef: int, layer_index: int
+    ) -> list[tuple[float, str]]:
+        """Returns up to `ef` pairs of the similarity and the id of the closest nodes, the most similar first."""
+        layer = self._layers[layer_index]
+        visited = set(entries)
+        candidates = [(-_dot(vector, self._vectors[id]), id) for id in entries]  # max-heap by the similarity
+        heapq.heapify(candidates)
+        results = [(-similarity, id) for similarity, id in candidates]  # min-heap by the similarity
+        heapq.heapify(results)
+
+        while candidates:
+            similarity, id = heapq.heappop(candidates)
+            if -similarity < results[0][0] and len(results) >= ef:
+                break
+
+            for neighbor in layer[id]:
+                if neighbor in visited:
+                    continue
+                visited.add(neighbor)
+                neighbor_similarity = _dot(vector, self._vectors[neighbor])
+                if len(results) < ef or neighbor_similarity > results[0][0]:
+                    heapq.heappush(candidates, (-neighbor_similarity, neighbor))
+                    heapq.heappush(results, (neighbor_similarity, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+
+        return sorted(results, reverse=True)
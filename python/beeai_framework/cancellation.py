@@ -81,16 +81,34 @@ class AbortController:
         self._signal._abort(reason)
 
 
-def register_signals(controller: AbortController, signals: list[AbortSignal]) -> None:
+def register_signals(controller: AbortController, signals: list[AbortSignal]) -> Callable[[], None]:
+    """Aborts the controller once any of the signals is aborted.
+
+    Returns a function detaching the controller from the signals again.
+    """
+    registered: list[tuple[AbortSignal, Callable[[], None]]] = []
+
     def register(signal: AbortSignal) -> None:
         if signal.aborted:
             controller.abort(signal.reason)
         else:
-            signal.add_event_listener(lambda: controller.abort(signal.reason))
+
+            def on_abort() -> None:
+                controller.abort(signal.reason)
+
+            signal.add_event_listener(on_abort)
+            registered.append((signal, on_abort))
 
     for signal in filter(lambda x: x is not None, signals):
         register(signal)
 
+    def unregister() -> None:
+        for signal, on_abort in registered:
+            signal.remove_event_listener(on_abort)
+        registered.clear()
+
+    return unregister
+
 
 async def abort_signal_handler(
     fn: Callable[[], Awaitable[T]], signal: AbortSignal | None = None, on_abort: Callable[[], None] | None = None
@@ -14,7 +14,6 @@
 
 
 import asyncio
-import contextlib
 import uuid
 from collections.abc import Awaitable, Callable, Generator
 from contextvars import ContextVar
@@ -117,7 +116,7 @@ class RunContext:
             extra_signals.append(parent.signal)
         if signal:
             extra_signals.append(signal)
-        register_signals(self.controller, extra_signals)
+        self._unregister_signals = register_signals(self.controller, extra_signals)
 
     @property
     def signal(self) -> AbortSignal:
@@ -125,8 +124,44 @@ class RunContext:
 
     def destroy(self) -> None:
         self.emitter.destroy()
+        self._unregister_signals()
         self.controller.abort("Context has been destroyed.")
 
+    async def _run(self, fn: Callable[["RunContext"], Awaitable[R]]) -> R:
+        """Runs the function within the current task and cancels it once the context's signal gets aborted."""
+        task = asyncio.current_task()
+        assert task is not None
+        aborted = False
+
+        def on_abort() -> None:
+            nonlocal aborted
+            if not aborted:
+                aborted = True
+                task.cancel()
+
+        self.signal.throw_if_aborted()
+        self.signal.add_event_listener(on_abort)
+        token = storage.set(self)
+        cancelled = False
+        try:
+            result = await fn(self)
+        except asyncio.CancelledError:
+            if not aborted:
+                raise
+            cancelled = True
+            task.uncancel()
+            raise AbortError(self.signal.reason)
+        finally:
+            storage.reset(token)
+            self.signal.remove_event_listener(on_abort)
+            if aborted and not cancelled:
+                # the function aborted the signal itself and finished without awaiting the cancellation
+                await _discard_cancellation(task)
+
+        if aborted:
+            raise AbortError(self.signal.reason)
+        return result
+
     @staticmethod
     def enter(
         instance: RunInstance,
@@ -154,35 +189,7 @@ class RunContext:
             try:
                 await emitter.emit("start", None)
 
-                async def _context_storage_run() -> R:
-                    storage.set(context)
-                    return await fn(context)
-
-                async def _context_signal_aborted() -> None:
-                    cancel_future = asyncio.get_event_loop().create_future()
-
-                    def _on_abort() -> None:
-                        if not cancel_future.done() and not cancel_future.cancelled():
-                            err = AbortError(context.signal.reason)
-                            cancel_future.set_exception(err)
-
-                    context.signal.add_event_listener(_on_abort)
-                    await cancel_future
-
-                abort_task = asyncio.create_task(
-                    _context_signal_aborted(),
-                    name="abort-task",
-                )
-                runner_task = asyncio.create_task(_context_storage_run(), name="run-task")
-
-                done, pending = await asyncio.wait([abort_task, runner_task], return_when=asyncio.FIRST_COMPLETED)
-                result = done.pop().result()
-                abort_task.cancel()
-
-                for task in pending:
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await task
-
+                result = await context._run(fn)
                 await emitter.emit("success", result)
                 assert result is not None
                 return result
@@ -192,6 +199,18 @@ class RunContext:
                 raise error
             finally:
                 await emitter.emit("finish", None)
+                emitter.destroy()
                 context.destroy()
 
         return Run(handler, context)
+
+
+async def _discard_cancellation(task: asyncio.Task[Any]) -> None:
+    """Takes back the cancellation requested by an abort, including its pending delivery."""
+    try:
+        await asyncio.sleep(0)
+    except asyncio.CancelledError:
+        if task.cancelling() > 1:  # cancelled by someone else as well
+            task.uncancel()
+            raise
+    task.uncancel()
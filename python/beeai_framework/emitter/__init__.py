@@ -23,7 +23,7 @@ from beeai_framework.emitter.emitter import (
     MatcherFn,
 )
 from beeai_framework.emitter.errors import EmitterError
-from beeai_framework.emitter.types import EmitterOptions, EventTrace
+from beeai_framework.emitter.types import EmitterOptions, EmitterQueueStats, EventTrace
 
 __all__ = [
     "Callback",
@@ -31,6 +31,7 @@ __all__ = [
     "Emitter",
     "EmitterError",
     "EmitterOptions",
+    "EmitterQueueStats",
     "EventMeta",
     "EventTrace",
     "Listener",
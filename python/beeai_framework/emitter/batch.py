@@ -0,0 +1,88 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from beeai_framework.logger import Logger
+from beeai_framework.utils.asynchronous import ensure_async
+
+if TYPE_CHECKING:
+    from beeai_framework.emitter.emitter import Callback, EventMeta
+
+logger = Logger(__name__)
+
+
+class EventBatch:
+    """Buffers events of a single listener and delivers them as one list of `(data, meta)` pairs.
+
+    The batch is flushed once it reaches `size` events, `interval` seconds after its first buffered event,
+    or explicitly via `flush` (the emitter does so when a `finish` event passes through it).
+    """
+
+    def __init__(self, callback: "Callback", *, size: int | None = None, interval: float | None = None) -> None:
+        self._callback = ensure_async(callback)
+        self._size = size
+        self._interval = interval
+        self._items: list[tuple[Any, EventMeta]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._items)
+
+    async def add(self, data: Any, event: "EventMeta") -> None:
+        self._items.append((data, event))
+        if self._size is not None and len(self._items) >= self._size:
+            await self.flush()
+        elif self._interval is not None and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._interval, self._flush_in_background)
+
+    async def flush(self) -> None:
+        self._cancel_timer()
+        if not self._items:
+            return
+
+        items, self._items = self._items, []
+        await self._callback(items, items[-1][1])
+
+    def close(self) -> None:
+        """Stops the timer and delivers the remaining events in the background (if an event loop is running)."""
+        self._cancel_timer()
+        if self._items:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                self._items.clear()
+            else:
+                self._flush_in_background()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_in_background(self) -> None:
+        self._timer = None
+        task = asyncio.create_task(self._flush_safely())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_safely(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to deliver a batch of events: {e}")
@@ -17,7 +17,9 @@ import copy
 import functools
 import inspect
 import re
+import time
 import uuid
+import weakref
 from asyncio import Task
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
@@ -25,8 +27,11 @@ from typing import Any, TypeAlias
 
 from pydantic import BaseModel, ConfigDict, InstanceOf
 
+from beeai_framework.emitter.batch import EventBatch
 from beeai_framework.emitter.errors import EmitterError
-from beeai_framework.emitter.types import EmitterOptions, EventTrace
+from beeai_framework.emitter.matchers import CompiledMatcher, compile_matcher
+from beeai_framework.emitter.queue import ListenerQueue
+from beeai_framework.emitter.types import EmitterOptions, EmitterQueueStats, EventTrace
 from beeai_framework.emitter.utils import (
     assert_valid_name,
     assert_valid_namespace,
@@ -47,21 +52,217 @@ class Listener(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    def __hash__(self) -> int:
+        # every registration creates its own match function, so the identity is sufficient (and much cheaper)
+        return id(self)
 
-class EventMeta(BaseModel):
-    id: str
-    name: str
-    path: str
-    created_at: datetime
-    source: InstanceOf["Emitter"]
-    creator: object
-    context: object
-    group_id: str | None = None
-    trace: InstanceOf[EventTrace] | None = None
-    data_type: type
+
+class ListenerIndex:
+    """Groups listeners by the kind of their matcher so that dispatch does not scan every listener.
+
+    Listeners registered for a concrete event (either by its name or by its full path) are stored under the full
+    event path and are retrieved with a single dictionary lookup. Wildcard, regex and callable matchers cannot be
+    resolved upfront, so they are kept in separate buckets and are always considered as candidates.
+    Listeners created by `Emitter.pipe` are tracked together with their target emitter, batched and queued
+    listeners together with their buffer.
+    """
+
+    def __init__(self) -> None:
+        self.exact: dict[str, dict[Listener, None]] = {}
+        self.wildcard: dict[Listener, None] = {}
+        self.regex: dict[Listener, None] = {}
+        self.callable: dict[Listener, None] = {}
+        self.pipes: dict[Listener, Emitter] = {}
+        self.batches: dict[Listener, EventBatch] = {}
+        self.queues: dict[Listener, ListenerQueue] = {}
+        self._matchers: dict[Listener, CompiledMatcher] = {}
+
+    def add(
+        self,
+        listener: Listener,
+        matcher: CompiledMatcher,
+        target: "Emitter | None" = None,
+        batch: EventBatch | None = None,
+        queue: ListenerQueue | None = None,
+    ) -> None:
+        self._matchers[listener] = matcher
+        if batch is not None:
+            self.batches[listener] = batch
+        if queue is not None:
+            self.queues[listener] = queue
+        if target is not None:
+            self.pipes[listener] = target
+        else:
+            self._bucket(matcher).setdefault(listener, None)
+
+    def remove(self, listener: Listener) -> None:
+        matcher = self._matchers.pop(listener)
+        batch = self.batches.pop(listener, None)
+        if batch is not None:
+            batch.close()
+        queue = self.queues.pop(listener, None)
+        if queue is not None:
+            queue.close()
+        if self.pipes.pop(listener, None) is not None:
+            return
+
+        bucket = self._bucket(matcher)
+        bucket.pop(listener, None)
+        if matcher.key is not None and not bucket:
+            del self.exact[matcher.key]
+
+    def clear(self) -> None:
+        self.exact.clear()
+        self.wildcard.clear()
+        self.regex.clear()
+        self.callable.clear()
+        self.pipes.clear()
+        for batch in self.batches.values():
+            batch.close()
+        self.batches.clear()
+        for queue in self.queues.values():
+            queue.close()
+        self.queues.clear()
+        self._matchers.clear()
+
+    def candidates(self, path: str) -> list[Listener]:
+        exact = self.exact.get(path)
+        return [
+            *(exact or ()),
+            *self.wildcard,
+            *self.regex,
+            *self.callable,
+            *self.pipes,
+        ]
+
+    def has_direct(self, path: str) -> bool:
+        """Whether any non-pipe listener could be interested in an event with the given path."""
+        return (
+            path in self.exact
+            or bool(self.wildcard or self.regex or self.callable)
+            or (bool(self.batches) and (path == "finish" or path.endswith(".finish")))
+        )
+
+    def _bucket(self, matcher: CompiledMatcher) -> dict[Listener, None]:
+        if matcher.key is not None:
+            return self.exact.setdefault(matcher.key, {})
+        elif matcher.kind == "regex":
+            return self.regex
+        elif matcher.kind == "callable":
+            return self.callable
+        else:
+            return self.wildcard
+
+
+_UNSET: Any = object()
+
+
+def _describe_matcher(matcher: Matcher) -> str:
+    if isinstance(matcher, str):
+        return matcher
+    elif isinstance(matcher, re.Pattern):
+        return matcher.pattern
+    else:
+        return getattr(matcher, "__name__", repr(matcher))
+
+
+class EventMeta:
+    """Metadata describing a single emitted event.
+
+    The event is created for every emission, so it is kept deliberately lightweight. The `id`, `created_at`,
+    `context` and `trace` attributes are materialized on first access only (the creation timestamp is captured
+    eagerly as a float). The `context` and `trace` snapshots are taken from the source emitter at that time.
+    """
+
+    __slots__ = (
+        "_context",
+        "_created_at",
+        "_id",
+        "_timestamp",
+        "_trace",
+        "creator",
+        "data_type",
+        "group_id",
+        "name",
+        "path",
+        "source",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        path: str,
+        source: "Emitter",
+        creator: object,
+        data_type: type,
+        group_id: str | None = None,
+        id: str | None = None,
+        created_at: datetime | None = None,
+        context: object = _UNSET,
+        trace: EventTrace | None = _UNSET,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.source = source
+        self.creator = creator
+        self.data_type = data_type
+        self.group_id = group_id
+        self._id = id
+        self._created_at = created_at
+        self._timestamp = time.time()
+        self._context = context
+        self._trace = trace
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
+
+    @property
+    def created_at(self) -> datetime:
+        if self._created_at is None:
+            self._created_at = datetime.fromtimestamp(self._timestamp, tz=UTC)
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = value
+
+    @property
+    def context(self) -> object:
+        if self._context is _UNSET:
+            self._context = {**self.source.context}
+        return self._context
+
+    @context.setter
+    def context(self, value: object) -> None:
+        self._context = value
+
+    @property
+    def trace(self) -> EventTrace | None:
+        if self._trace is _UNSET:
+            self._trace = copy.copy(self.source.trace)
+        return self._trace
+
+    @trace.setter
+    def trace(self, value: EventTrace | None) -> None:
+        self._trace = value
+
+    def __repr__(self) -> str:
+        return f"EventMeta(id={self.id!r}, name={self.name!r}, path={self.path!r}, created_at={self.created_at!r})"
 
 
 class Emitter:
+    # Incremented whenever a listener is added to or removed from an emitter that other emitters pipe into.
+    # Emitters use it to invalidate their cached "is anybody listening" answers.
+    _listeners_version: int = 0
+
     def __init__(
         self,
         group_id: str | None = None,
@@ -81,6 +282,13 @@ class Emitter:
         self.trace: EventTrace | None = trace
         self.cleanups: list[CleanupFn] = []
         self._events: dict[str, type] = events or {}
+        self._parent: Emitter | None = None
+        self._children: weakref.WeakSet[Emitter] = weakref.WeakSet()
+        self._index = ListenerIndex()
+        self._paths: dict[str, str] = {}
+        self._subscribed: dict[str, bool] = {}
+        self._subscribed_version: int = -1
+        self._sources: int = 0
 
         assert_valid_namespace(self.namespace)
 
@@ -115,13 +323,16 @@ class Emitter:
             events=events or self.events,
         )
 
-        cleanup = child_emitter.pipe(self)
-        self.cleanups.append(cleanup)
+        # The parent only keeps a weak reference to its children, so long-lived emitters (e.g., of a tool that is
+        # reused across many runs) do not accumulate short-lived ones.
+        child_emitter.pipe(self)
+        child_emitter._parent = self
+        self._children.add(child_emitter)
 
         return child_emitter
 
     def pipe(self, target: "Emitter") -> CleanupFn:
-        return self.on(
+        return self._match(
             "*.*",
             target._invoke,
             EmitterOptions(
@@ -129,10 +340,23 @@ class Emitter:
                 once=False,
                 persistent=True,
             ),
+            target=target,
         )
 
     def destroy(self) -> None:
+        for target in self._index.pipes.values():
+            target._sources -= 1
         self.listeners.clear()
+        self._index.clear()
+        self._invalidate_subscribers()
+
+        for child in list(self._children):
+            child._unpipe(self)
+        self._children.clear()
+        if self._parent is not None:
+            self._parent._children.discard(self)
+            self._parent = None
+
         for cleanup in self.cleanups:
             cleanup()
         self.cleanups.clear()
@@ -141,53 +365,126 @@ class Emitter:
         return self.match(event, callback, options)
 
     def match(self, matcher: Matcher, callback: Callback, options: EmitterOptions | None = None) -> CleanupFn:
-        def create_matcher() -> MatcherFn:
-            matchers: list[MatcherFn] = []
-            match_nested = options.match_nested if options else None
-
-            if matcher == "*":
-                match_nested = False if match_nested is None else match_nested
-                matchers.append(lambda event: event.path == ".".join([*self.namespace, event.name]))
-            elif matcher == "*.*":
-                match_nested = True if match_nested is None else match_nested
-                matchers.append(lambda _: True)
-            elif isinstance(matcher, re.Pattern):
-                match_nested = True if match_nested is None else match_nested
-                matchers.append(lambda event: matcher.match(event.path) is not None)
-            elif callable(matcher):
-                match_nested = False if match_nested is None else match_nested
-                matchers.append(matcher)
-            elif isinstance(matcher, str):
-                if "." in matcher:
-                    match_nested = True if match_nested is None else match_nested
-                    matchers.append(lambda event: event.path == matcher)
-                else:
-                    match_nested = False if match_nested is None else match_nested
-                    matchers.append(
-                        lambda event: event.name == matcher and event.path == ".".join([*self.namespace, event.name])
-                    )
-            else:
-                raise EmitterError("Invalid matcher provided!")
+        return self._match(matcher, callback, options)
 
-            if not match_nested:
+    def _match(
+        self,
+        matcher: Matcher,
+        callback: Callback,
+        options: EmitterOptions | None = None,
+        *,
+        target: "Emitter | None" = None,
+    ) -> CleanupFn:
+        compiled = compile_matcher(matcher, self.namespace, options.match_nested if options else None)
+        queue = (
+            ListenerQueue(
+                callback,
+                size=options.queue_size,
+                overflow=options.queue_overflow or "block",
+                name=_describe_matcher(matcher),
+            )
+            if options and options.queue_size
+            else None
+        )
+        batch = (
+            EventBatch(queue.put if queue else callback, size=options.batch_size, interval=options.batch_interval)
+            if options and (options.batch_size or options.batch_interval)
+            else None
+        )
+        listener = Listener(
+            match=self._create_match_fn(compiled),
+            raw=matcher,
+            callback=batch.add if batch else queue.put if queue else callback,
+            options=options,
+        )
+        self._add_listener(listener, compiled, target, batch, queue)
 
-                def match_same_run(event: EventMeta) -> bool:
-                    return self.trace is None or (
-                        self.trace.run_id == event.trace.run_id if event.trace is not None else False
-                    )
+        return lambda: self._remove_listener(listener)
 
-                matchers.insert(0, match_same_run)
+    def _create_match_fn(self, compiled: CompiledMatcher) -> MatcherFn:
+        # every registration gets its own function, so that equal registrations stay distinct listeners
+        if compiled.match_nested:
+            return lambda event: compiled(event)
 
-            return lambda event: all(match_fn(event) for match_fn in matchers)
+        def match_same_run(event: EventMeta) -> bool:
+            if self.trace is not None:
+                # avoids materializing the lazy trace copy of the event
+                trace = event.source.trace if event._trace is _UNSET else event._trace
+                if trace is None or trace.run_id != self.trace.run_id:
+                    return False
+            return compiled(event)
 
-        listener = Listener(match=create_matcher(), raw=matcher, callback=callback, options=options)
-        self.listeners.add(listener)
+        return match_same_run
 
-        return lambda: self.listeners.remove(listener)
+    def _unpipe(self, target: "Emitter") -> None:
+        for listener, pipe_target in list(self._index.pipes.items()):
+            if pipe_target is target:
+                self._remove_listener(listener)
+
+    def _add_listener(
+        self,
+        listener: Listener,
+        matcher: CompiledMatcher,
+        target: "Emitter | None" = None,
+        batch: EventBatch | None = None,
+        queue: ListenerQueue | None = None,
+    ) -> None:
+        if listener in self.listeners:
+            return
+
+        self.listeners.add(listener)
+        self._index.add(listener, matcher, target, batch, queue)
+        if target is not None:
+            target._sources += 1
+        self._invalidate_subscribers()
+
+    def _remove_listener(self, listener: Listener) -> None:
+        self.listeners.remove(listener)
+        target = self._index.pipes.get(listener)
+        self._index.remove(listener)
+        if target is not None:
+            target._sources -= 1
+        self._invalidate_subscribers()
+
+    def _invalidate_subscribers(self) -> None:
+        # Listeners of this emitter only matter to itself and to the emitters piping into it. The common case of
+        # a fresh child being piped to its parent therefore does not invalidate the caches of long-lived emitters.
+        if self._sources:
+            Emitter._listeners_version += 1
+        else:
+            self._subscribed.clear()
+
+    def queue_stats(self) -> list[EmitterQueueStats]:
+        """Returns delivery statistics of listeners registered with the `queue_size` option."""
+        return [queue.stats() for queue in self._index.queues.values()]
+
+    def _has_subscribers(self, path: str) -> bool:
+        """Checks whether an event with the given path would reach any listener on this emitter or its pipe targets.
+
+        The answer is cached per path and invalidated whenever a listener that could affect it is added or removed.
+        """
+        if self._subscribed_version != Emitter._listeners_version:
+            self._subscribed.clear()
+            self._subscribed_version = Emitter._listeners_version
+
+        subscribed = self._subscribed.get(path)
+        if subscribed is None:
+            subscribed = self._index.has_direct(path) or any(
+                target._has_subscribers(path) for target in self._index.pipes.values()
+            )
+            self._subscribed[path] = subscribed
+        return subscribed
 
     async def emit(self, name: str, value: Any) -> None:
         try:
-            assert_valid_name(name)
+            path = self._paths.get(name)
+            if path is None:
+                assert_valid_name(name)
+                path = self._paths[name] = ".".join([*self.namespace, name])
+
+            if not self._has_subscribers(path):
+                return
+
             event = self.create_event(name)
             await self._invoke(value, event)
         except Exception as e:
@@ -195,12 +492,12 @@ class Emitter:
 
     async def _invoke(self, data: Any, event: EventMeta) -> None:
         executions: list[Coroutine[Any, Any, Any] | Task[Any]] = []
-        for listener in self.listeners:
+        for listener in self._index.candidates(event.path):
             if not listener.match(event):
                 continue
 
             if listener.options and listener.options.once:
-                self.listeners.remove(listener)
+                self._remove_listener(listener)
 
             async def run(ln: Listener = listener) -> Any:
                 try:
@@ -213,23 +510,31 @@ class Emitter:
                         e, message="One of the provided Emitter callbacks has failed.", event=event
                     )
 
-            if listener.options and listener.options.is_blocking:
+            if listener.options and (
+                listener.options.is_blocking or listener in self._index.batches or listener in self._index.queues
+            ):
+                # buffered listeners only enqueue the event, spawning a task for that would cost more than the work
                 executions.append(run())
             else:
                 executions.append(asyncio.create_task(run()))
 
         await asyncio.gather(*executions)
 
+        if event.name == "finish" and self._index.batches:
+            for batch in list(self._index.batches.values()):
+                try:
+                    await batch.flush()
+                except Exception as e:
+                    raise EmitterError.ensure(
+                        e, message="One of the provided Emitter callbacks has failed.", event=event
+                    )
+
     def create_event(self, name: str) -> EventMeta:
         return EventMeta(
-            id=str(uuid.uuid4()),
             group_id=self.group_id,
             name=name,
-            path=".".join([*self.namespace, name]),
-            created_at=datetime.now(tz=UTC),
+            path=self._paths.get(name) or ".".join([*self.namespace, name]),
             source=self,
             creator=self.creator,
-            context={**self.context},
-            trace=copy.copy(self.trace),
-            data_type=self.events.get(name) or type(Any),
+            data_type=self._events.get(name) or type(Any),
         )
@@ -0,0 +1,118 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import functools
+import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Literal, TypeAlias
+
+from beeai_framework.emitter.errors import EmitterError
+
+if TYPE_CHECKING:
+    from beeai_framework.emitter.emitter import EventMeta
+
+MatcherKind: TypeAlias = Literal["exact", "instance", "all", "regex", "callable"]
+
+
+class CompiledMatcher:
+    """Matcher resolved once at registration time.
+
+    String and regex matchers are interned, so emitters sharing the same namespace and pattern share a single
+    instance. Matching relies solely on the precomputed `EventMeta.path`, nothing is joined per event.
+    """
+
+    __slots__ = ("_fn", "_prefix", "key", "kind", "match_nested")
+
+    def __init__(
+        self,
+        kind: MatcherKind,
+        *,
+        match_nested: bool,
+        key: str | None = None,
+        prefix: str = "",
+        fn: Callable[["EventMeta"], bool] | None = None,
+    ) -> None:
+        self.kind = kind
+        self.match_nested = match_nested
+        self.key = key
+        self._prefix = prefix
+        self._fn = fn
+
+    def __call__(self, event: "EventMeta") -> bool:
+        if self.kind == "exact":
+            return event.path == self.key
+        elif self.kind == "instance":
+            path = event.path
+            return len(path) == len(self._prefix) + len(event.name) and path.startswith(self._prefix)
+        elif self.kind == "all":
+            return True
+        else:
+            assert self._fn is not None
+            return self._fn(event)
+
+
+def compile_matcher(
+    matcher: "str | re.Pattern[str] | Callable[[EventMeta], bool]",
+    namespace: list[str],
+    match_nested: bool | None = None,
+) -> CompiledMatcher:
+    if isinstance(matcher, str | re.Pattern):
+        # only the "*" and name matchers depend on the namespace of the emitter
+        depends_on_namespace = isinstance(matcher, str) and (matcher == "*" or "." not in matcher)
+        return _compile_interned(tuple(namespace) if depends_on_namespace else (), matcher, match_nested)
+
+    return _compile(matcher, namespace, match_nested)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_interned(
+    namespace: tuple[str, ...], matcher: str | re.Pattern[str], match_nested: bool | None
+) -> CompiledMatcher:
+    return _compile(matcher, list(namespace), match_nested)
+
+
+def _compile(
+    matcher: "str | re.Pattern[str] | Callable[[EventMeta], bool]",
+    namespace: list[str],
+    match_nested: bool | None,
+) -> CompiledMatcher:
+    if matcher == "*":
+        return CompiledMatcher(
+            "instance",
+            match_nested=False if match_nested is None else match_nested,
+            prefix="".join(f"{part}." for part in namespace),
+        )
+    elif matcher == "*.*":
+        return CompiledMatcher("all", match_nested=True if match_nested is None else match_nested)
+    elif isinstance(matcher, re.Pattern):
+        pattern = matcher
+        return CompiledMatcher(
+            "regex",
+            match_nested=True if match_nested is None else match_nested,
+            fn=lambda event: pattern.match(event.path) is not None,
+        )
+    elif callable(matcher):
+        return CompiledMatcher("callable", match_nested=False if match_nested is None else match_nested, fn=matcher)
+    elif isinstance(matcher, str):
+        if "." in matcher:
+            return CompiledMatcher("exact", match_nested=True if match_nested is None else match_nested, key=matcher)
+        else:
+            return CompiledMatcher(
+                "exact",
+                match_nested=False if match_nested is None else match_nested,
+                key=".".join([*namespace, matcher]),
+            )
+    else:
+        raise EmitterError("Invalid matcher provided!")
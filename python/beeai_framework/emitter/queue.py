@@ -0,0 +1,104 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any
+
+from beeai_framework.emitter.types import EmitterQueueStats, QueueOverflowPolicy
+from beeai_framework.logger import Logger
+from beeai_framework.utils.asynchronous import ensure_async
+
+if TYPE_CHECKING:
+    from beeai_framework.emitter.emitter import Callback, EventMeta
+
+logger = Logger(__name__)
+
+
+class ListenerQueue:
+    """Decouples a listener from the producer by a bounded queue processed by a dedicated worker task.
+
+    The producer only enqueues the event, so a slow listener never delays the emitter. When the queue is full,
+    the `overflow` policy decides whether the oldest event is dropped, the incoming event is dropped,
+    or the producer waits for a free slot. Errors raised by the listener are logged and counted, they are not
+    propagated to the producer.
+    """
+
+    def __init__(
+        self, callback: "Callback", *, size: int, overflow: QueueOverflowPolicy = "block", name: str = ""
+    ) -> None:
+        self.name = name
+        self._callback = ensure_async(callback)
+        self._overflow = overflow
+        self._queue: asyncio.Queue[tuple[Any, EventMeta]] = asyncio.Queue(maxsize=size)
+        self._worker: asyncio.Task[None] | None = None
+        self._closed = False
+        self._delivered = 0
+        self._dropped = 0
+        self._failed = 0
+
+    def stats(self) -> EmitterQueueStats:
+        return EmitterQueueStats(
+            name=self.name,
+            size=self._queue.qsize(),
+            capacity=self._queue.maxsize,
+            delivered=self._delivered,
+            dropped=self._dropped,
+            failed=self._failed,
+        )
+
+    async def put(self, data: Any, event: "EventMeta") -> None:
+        if self._closed:
+            return
+
+        self._ensure_worker()
+        if not self._queue.full():
+            self._queue.put_nowait((data, event))
+        elif self._overflow == "drop_newest":
+            self._dropped += 1
+        elif self._overflow == "drop_oldest":
+            with contextlib.suppress(asyncio.QueueEmpty):
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self._dropped += 1
+            self._queue.put_nowait((data, event))
+        else:
+            await self._queue.put((data, event))
+
+    async def join(self) -> None:
+        """Waits until every queued event has been processed."""
+        await self._queue.join()
+
+    def close(self) -> None:
+        """Stops accepting new events. Already queued events are still delivered."""
+        self._closed = True
+        if self._worker is not None and self._queue.empty():
+            self._worker.cancel()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._work())
+
+    async def _work(self) -> None:
+        while not (self._closed and self._queue.empty()):
+            data, event = await self._queue.get()
+            try:
+                await self._callback(data, event)
+                self._delivered += 1
+            except Exception as e:
+                self._failed += 1
+                logger.error(f"Queued listener for '{event.path}' has failed: {e}")
+            finally:
+                self._queue.task_done()
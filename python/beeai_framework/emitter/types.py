@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Literal, TypeAlias
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+QueueOverflowPolicy: TypeAlias = Literal["drop_oldest", "drop_newest", "block"]
 
 
 class EventTrace(BaseModel):
@@ -27,5 +30,18 @@ class EmitterOptions(BaseModel):
     once: bool | None = None
     persistent: bool | None = None
     match_nested: bool | None = None
+    batch_size: int | None = Field(None, ge=1)
+    batch_interval: float | None = Field(None, gt=0)
+    queue_size: int | None = Field(None, ge=1)
+    queue_overflow: QueueOverflowPolicy | None = None
 
     model_config = ConfigDict(frozen=True)
+
+
+class EmitterQueueStats(BaseModel):
+    name: str
+    size: int
+    capacity: int
+    delivered: int
+    dropped: int
+    failed: int
@@ -13,13 +13,19 @@
 # limitations under the License.
 
 
+import functools
 import re
 
 from beeai_framework.emitter.errors import EmitterError
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_valid_name(name: str) -> bool:
+    return bool(name) and re.match("^[a-zA-Z0-9_]+$", name) is not None
+
+
 def assert_valid_name(name: str) -> None:
-    if not name or not re.match("^[a-zA-Z0-9_]+$", name):
+    if not _is_valid_name(name):
         raise EmitterError(
             f"Event name or a namespace part must contain only letters, numbers or underscores: {name}",
         )
@@ -0,0 +1,262 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import os
+import time
+from types import TracebackType
+from typing import Any, Literal, Self
+
+from pydantic import BaseModel, Field, computed_field
+
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import CleanupFn, Emitter, EmitterOptions, EventMeta
+from beeai_framework.workflows.events import WorkflowErrorEvent, WorkflowStartEvent, WorkflowSuccessEvent
+
+ProfileNodeStatus = Literal["running", "success", "error"]
+
+
+class ProfileNode(BaseModel):
+    """Timing of a single run (agent, chat model, tool, workflow) or workflow step.
+
+    All durations are in seconds. `start` is relative to the moment the profiler has been started.
+    """
+
+    id: str
+    parent_id: str | None = None
+    kind: str
+    name: str
+    status: ProfileNodeStatus = "running"
+    start: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    child_time: float = 0.0
+    children: list["ProfileNode"] = Field(default_factory=list)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def self_time(self) -> float:
+        """Wall time not covered by any child."""
+        return max(self.wall_time - self.child_time, 0.0)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def await_time(self) -> float:
+        """Wall time during which the event loop thread has not been busy with this run (I/O, other tasks)."""
+        return max(self.wall_time - self.cpu_time, 0.0)
+
+
+class _OpenNode:
+    __slots__ = ("cpu_start", "node", "step", "wall_start")
+
+    def __init__(self, node: ProfileNode, wall_start: float, cpu_start: float) -> None:
+        self.node = node
+        self.wall_start = wall_start
+        self.cpu_start = cpu_start
+        self.step: str | None = None
+
+
+class RunProfiler:
+    """Builds a timing tree out of the `run.*` events emitted by `RunContext.enter`.
+
+    Nodes are linked through `EventTrace.run_id` / `parent_run_id`. Workflow steps become nodes of their own, so
+    that runs started from within a step are nested under it.
+
+    CPU time is measured on the event loop thread (`time.thread_time`), so it includes the CPU time of runs that
+    were executing concurrently.
+
+    ```python
+    with RunProfiler() as profiler:
+        await agent.run("Hello!")
+
+    print(profiler.to_collapsed_stacks())
+    ```
+    """
+
+    def __init__(self, emitter: Emitter | None = None) -> None:
+        self._emitter = emitter or Emitter.root()
+        self._cleanup: CleanupFn | None = None
+        self._origin = time.perf_counter()
+        self._open: dict[str, _OpenNode] = {}
+        self._nodes: dict[str, ProfileNode] = {}
+        self.roots: list[ProfileNode] = []
+
+    def start(self) -> None:
+        if self._cleanup is None:
+            self._cleanup = self._emitter.match("*.*", self._on_event, EmitterOptions(is_blocking=True))
+
+    def stop(self) -> None:
+        if self._cleanup is not None:
+            self._cleanup()
+            self._cleanup = None
+
+    def reset(self) -> None:
+        self._origin = time.perf_counter()
+        self._open.clear()
+        self._nodes.clear()
+        self.roots.clear()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _on_event(self, data: Any, event: EventMeta) -> None:
+        if isinstance(event.creator, RunContext):
+            self._on_run_event(event.creator, event)
+        elif isinstance(data, WorkflowStartEvent | WorkflowSuccessEvent | WorkflowErrorEvent) and event.trace:
+            self._on_step_event(data, event.trace.run_id)
+
+    def _on_run_event(self, context: RunContext, event: EventMeta) -> None:
+        if event.name == "start":
+            # nested runs reach the emitter twice (through the instance and through the parent run)
+            if context.run_id in self._nodes:
+                return
+
+            parent = self._open.get(context.parent_id) if context.parent_id else None
+            parent_id = context.parent_id
+            if parent is not None and parent.step is not None:
+                parent_id = parent.step
+
+            self._open_node(
+                ProfileNode(
+                    id=context.run_id,
+                    parent_id=parent_id,
+                    kind=context.emitter.namespace[0] if context.emitter.namespace else "run",
+                    name=_describe_instance(context.instance),
+                )
+            )
+        elif event.name in ("success", "error"):
+            entry = self._open.get(context.run_id)
+            if entry is not None:
+                entry.node.status = "success" if event.name == "success" else "error"
+        elif event.name == "finish":
+            self._close_node(context.run_id)
+
+    def _on_step_event(
+        self,
+        data: WorkflowStartEvent[Any, Any] | WorkflowSuccessEvent[Any, Any] | WorkflowErrorEvent[Any, Any],
+        run_id: str,
+    ) -> None:
+        run = self._open.get(run_id)
+        if run is None:
+            return
+
+        if isinstance(data, WorkflowStartEvent):
+            step_id = f"{run_id}:{len(run.node.children)}"
+            self._open_node(ProfileNode(id=step_id, parent_id=run_id, kind="step", name=str(data.step)))
+            run.step = step_id
+        elif run.step is not None:
+            step = self._open.get(run.step)
+            if step is not None:
+                step.node.status = "success" if isinstance(data, WorkflowSuccessEvent) else "error"
+            self._close_node(run.step)
+            run.step = None
+
+    def _open_node(self, node: ProfileNode) -> None:
+        wall_start = time.perf_counter()
+        node.start = wall_start - self._origin
+        self._open[node.id] = _OpenNode(node, wall_start, time.thread_time())
+        self._nodes[node.id] = node
+
+        parent = self._nodes.get(node.parent_id) if node.parent_id else None
+        if parent is not None:
+            parent.children.append(node)
+        else:
+            self.roots.append(node)
+
+    def _close_node(self, node_id: str) -> None:
+        entry = self._open.pop(node_id, None)
+        if entry is None:
+            return
+
+        node = entry.node
+        node.wall_time = time.perf_counter() - entry.wall_start
+        node.cpu_time = time.thread_time() - entry.cpu_start
+        if entry.step is not None:
+            self._close_node(entry.step)
+
+        parent = self._nodes.get(node.parent_id) if node.parent_id else None
+        if parent is not None:
+            parent.child_time += node.wall_time
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        return [root.model_dump() for root in self.roots]
+
+    def to_json(self, indent: int | None = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_collapsed_stacks(self) -> str:
+        """Exports self times (in microseconds) in the collapsed stack format used by flamegraph tools."""
+        lines: list[str] = []
+
+        def visit(node: ProfileNode, stack: str) -> None:
+            frame = f"{node.kind}:{node.name}".replace(";", ",")
+            stack = f"{stack};{frame}" if stack else frame
+            self_time = round(node.self_time * 1_000_000)
+            if self_time > 0:
+                lines.append(f"{stack} {self_time}")
+            for child in node.children:
+                visit(child, stack)
+
+        for root in self.roots:
+            visit(root, "")
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Exports the tree in the Chrome trace event format (chrome://tracing, Perfetto, Speedscope)."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+
+        def visit(node: ProfileNode, tid: int) -> None:
+            events.append(
+                {
+                    "name": node.name,
+                    "cat": node.kind,
+                    "ph": "X",
+                    "ts": node.start * 1_000_000,
+                    "dur": node.wall_time * 1_000_000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {
+                        "id": node.id,
+                        "status": node.status,
+                        "cpu_time": node.cpu_time,
+                        "await_time": node.await_time,
+                        "self_time": node.self_time,
+                    },
+                }
+            )
+            for child in node.children:
+                visit(child, tid)
+
+        for tid, root in enumerate(self.roots, start=1):
+            visit(root, tid)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _describe_instance(instance: object) -> str:
+    for attribute in ("name", "model_id"):
+        value = getattr(instance, attribute, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(instance).__name__
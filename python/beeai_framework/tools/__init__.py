@@ -14,6 +14,7 @@
 
 
 from beeai_framework.tools.errors import ToolError, ToolInputValidationError
+from beeai_framework.tools.executor import ToolExecutor, ToolExecutorMode
 from beeai_framework.tools.tool import (
     Tool,
     tool,
@@ -25,6 +26,8 @@ __all__ = [
     "StringToolOutput",
     "Tool",
     "ToolError",
+    "ToolExecutor",
+    "ToolExecutorMode",
     "ToolInputValidationError",
     "ToolOutput",
     "tool",
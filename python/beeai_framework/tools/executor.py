@@ -0,0 +1,122 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import contextvars
+import functools
+import pickle
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, ClassVar, Literal, ParamSpec, TypeAlias, TypeVar
+
+from beeai_framework.logger import Logger
+
+logger = Logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+ToolExecutorMode: TypeAlias = Literal["inline", "thread", "process"]
+
+
+class ToolExecutor:
+    """Decides where the blocking (synchronous) work of tools is executed.
+
+    - `inline` runs the work directly on the event loop (blocking it).
+    - `thread` runs the work in a bounded thread pool (context variables are propagated).
+    - `process` runs the work in a bounded process pool. The function and its arguments must be picklable,
+      work that cannot be sent to another process falls back to a thread pool of the same size.
+
+    Pools are created lazily on first use. A tool uses the executor passed via `options={"executor": ...}`,
+    otherwise the global default returned by `ToolExecutor.default()` (a thread pool).
+    """
+
+    _default: ClassVar["ToolExecutor | None"] = None
+
+    def __init__(self, mode: ToolExecutorMode = "thread", *, max_workers: int | None = None) -> None:
+        if mode not in ("inline", "thread", "process"):
+            raise ValueError(f"Unsupported executor mode '{mode}'.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("The 'max_workers' must be greater than zero.")
+
+        self._mode: ToolExecutorMode = mode
+        self._max_workers = max_workers
+        self._pool: Executor | None = None
+        self._fallback_pool: ThreadPoolExecutor | None = None
+        self._unpicklable: set[str] = set()
+
+    @property
+    def mode(self) -> ToolExecutorMode:
+        return self._mode
+
+    @property
+    def max_workers(self) -> int | None:
+        return self._max_workers
+
+    @classmethod
+    def default(cls) -> "ToolExecutor":
+        if cls._default is None:
+            cls._default = ToolExecutor("thread")
+        return cls._default
+
+    @classmethod
+    def set_default(cls, executor: "ToolExecutor") -> None:
+        cls._default = executor
+
+    async def run(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        if self._mode == "inline":
+            return fn(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        if self._mode == "process" and self._is_picklable(fn, args, kwargs):
+            return await loop.run_in_executor(self._get_pool(), functools.partial(fn, *args, **kwargs))
+
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._get_thread_pool(), functools.partial(context.run, fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in (self._pool, self._fallback_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait)
+        self._pool = None
+        self._fallback_pool = None
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            self._pool = (
+                ProcessPoolExecutor(max_workers=self._max_workers)
+                if self._mode == "process"
+                else ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="beeai-tool")
+            )
+        return self._pool
+
+    def _get_thread_pool(self) -> Executor:
+        if self._mode == "thread":
+            return self._get_pool()
+
+        if self._fallback_pool is None:
+            self._fallback_pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="beeai-tool")
+        return self._fallback_pool
+
+    def _is_picklable(self, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+        try:
+            pickle.dumps((fn, args, kwargs))
+            return True
+        except (pickle.PicklingError, TypeError, AttributeError):
+            name = getattr(fn, "__qualname__", repr(fn))
+            if name not in self._unpicklable:
+                self._unpicklable.add(name)
+                logger.warning(f"'{name}' cannot be executed in a separate process, using a thread instead.")
+            return False
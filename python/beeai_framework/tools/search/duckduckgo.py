@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+from typing import Any
+
 from duckduckgo_search import DDGS
 from pydantic import BaseModel, Field
 
@@ -50,8 +52,13 @@ class DuckDuckGoSearchTool(Tool[DuckDuckGoSearchToolInput, ToolRunOptions, DuckD
     description = "Search for online trends, news, current events, real-time information, or research topics."
     input_schema = DuckDuckGoSearchToolInput
 
-    def __init__(self, max_results: int = 10, safe_search: str = DuckDuckGoSearchType.STRICT) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        max_results: int = 10,
+        safe_search: str = DuckDuckGoSearchType.STRICT,
+        options: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(options)
         self.max_results = max_results
         self.safe_search = safe_search
 
@@ -65,7 +72,7 @@ class DuckDuckGoSearchTool(Tool[DuckDuckGoSearchToolInput, ToolRunOptions, DuckD
         self, input: DuckDuckGoSearchToolInput, options: ToolRunOptions | None, context: RunContext
     ) -> DuckDuckGoSearchToolOutput:
         try:
-            results = DDGS().text(input.query, max_results=self.max_results, safesearch=self.safe_search)
+            results = await self._run_in_executor(_search, input.query, self.max_results, self.safe_search)
             search_results: list[SearchToolResult] = [
                 DuckDuckGoSearchToolResult(
                     title=result.get("title") or "", description=result.get("body") or "", url=result.get("href") or ""
@@ -76,3 +83,7 @@ class DuckDuckGoSearchTool(Tool[DuckDuckGoSearchToolInput, ToolRunOptions, DuckD
 
         except Exception as e:
             raise ToolError("Error performing search:") from e
+
+
+def _search(query: str, max_results: int, safe_search: str) -> list[dict[str, str]]:
+    return DDGS().text(query, max_results=max_results, safesearch=safe_search)
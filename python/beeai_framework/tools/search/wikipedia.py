@@ -63,6 +63,9 @@ class WikipediaTool(Tool[WikipediaToolInput, ToolRunOptions, WikipediaToolOutput
     async def _run(
         self, input: WikipediaToolInput, options: ToolRunOptions | None, context: RunContext
     ) -> WikipediaToolOutput:
+        return await self._run_in_executor(self._search, input)
+
+    def _search(self, input: WikipediaToolInput) -> WikipediaToolOutput:
         page_py = self.client.page(input.query)
 
         if not page_py.exists():
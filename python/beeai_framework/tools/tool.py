@@ -18,13 +18,15 @@ import typing
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from functools import cached_property
-from typing import Any, Generic, TypeAlias
+from typing import Any, Generic, ParamSpec, TypeAlias
 
 from pydantic import BaseModel, ConfigDict, ValidationError, create_model
 from typing_extensions import TypeVar
 
 from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.keys import hash_value
 from beeai_framework.cache.null_cache import NullCache
+from beeai_framework.cache.single_flight import SingleFlight
 from beeai_framework.context import Run, RunContext
 from beeai_framework.emitter.emitter import Emitter
 from beeai_framework.errors import FrameworkError
@@ -38,6 +40,7 @@ from beeai_framework.tools.events import (
     ToolSuccessEvent,
     tool_event_types,
 )
+from beeai_framework.tools.executor import ToolExecutor
 from beeai_framework.tools.types import StringToolOutput, ToolOutput, ToolRunOptions
 from beeai_framework.utils.strings import to_safe_word
 
@@ -46,12 +49,15 @@ logger = Logger(__name__)
 TInput = TypeVar("TInput", bound=BaseModel)
 TRunOptions = TypeVar("TRunOptions", bound=ToolRunOptions, default=ToolRunOptions)
 TOutput = TypeVar("TOutput", bound=ToolOutput, default=ToolOutput)
+P = ParamSpec("P")
+T = TypeVar("T")
 
 
 class Tool(Generic[TInput, TRunOptions, TOutput], ABC):
     def __init__(self, options: dict[str, Any] | None = None) -> None:
         self.options: dict[str, Any] | None = options or None
         self.cache = self.options.get("cache", NullCache[TOutput]()) if self.options else NullCache[TOutput]()
+        self.executor: ToolExecutor | None = self.options.get("executor") if self.options else None
 
     @property
     @abstractmethod
@@ -82,12 +88,30 @@ class Tool(Generic[TInput, TRunOptions, TOutput], ABC):
     async def _run(self, input: TInput, options: TRunOptions | None, context: RunContext) -> TOutput:
         pass
 
+    async def _run_in_executor(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Runs blocking work using the tool's executor, or the global default one if the tool has none."""
+        executor = self.executor or ToolExecutor.default()
+        return await executor.run(fn, *args, **kwargs)
+
     def _generate_key(self, input: TInput | dict[str, Any], options: TRunOptions | None = None) -> str:
         options_dict = options.model_dump(exclude_none=True) if options else {}
         options_dict.pop("signal", None)
         options_dict.pop("retry_options", None)
         return BaseCache.generate_key(input, options_dict)
 
+    def cache_digest(self) -> bytes:
+        """Returns a digest of the tool's name, description and input schema, used for building cache keys."""
+        return self._cache_digest
+
+    @cached_property
+    def _cache_digest(self) -> bytes:
+        return hash_value([self.name, self.description, self.input_schema.model_json_schema(mode="validation")])
+
+    @cached_property
+    def _flights(self) -> SingleFlight[TOutput]:
+        # concurrent runs with the same cache key share one execution
+        return SingleFlight()
+
     async def clear_cache(self) -> None:
         await self.cache.clear()
 
@@ -109,17 +133,20 @@ class Tool(Generic[TInput, TRunOptions, TOutput], ABC):
                     error_propagated = False
                     await context.emitter.emit("start", ToolStartEvent(input=validated_input, options=options))
 
-                    if self.cache.enabled:
-                        cache_key = self._generate_key(input, options)
-                        result = await self.cache.get(cache_key)
-                        if result:
-                            return result
+                    if not self.cache.enabled:
+                        return await self._run(validated_input, options, context)
+
+                    cache_key = self._generate_key(input, options)
+                    result = await self.cache.get(cache_key)
+                    if result:
+                        return result
 
-                    result = await self._run(validated_input, options, context)
-                    if self.cache.enabled:
+                    async def run_cached() -> TOutput:
+                        result = await self._run(validated_input, options, context)
                         await self.cache.set(cache_key, result)
+                        return result
 
-                    return result
+                    return await self._flights.do(cache_key, run_cached)
 
                 async def on_error(error: Exception, _: RetryableContext) -> None:
                     nonlocal error_propagated
@@ -230,7 +257,7 @@ def tool(tool_function: Callable[..., Any]) -> "AnyTool":
             if inspect.iscoroutinefunction(tool_function):
                 result = await tool_function(**tool_input_dict)
             else:
-                result = tool_function(**tool_input_dict)
+                result = await self._run_in_executor(tool_function, **tool_input_dict)
 
             if isinstance(result, ToolOutput):
                 return result
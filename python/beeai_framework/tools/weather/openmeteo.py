@@ -107,7 +107,7 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, StringToolOutput]):
     async def _run(
         self, input: OpenMeteoToolInput, options: ToolRunOptions | None, context: RunContext
     ) -> StringToolOutput:
-        params = urlencode(self.get_params(input), doseq=True)
+        params = urlencode(await self._run_in_executor(self.get_params, input), doseq=True)
         logger.debug(f"Using OpenMeteo URL: https://api.open-meteo.com/v1/forecast?{params}")
 
         async with httpx.AsyncClient() as client:
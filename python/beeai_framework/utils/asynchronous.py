@@ -15,7 +15,7 @@
 import asyncio
 import functools
 import inspect
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 from typing import Any, TypeVar
 
 T = TypeVar("T")
@@ -35,6 +35,6 @@ def ensure_async(fn: Callable[..., T | Awaitable[T]]) -> Callable[..., Awaitable
     return wrapper
 
 
-async def to_async_generator(items: list[T]) -> AsyncGenerator[T]:
+async def to_async_generator(items: Iterable[T]) -> AsyncGenerator[T]:
     for item in items:
         yield item
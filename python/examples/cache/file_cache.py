@@ -0,0 +1,37 @@
+import asyncio
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from beeai_framework.cache.file_cache import FileCache
+from beeai_framework.errors import FrameworkError
+
+
+async def main() -> None:
+    path = Path(tempfile.gettempdir()) / "beeai_cache_example.db"
+
+    cache: FileCache[str] = FileCache(
+        path,  # (required) location of the database file, shared by all processes using it
+        max_size=10 * 1024 * 1024,  # (optional) evicts least recently used entries beyond 10 MiB of values
+        ttl=60 * 60,  # (optional) time in seconds after which an entry expires
+    )
+
+    await cache.set("a", "Hello world!")
+    cache.close()
+
+    # data survive the restart of the application
+    reopened: FileCache[str] = FileCache(path)
+    print(await reopened.get("a"))  # Hello world!
+    print(await reopened.size())  # 1
+
+    await reopened.clear()
+    reopened.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except FrameworkError as e:
+        traceback.print_exc()
+        sys.exit(e.explain())
@@ -0,0 +1,37 @@
+import asyncio
+import sys
+import traceback
+
+from beeai_framework.cache import RedisCache, RedisServer
+from beeai_framework.errors import FrameworkError
+
+
+async def main() -> None:
+    # in-process stand-in for a Redis server, use the URL of your Redis instance instead
+    async with RedisServer() as server:
+        cache: RedisCache[str] = RedisCache(
+            server.url,  # (optional, default is redis://localhost:6379/0) URL of the server
+            namespace="app",  # (optional) prefix of the keys, caches with different namespaces do not collide
+            ttl=60 * 60,  # (optional) time in seconds after which an entry expires
+            max_connections=10,  # (optional) size of the connection pool
+        )
+
+        await cache.set("a", "Hello world!")
+        await cache.set_many({"b": "Hello", "c": "world!"})  # sent within a single round trip
+
+        # every client connected to the same server (e.g., other replicas of your application) sees the data
+        other: RedisCache[str] = RedisCache(server.url, namespace="app")
+        print(await other.get("a"))  # Hello world!
+        print(await other.get_many(["b", "c", "d"]))  # ['Hello', 'world!', None]
+        print(await other.size())  # 3
+
+        await cache.close()
+        await other.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except FrameworkError as e:
+        traceback.print_exc()
+        sys.exit(e.explain())
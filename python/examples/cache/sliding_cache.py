@@ -8,7 +8,7 @@ from beeai_framework.errors import FrameworkError
 
 async def main() -> None:
     cache: SlidingCache[int] = SlidingCache(
-        size=3,  # (required) number of items that can be live in the cache at a single moment
+        size=3,  # (optional if max_bytes is set) number of items that can be live in the cache at a single moment
         ttl=1,  # // (optional, default is Infinity) Time in seconds after the element is removed from a cache
     )
 
@@ -0,0 +1,38 @@
+import asyncio
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from beeai_framework.cache import FileCache, SlidingCache, TieredCache
+from beeai_framework.errors import FrameworkError
+
+
+async def main() -> None:
+    shared: FileCache[str] = FileCache(Path(tempfile.gettempdir()) / "beeai_tiered_cache_example.db")
+
+    cache: TieredCache[str] = TieredCache(
+        SlidingCache(size=100),  # (required) fast local cache (L1)
+        shared,  # (required) slower shared or persistent cache (L2), e.g., FileCache or RedisCache
+        write_policy="write_behind",  # (optional, default is write_through) writes to L2 in the background
+        negative_ttl=60,  # (optional) remembers keys missing in both tiers for 60 seconds
+    )
+
+    await cache.set("a", "Hello world!")
+    await cache.flush()  # waits until the values written behind are stored in L2
+
+    print(await cache.get("a"))  # Hello world! (served from L1)
+    print(await cache.get("b"))  # None (looked up in L2)
+    print(await cache.get("b"))  # None (known miss, L2 is not asked again)
+    print(cache.stats)  # l1_hits=1 l2_hits=0 negative_hits=1 misses=1
+
+    await cache.clear()
+    shared.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except FrameworkError as e:
+        traceback.print_exc()
+        sys.exit(e.explain())
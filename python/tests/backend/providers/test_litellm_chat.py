@@ -0,0 +1,92 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+import pytest
+from openai.lib._pydantic import to_strict_json_schema
+from pydantic import BaseModel
+
+from beeai_framework.adapters.litellm import chat
+from beeai_framework.adapters.ollama.backend.chat import OllamaChatModel
+from beeai_framework.backend.message import (
+    AnyMessage,
+    AssistantMessage,
+    MessageTextContent,
+    MessageToolCallContent,
+    SystemMessage,
+    UserMessage,
+)
+from beeai_framework.backend.types import ChatModelInput, ChatModelParameters
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+from beeai_framework.tools import StringToolOutput, Tool
+from beeai_framework.tools.types import ToolRunOptions
+
+"""
+Utility functions and classes
+"""
+
+
+class EchoToolInput(BaseModel):
+    query: str
+
+
+class EchoTool(Tool[EchoToolInput, ToolRunOptions, StringToolOutput]):
+    name = "Echo"
+    description = "Echoes the query."
+    input_schema = EchoToolInput
+
+    def _create_emitter(self) -> Emitter:
+        return Emitter.root().child(namespace=["tool", "echo"], creator=self)
+
+    async def _run(self, input: EchoToolInput, options: ToolRunOptions | None, context: RunContext) -> StringToolOutput:
+        return StringToolOutput(input.query)
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_litellm_transform_input_memoization() -> None:
+    model = OllamaChatModel("llama3.1", settings={"temperature": 0.5})
+    model.config(parameters=ChatModelParameters(max_tokens=10))
+    answer = AssistantMessage("Hello")
+    messages: list[AnyMessage] = [SystemMessage("Be brief."), UserMessage("Hi!"), answer]
+
+    with patch.object(chat, "to_strict_json_schema", wraps=to_strict_json_schema) as schema_generator:
+        first = model._transform_input(ChatModelInput(messages=messages, tools=[EchoTool()], top_k=3))
+        second = model._transform_input(ChatModelInput(messages=messages, tools=[EchoTool()], top_k=3))
+    assert schema_generator.call_count == 1
+    assert first == second
+    assert first["max_tokens"] == 10 and first["temperature"] == 0.5 and first["top_k"] == 3
+    assert first["tools"][0]["function"]["parameters"] is not second["tools"][0]["function"]["parameters"]
+
+    # the returned payload can be adjusted without affecting the memoized one
+    first["messages"][2]["role"] = "user"
+    assert model._transform_input(ChatModelInput(messages=messages))["messages"][2]["role"] == "assistant"
+
+    # a changed content invalidates the memoized payload
+    answer.merge(AssistantMessage([MessageToolCallContent(id="1", tool_name="Echo", args="{}")]))
+    payload = model._transform_input(ChatModelInput(messages=messages))["messages"][2]
+    assert payload["tool_calls"][0]["function"]["name"] == "Echo"
+
+    # so does a content changed in place
+    answer.content[0] = MessageTextContent(text="Goodbye")
+    assert model._transform_input(ChatModelInput(messages=messages))["messages"][2]["content"][0]["text"] == "Goodbye"
+    assert isinstance(answer.content[0], MessageTextContent)
+    answer.content[0].text = "Bye"
+    assert model._transform_input(ChatModelInput(messages=messages))["messages"][2]["content"][0]["text"] == "Bye"
@@ -0,0 +1,174 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+
+import litellm
+import pytest
+import pytest_asyncio
+
+from beeai_framework.adapters.litellm.http_pool import HTTPClientPool, HTTPClientPoolStats
+from beeai_framework.adapters.ollama.backend.chat import OllamaChatModel
+from beeai_framework.backend.message import UserMessage
+
+"""
+Utility functions and classes
+"""
+
+
+class FakeOpenAIServer:
+    """Minimal keep-alive HTTP server answering every request with a chat completion."""
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.connections = 0
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while request_line := await reader.readline():
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                await reader.readexactly(int(headers.get("content-length", 0)))
+
+                self.active_requests += 1
+                self.max_active_requests = max(self.max_active_requests, self.active_requests)
+                await asyncio.sleep(self.delay)
+                self.active_requests -= 1
+
+                body = b"" if request_line.startswith(b"HEAD") else self._completion()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _completion() -> bytes:
+        return json.dumps(
+            {
+                "id": "1",
+                "object": "chat.completion",
+                "created": 1,
+                "model": "llama3.1",
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hi!"}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        ).encode()
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncGenerator[FakeOpenAIServer]:
+    server = FakeOpenAIServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest_asyncio.fixture
+async def pool() -> AsyncGenerator[HTTPClientPool]:
+    previous = HTTPClientPool.shared()
+    pool = HTTPClientPool(max_connections_per_host=2)
+    HTTPClientPool.set_shared(pool)
+    yield pool
+    await pool.close()
+    HTTPClientPool.set_shared(previous)
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_http_client_pool_chat_model(server: FakeOpenAIServer, pool: HTTPClientPool) -> None:
+    model = OllamaChatModel("llama3.1", settings={"base_url": server.url})
+
+    await model.warmup()
+    assert pool.stats == HTTPClientPoolStats(requests=1, new_connections=1)
+
+    for _ in range(3):
+        response = await model.create(messages=[UserMessage("Hello!")])
+        assert response.get_text_content() == "Hi!"
+
+    assert server.connections == 1
+    assert pool.stats == HTTPClientPoolStats(requests=4, new_connections=1, reused_connections=3)
+
+    # the pool belongs to its owner, closing a model keeps the connections of the other ones
+    await model.close()
+    await model.create(messages=[UserMessage("Hello!")])
+    assert server.connections == 1
+
+    await pool.close()
+    await model.create(messages=[UserMessage("Hello!")])
+    assert server.connections == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_http_client_pool_is_opt_in(server: FakeOpenAIServer) -> None:
+    assert HTTPClientPool.shared() is None
+
+    pool = HTTPClientPool()
+    HTTPClientPool.set_shared(pool)
+    model = OllamaChatModel("llama3.1", settings={"base_url": server.url})
+    await model.create(messages=[UserMessage("Hello!")])
+    assert litellm.aclient_session is pool.client
+
+    # disabling the pool gives the process-global session back to LiteLLM
+    HTTPClientPool.set_shared(None)
+    assert litellm.aclient_session is None
+    await pool.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_http_client_pool_per_host_limit(server: FakeOpenAIServer, pool: HTTPClientPool) -> None:
+    server.delay = 0.05
+
+    responses = await asyncio.gather(*(pool.client.post(f"{server.url}/v1/test") for _ in range(6)))
+    assert all(response.status_code == 200 for response in responses)
+    assert server.max_active_requests == 2
+    assert pool.stats.requests == 6
+    assert pool.stats.active_requests == 0
+    assert pool.stats.new_connections == 2
+
+    with pytest.raises(ValueError):
+        HTTPClientPool(max_connections_per_host=0)
@@ -36,14 +36,18 @@ from beeai_framework.backend.message import (
     AnyMessage,
     AssistantMessage,
     CustomMessage,
+    MessageToolCallContent,
     UserMessage,
 )
 from beeai_framework.backend.types import (
+    ChatModelCompactOutput,
     ChatModelInput,
     ChatModelOutput,
     ChatModelStructureInput,
     ChatModelStructureOutput,
+    ChatModelUsage,
 )
+from beeai_framework.cache import UnconstrainedCache
 from beeai_framework.cancellation import AbortSignal
 from beeai_framework.context import RunContext
 from beeai_framework.errors import AbortError
@@ -147,6 +151,85 @@ async def test_chat_model_abort(reverse_words_chat: ChatModel, chat_messages_lis
         )
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_cache(
+    reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def generate_key(*args: Any) -> str:
+        raise AssertionError("Cache key should not be computed when the cache is disabled.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(reverse_words_chat, "_generate_key", generate_key)
+        await reverse_words_chat.create(messages=chat_messages_list)
+
+    reverse_words_chat.config(cache=UnconstrainedCache())
+    first = await reverse_words_chat.create(messages=chat_messages_list)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(reverse_words_chat, "_create", None)
+        second = await reverse_words_chat.create(messages=[*chat_messages_list])
+
+    assert second is first
+    assert await reverse_words_chat.cache.size() == 1
+
+
+@pytest.mark.unit
+def test_chat_model_compact_output() -> None:
+    chunks = [
+        ChatModelOutput(messages=[AssistantMessage("Hello")]),
+        ChatModelOutput(messages=[]),
+        ChatModelOutput(messages=[AssistantMessage(" world!")]),
+        ChatModelOutput(
+            messages=[AssistantMessage(MessageToolCallContent(id="call_1", tool_name="search", args="{}"))],
+            usage=ChatModelUsage(prompt_tokens=1, completion_tokens=3, total_tokens=4),
+            finish_reason="tool_calls",
+        ),
+    ]
+
+    compact = ChatModelCompactOutput.compact(chunks)
+    assert compact is not None
+    assert len(compact.messages) == 1
+    assert compact.get_text_content() == "Hello world!"
+    assert compact.chunk_offsets == [5, 5, 12, 12]
+
+    replayed = list(compact.iter_chunks())
+    assert [chunk.get_text_content() for chunk in replayed] == ["Hello", "", " world!", ""]
+    assert [len(chunk.get_tool_calls()) for chunk in replayed] == [0, 0, 0, 1]
+    assert replayed[-1].usage == chunks[-1].usage
+    assert replayed[-1].finish_reason == "tool_calls"
+
+    assert ChatModelCompactOutput.compact([ChatModelOutput(messages=[UserMessage("Hello")])]) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_stream_cache_replay(
+    reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reverse_words_chat.config(cache=UnconstrainedCache())
+    chunks = [ChatModelOutput(messages=[AssistantMessage(word)]) for word in ["llet ", "em ", "gnihtemos"]]
+
+    async def create_stream(*args: Any) -> AsyncGenerator[ChatModelOutput]:
+        for chunk in chunks:
+            yield chunk
+
+    monkeypatch.setattr(reverse_words_chat, "_create_stream", create_stream)
+    first = await reverse_words_chat.create(messages=chat_messages_list, stream=True)
+
+    cache_key = reverse_words_chat._generate_key(ChatModelInput(messages=chat_messages_list, stream=True))
+    cached_outputs = await reverse_words_chat.cache.get(cache_key)
+    assert cached_outputs is not None
+    [cached] = cached_outputs
+    assert isinstance(cached, ChatModelCompactOutput)
+
+    monkeypatch.setattr(reverse_words_chat, "_create_stream", None)
+    second = await reverse_words_chat.create(messages=chat_messages_list, stream=True)
+
+    assert len(second.messages) == 3
+    assert second.get_text_content() == first.get_text_content() == "llet em gnihtemos"
+
+
 @pytest.mark.unit
 def test_chat_model_from(monkeypatch: pytest.MonkeyPatch) -> None:
     # Ollama with Llama model and base_url specified in code
@@ -0,0 +1,183 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections.abc import AsyncGenerator, Iterator
+from typing import Any
+
+import pytest
+
+from beeai_framework.backend.chat import ChatModel
+from beeai_framework.backend.message import AssistantMessage, UserMessage
+from beeai_framework.backend.types import (
+    ChatModelBatchResult,
+    ChatModelInput,
+    ChatModelOutput,
+    ChatModelStructureInput,
+    ChatModelStructureOutput,
+)
+from beeai_framework.cache import UnconstrainedCache
+from beeai_framework.context import RunContext
+
+"""
+Utility functions and classes
+"""
+
+
+class DelayChatModel(ChatModel):
+    """Answers with the prompt after the number of milliseconds given by the prompt."""
+
+    model_id = "delay_model"
+    provider_id = "ollama"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+        self.batches: list[list[str]] = []
+        self.active = 0
+        self.max_active = 0
+        self.failures: dict[str, BaseException] = {}
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        prompt = input.messages[-1].text
+        self.calls.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(int(prompt) / 1000)
+            if prompt in self.failures:
+                raise self.failures.pop(prompt)
+            return ChatModelOutput(messages=[AssistantMessage(prompt)])
+        finally:
+            self.active -= 1
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        raise NotImplementedError()
+
+
+class NativeBatchChatModel(DelayChatModel):
+    async def _create_batch(self, inputs: list[ChatModelInput], run: RunContext) -> list[ChatModelOutput] | None:
+        prompts = [input.messages[-1].text for input in inputs]
+        self.batches.append(prompts)
+        return [ChatModelOutput(messages=[AssistantMessage(prompt)]) for prompt in prompts]
+
+
+async def collect(results: AsyncGenerator[ChatModelBatchResult]) -> list[ChatModelBatchResult]:
+    return [result async for result in results]
+
+
+def prompts(*delays: int) -> list[ChatModelInput]:
+    return [ChatModelInput(messages=[UserMessage(str(delay))]) for delay in delays]
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_batch_concurrency_and_order() -> None:
+    model = DelayChatModel()
+    inputs = prompts(50, 10, 30, 0, 20, 40)
+
+    results = await collect(model.create_batch(inputs, concurrency=3))
+    assert model.max_active == 3
+    assert sorted(result.index for result in results) == list(range(6))
+    assert [result.index for result in results] != list(range(6))  # streamed as they finish
+    assert all(result.output.get_text_content() == result.input.messages[0].text for result in results if result.output)
+
+    model.max_active = 0
+    results = await collect(model.create_batch(inputs, concurrency=2, ordered=True))
+    assert [result.index for result in results] == list(range(6))
+    assert model.max_active <= 2
+
+    with pytest.raises(ValueError):
+        await collect(model.create_batch(inputs, concurrency=0))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_batch_cache_and_errors() -> None:
+    model = DelayChatModel()
+    model.config(cache=UnconstrainedCache())
+    await model.create(messages=[UserMessage("1")])
+    model.calls.clear()
+    model.failures["2"] = ValueError("Invalid prompt")
+
+    results = await collect(model.create_batch([[UserMessage("1")], *prompts(2, 3)], ordered=True))
+    assert results[0].cached and results[0].output is not None
+    assert results[1].error is not None and results[1].output is None
+    assert "Invalid prompt" in results[1].error.explain()
+    assert results[2].output is not None and not results[2].cached
+    assert sorted(model.calls) == ["2", "3"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_batch_retries_transient_errors() -> None:
+    model = DelayChatModel()
+    model.failures["1"] = TimeoutError("Request timed out")
+
+    (result,) = await collect(model.create_batch(prompts(1), max_retries=1))
+    assert result.output is not None
+    assert model.calls == ["1", "1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_batch_native_endpoint() -> None:
+    model = NativeBatchChatModel()
+    model.config(cache=UnconstrainedCache())
+    await model.create(messages=[UserMessage("0")])
+
+    results = await collect(model.create_batch(prompts(*range(8)), batch_size=3, ordered=True))
+    assert [result.output.get_text_content() for result in results if result.output] == [str(i) for i in range(8)]
+    assert model.batches == [["1", "2", "3"], ["4", "5", "6"], ["7"]]
+    assert await model.cache.size() == 8
+
+    # a chunk never waits for inputs which cannot be dispatched
+    model.batches.clear()
+    await collect(model.create_batch(prompts(*range(10, 15)), batch_size=4, concurrency=2))
+    assert sorted(prompt for batch in model.batches for prompt in batch) == [str(i) for i in range(10, 15)]
+    assert all(len(batch) <= 2 for batch in model.batches)
+
+    # providers without a native endpoint run the inputs one by one
+    fallback = DelayChatModel()
+    results = await collect(fallback.create_batch(prompts(1, 2, 3), batch_size=2))
+    assert len(results) == 3 and len(fallback.calls) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_batch_consumes_lazily() -> None:
+    model = DelayChatModel()
+    pulled = 0
+
+    def inputs() -> Iterator[ChatModelInput]:
+        nonlocal pulled
+        for index in range(1000):
+            pulled += 1
+            yield ChatModelInput(messages=[UserMessage(str(index % 5))])
+
+    results = model.create_batch(inputs(), concurrency=4)
+    async for _ in results:
+        break
+    await results.aclose()
+
+    assert pulled <= 5
+    assert model.active == 0
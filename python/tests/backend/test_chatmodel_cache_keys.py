@@ -0,0 +1,112 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+import pytest
+
+from beeai_framework.agents.react.runners.default.prompts import (
+    SystemPromptTemplateInput,
+    UserPromptTemplate,
+    UserPromptTemplateInput,
+)
+from beeai_framework.agents.react.runners.granite.prompts import GraniteSystemPromptTemplate
+from beeai_framework.agents.tool_calling.prompts import ToolCallingAgentSystemPrompt, ToolCallingAgentSystemPromptInput
+from beeai_framework.backend.cache_keys import exclude_messages, strip_framework_timestamps, strip_patterns
+from beeai_framework.backend.message import AssistantMessage, SystemMessage, UserMessage
+from beeai_framework.backend.types import (
+    ChatModelInput,
+)
+from beeai_framework.cache import UnconstrainedCache
+from tests.backend.utils import CountingChatModel
+
+"""
+Utility functions and classes
+"""
+
+
+def react_prompt(created_at: datetime.datetime) -> UserMessage:
+    return UserMessage(UserPromptTemplate.render(UserPromptTemplateInput(input="Hello!", created_at=created_at)))
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_strip_framework_timestamps() -> None:
+    first = datetime.datetime(2025, 1, 1, 10, 0, tzinfo=datetime.UTC)
+    second = datetime.datetime(2025, 3, 7, 18, 30, 12, tzinfo=datetime.UTC)
+    input = ChatModelInput(
+        messages=[
+            SystemMessage(GraniteSystemPromptTemplate.render(SystemPromptTemplateInput())),
+            SystemMessage(ToolCallingAgentSystemPrompt.render(ToolCallingAgentSystemPromptInput(role="assistant"))),
+            react_prompt(first),
+        ]
+    )
+    normalized = strip_framework_timestamps(input)
+
+    assert "The current date and time is: \n" in normalized.messages[0].text
+    assert "The current date and time is: \n" in normalized.messages[1].text
+    assert normalized.messages[2].text == "Message: Hello!"
+    assert strip_framework_timestamps(ChatModelInput(messages=[react_prompt(second)])).messages[0].text == (
+        "Message: Hello!"
+    )
+
+    # the original messages are kept intact
+    assert "2025-01-01T10:00:00+00:00" in input.messages[2].text
+    assert normalized.messages[2].meta == input.messages[2].meta
+
+    unchanged = ChatModelInput(messages=[UserMessage("Hello!")])
+    assert strip_framework_timestamps(unchanged) is unchanged
+
+
+@pytest.mark.unit
+def test_custom_cache_key_normalizers() -> None:
+    input = ChatModelInput(
+        messages=[
+            SystemMessage("Request ID: 1234"),
+            UserMessage("Request ID: 1234"),
+            AssistantMessage("\n", {"tempMessage": True}),
+        ]
+    )
+
+    normalized = strip_patterns(r"Request ID: \d+", roles=["system"])(input)
+    assert [message.text for message in normalized.messages] == ["", "Request ID: 1234", "\n"]
+
+    normalized = exclude_messages(lambda message: message.meta.get("tempMessage", False))(input)
+    assert [message.text for message in normalized.messages] == ["Request ID: 1234", "Request ID: 1234"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_cache_key_normalizers() -> None:
+    model = CountingChatModel()
+    model.config(cache=UnconstrainedCache())
+
+    first = await model.create(messages=[react_prompt(datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC))])
+    second = await model.create(messages=[react_prompt(datetime.datetime(2025, 1, 2, tzinfo=datetime.UTC))])
+    assert second is first
+    assert model.calls == 1
+
+    model.config(cache_key_normalizers=lambda normalizers: [*normalizers, strip_patterns(r"\s*#\d+")])
+    assert len(model.cache_key_normalizers) == 2
+    await model.create(messages=[UserMessage("Question #1")])
+    await model.create(messages=[UserMessage("Question #2")])
+    assert model.calls == 2
+
+    model.config(cache_key_normalizers=[])
+    await model.create(messages=[react_prompt(datetime.datetime(2025, 1, 3, tzinfo=datetime.UTC))])
+    assert model.calls == 3
@@ -0,0 +1,218 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+
+from beeai_framework.backend.chat import ChatModel
+from beeai_framework.backend.concurrency_limiter import AdaptiveConcurrencyLimiter
+from beeai_framework.backend.errors import ChatModelError, ConcurrencyLimitExceededError
+from beeai_framework.backend.events import ChatModelConcurrencyEvent
+from beeai_framework.backend.message import AssistantMessage, UserMessage
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+    ChatModelStructureInput,
+    ChatModelStructureOutput,
+    ChatModelUsage,
+)
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import EventMeta
+
+"""
+Utility functions and classes
+"""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LoadChatModel(ChatModel):
+    """Simulates a self-hosted backend which times out once more than `capacity` requests are in flight."""
+
+    model_id = "load_model"
+    provider_id = "ollama"
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self.capacity = capacity
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.in_flight > self.capacity:
+                raise TimeoutError("Request timed out")
+            return ChatModelOutput(messages=[AssistantMessage("Hello")])
+        finally:
+            self.in_flight -= 1
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        raise NotImplementedError()
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrency_limiter_aimd() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3, clock=clock)
+
+    first, second = await limiter.acquire(), await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert (limiter.in_flight, limiter.queued) == (2, 1)
+
+    # saturated and flat latency -> additive increase
+    clock.now += 1
+    first.release()
+    second.release()
+    first.release()  # no effect
+    assert limiter._limit == pytest.approx(2.9)
+    third = await waiting
+    assert (limiter.in_flight, limiter.queued) == (1, 0)
+
+    clock.now += 1
+    third.release()  # not all slots were in use
+    assert limiter._limit == pytest.approx(2.9)
+
+    slots = [await limiter.acquire() for _ in range(2)]
+    clock.now += 1
+    for slot in slots:
+        slot.release()
+    assert limiter.limit == 3  # capped by max_limit
+
+    # overload -> multiplicative decrease, only once for the requests sent at the higher limit
+    slots = [await limiter.acquire() for _ in range(3)]
+    clock.now += 1
+    slots[0].release(overloaded=True)
+    slots[1].release(overloaded=True)
+    slots[2].release(success=False)
+    assert limiter._limit == 1.5
+
+    clock.now += 1
+    (await limiter.acquire()).release(overloaded=True)
+    assert limiter.limit == 1
+
+    # failures other than overload do not change the limit
+    clock.now += 1
+    (await limiter.acquire()).release(success=False)
+    assert limiter.limit == 1
+
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrency_limiter_latency() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, clock=clock)
+
+    async def request(latency: float, tokens: int) -> None:
+        slot = await limiter.acquire()
+        clock.now += latency
+        slot.release(usage=ChatModelUsage(prompt_tokens=10, completion_tokens=tokens, total_tokens=10 + tokens))
+
+    await request(1, 100)
+    await request(2, 200)  # the same latency per token
+    assert limiter.limit == 10
+
+    await request(3, 100)
+    assert limiter.limit == 9
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrency_limiter_queue() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue=1)
+
+    slot = await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConcurrencyLimitExceededError):
+        await limiter.acquire()
+    assert limiter.stats.rejected == 1
+
+    waiting.cancel()
+    await asyncio.sleep(0)
+    assert limiter.queued == 0
+    slot.release(success=False)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_concurrency_limiter() -> None:
+    model = LoadChatModel(capacity=6)
+    model.config(concurrency_limiter=AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=20))
+    assert model.concurrency_limiter is not None
+
+    events: list[ChatModelConcurrencyEvent] = []
+
+    def on_concurrency(data: ChatModelConcurrencyEvent, event: EventMeta) -> None:
+        events.append(data)
+
+    model.emitter.on("concurrency", on_concurrency)
+
+    async def request() -> bool:
+        try:
+            await model.create(messages=[UserMessage("Hello")])
+            return True
+        except ChatModelError:
+            return False
+
+    for _ in range(10):
+        await asyncio.gather(*(request() for _ in range(20)))
+
+    stats = model.concurrency_limiter.stats
+    assert stats.overloaded > 0
+    assert stats.completed > 0
+    assert 2 <= stats.limit <= 7
+    assert model.max_in_flight <= 20
+    assert events and events[-1].limit == stats.limit
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_concurrency_queue_events() -> None:
+    model = LoadChatModel(capacity=10)
+    model.config(concurrency_limiter=AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1))
+    events: list[ChatModelConcurrencyEvent] = []
+    model.emitter.on("concurrency", lambda data, event: events.append(data))
+
+    await asyncio.gather(*(model.create(messages=[UserMessage("Hello")]) for _ in range(3)))
+
+    # requests joining and leaving the queue
+    assert [event.queued for event in events] == [1, 2, 1, 0]
+    assert all(event.limit == 1 and event.rejected == 0 for event in events)
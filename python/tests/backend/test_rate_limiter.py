@@ -0,0 +1,229 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.backend.chat import ChatModel
+from beeai_framework.backend.errors import ChatModelError
+from beeai_framework.backend.message import AssistantMessage, UserMessage
+from beeai_framework.backend.rate_limiter import RateLimiter, TokenBucket
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+    ChatModelStructureInput,
+    ChatModelStructureOutput,
+    ChatModelUsage,
+)
+from beeai_framework.context import RunContext
+
+"""
+Utility functions and classes
+"""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after: str) -> None:
+        super().__init__("Too many requests")
+        self.response = type("Response", (), {"headers": {"retry-after": retry_after}})()
+
+
+class Greeting(BaseModel):
+    text: str
+
+
+class UsageChatModel(ChatModel):
+    model_id = "usage_model"
+    provider_id = "ollama"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: list[Exception] = []
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        if self.errors:
+            raise self.errors.pop()
+        return ChatModelOutput(
+            messages=[AssistantMessage("Hello")],
+            usage=ChatModelUsage(prompt_tokens=100, completion_tokens=20, total_tokens=120),
+        )
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        if self.errors:
+            raise self.errors.pop()
+        return ChatModelStructureOutput(object={"text": "Hello"})
+
+
+def request(text: str = "Hello") -> ChatModelInput:
+    return ChatModelInput(messages=[UserMessage(text)])
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_token_bucket() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=20, clock=clock)
+
+    assert bucket.delay(20) == 0
+    bucket.consume(15)
+    assert bucket.delay(10) == pytest.approx(0.5)
+
+    # requests bigger than the bucket wait for a full bucket and leave a debt
+    clock.now += 2
+    assert bucket.delay(50) == 0
+    bucket.consume(50)
+    assert bucket.level == -30
+    assert bucket.delay(1) == pytest.approx(3.1)
+
+    bucket.refund(40)
+    assert bucket.level == 10
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rate_limiter_requests_per_minute() -> None:
+    limiter = RateLimiter(requests_per_minute=1200, headroom=1, burst=0.001)  # 20 requests/s, one at once
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(limiter.acquire(request()) for _ in range(6)))
+    assert time.monotonic() - started_at >= 0.2
+    assert limiter.stats.requests == 6
+    assert limiter.stats.throttled_requests >= 5
+    assert limiter.pending == 0
+
+    with pytest.raises(ValueError):
+        RateLimiter()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rate_limiter_counts_only_throttled_requests() -> None:
+    limiter = RateLimiter(requests_per_minute=60_000, headroom=1, burst=1)
+
+    for _ in range(50):
+        await limiter.acquire(request())
+    assert limiter.stats.requests == 50
+    assert limiter.stats.throttled_requests == 0
+    assert limiter.stats.wait_time == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rate_limiter_is_fair_across_groups() -> None:
+    limiter = RateLimiter(requests_per_minute=3000, headroom=1, burst=0.0001)  # 50 requests/s, one at once
+    admitted: list[str] = []
+
+    async def run(group: str) -> None:
+        await limiter.acquire(request(), group=group)
+        admitted.append(group)
+
+    tasks = [asyncio.create_task(run("a")) for _ in range(6)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(run("b")))
+    await asyncio.gather(*tasks)
+
+    # the group "b" does not wait for the whole backlog of the group "a"
+    assert admitted.index("b") <= 3
+
+    # cancelled requests release their place
+    waiting = [asyncio.create_task(limiter.acquire(request())) for _ in range(3)]
+    await asyncio.sleep(0)
+    waiting[0].cancel()
+    await asyncio.gather(*waiting[1:])
+    assert limiter.pending == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rate_limiter_adapts_to_usage() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=60_000, headroom=1, burst=1, completion_tokens=100, clock=clock)
+
+    input = request("x" * 400)
+    assert limiter.estimate(input) == (200, 400)
+    assert limiter.estimate(ChatModelInput(messages=[UserMessage("x" * 400)], max_tokens=10)) == (110, 400)
+
+    for _ in range(20):
+        permit = await limiter.acquire(input)
+        permit.settle(ChatModelUsage(prompt_tokens=200, completion_tokens=20, total_tokens=220))
+        permit.settle(ChatModelUsage(prompt_tokens=200, completion_tokens=20, total_tokens=220))
+
+    tokens, _ = limiter.estimate(input)
+    assert 215 <= tokens <= 225
+    assert limiter.stats.tokens == 20 * 220
+    assert limiter._tokens is not None and limiter._tokens.level == 60_000 - 20 * 220
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_rate_limiter() -> None:
+    model = UsageChatModel()
+    model.config(rate_limiter=RateLimiter(requests_per_minute=60_000, tokens_per_minute=1_000_000))
+    assert model.rate_limiter is not None
+
+    await model.create(messages=[UserMessage("Hello")])
+    await model.create(messages=[UserMessage("Hello")], stream=True)
+    assert model.rate_limiter.stats.requests == 2
+    assert model.rate_limiter.stats.tokens == 240
+
+    model.errors.append(RateLimitError(retry_after="0.2"))
+    with pytest.raises(ChatModelError):
+        await model.create(messages=[UserMessage("Hello")])
+    assert model.rate_limiter.stats.rate_limit_errors == 1
+
+    started_at = time.monotonic()
+    await model.create(messages=[UserMessage("Hello")])
+    assert time.monotonic() - started_at >= 0.15
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_rate_limiter_wrapped_error() -> None:
+    model = UsageChatModel()
+    model.config(rate_limiter=RateLimiter(requests_per_minute=60_000, tokens_per_minute=1_000_000))
+    assert model.rate_limiter is not None
+
+    model.errors.append(ChatModelError("Structured output failed", cause=RateLimitError(retry_after="0.2")))
+    with pytest.raises(ChatModelError):
+        await model.create_structure(schema=Greeting, messages=[UserMessage("Hello")])
+    assert model.rate_limiter.stats.rate_limit_errors == 1
+
+    started_at = time.monotonic()
+    await model.create_structure(schema=Greeting, messages=[UserMessage("Hello")])
+    assert time.monotonic() - started_at >= 0.15
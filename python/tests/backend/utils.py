@@ -0,0 +1,48 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from beeai_framework.backend.chat import ChatModel
+from beeai_framework.backend.message import AssistantMessage
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+    ChatModelStructureInput,
+    ChatModelStructureOutput,
+)
+from beeai_framework.context import RunContext
+
+
+class CountingChatModel(ChatModel):
+    """Answers every request with a numbered message and counts how many times it was called."""
+
+    model_id = "counting_model"
+    provider_id = "ollama"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        self.calls += 1
+        return ChatModelOutput(messages=[AssistantMessage(f"Answer #{self.calls}")])
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        raise NotImplementedError()
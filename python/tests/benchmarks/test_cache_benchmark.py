@@ -0,0 +1,63 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+
+import pytest
+
+from beeai_framework.backend.message import AnyMessage, AssistantMessage, UserMessage
+from beeai_framework.backend.types import ChatModelCompactOutput, ChatModelInput, ChatModelOutput
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.sliding_cache import estimate_size
+
+"""
+Benchmarks
+"""
+
+
+@pytest.mark.benchmark
+def test_generate_key_growing_conversation() -> None:
+    turns_count = 200
+    messages: list[AnyMessage] = []
+
+    start = time.perf_counter()
+    for turn in range(turns_count):
+        messages.append(UserMessage(f"Question number {turn}: " + "lorem ipsum " * 50))
+        messages.append(AssistantMessage(f"Answer number {turn}: " + "dolor sit amet " * 50))
+        BaseCache.generate_key(ChatModelInput(messages=messages[:], temperature=1), {"abort_signal": None})
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{turns_count} keys of a conversation in {elapsed:.3f}s ({elapsed / turns_count * 1e3:.2f} ms/each)")
+
+
+@pytest.mark.benchmark
+def test_compact_streamed_output() -> None:
+    chunks_count = 2000
+    chunks = [ChatModelOutput(messages=[AssistantMessage(f"token{i} ")]) for i in range(chunks_count)]
+
+    start = time.perf_counter()
+    compact = ChatModelCompactOutput.compact(chunks)
+    compact_elapsed = time.perf_counter() - start
+    assert compact is not None
+
+    start = time.perf_counter()
+    replayed = ChatModelOutput.from_chunks(list(compact.iter_chunks()))
+    replay_elapsed = time.perf_counter() - start
+    assert replayed.get_text_content() == ChatModelOutput.from_chunks(chunks).get_text_content()
+
+    print(
+        f"\n{chunks_count} chunks: {estimate_size(chunks) / 1024:.0f} KiB raw, {estimate_size(compact) / 1024:.0f} KiB"
+        f" compact (compacted in {compact_elapsed * 1e3:.1f} ms, replayed in {replay_elapsed * 1e3:.1f} ms)"
+    )
@@ -0,0 +1,87 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gc
+import time
+
+import pytest
+
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+from beeai_framework.tools import StringToolOutput, tool
+
+"""
+Benchmarks
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_tool_runs_soak() -> None:
+    runs_count = 100_000
+    warmup_count = 1_000
+
+    @tool
+    def echo(query: str) -> str:
+        """Returns the given query."""
+        return query
+
+    for _ in range(warmup_count):
+        await echo.run({"query": "hello"})
+    gc.collect()
+    objects_before = len(gc.get_objects())
+
+    start = time.perf_counter()
+    for _ in range(runs_count):
+        result: StringToolOutput = await echo.run({"query": "hello"})
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    objects_after = len(gc.get_objects())
+
+    print(
+        f"\n{runs_count} tool runs in {elapsed:.3f}s ({elapsed / runs_count * 1e6:.1f} us/run), "
+        f"live objects: {objects_before} -> {objects_after}"
+    )
+    assert result.get_text_content() == "hello"
+    assert len(echo.emitter._children) == 0
+    assert objects_after - objects_before < warmup_count
+
+
+class BenchmarkInstance:
+    def __init__(self) -> None:
+        self.emitter = Emitter.root().child(namespace=["benchmark"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_nested_run_context_enter() -> None:
+    enters_count = 100_000
+    instance = BenchmarkInstance()
+
+    async def inner(context: RunContext) -> int:
+        return 1
+
+    async def outer(context: RunContext) -> int:
+        total = 0
+        for _ in range(enters_count):
+            total += await RunContext.enter(instance, inner)
+        return total
+
+    start = time.perf_counter()
+    total = await RunContext.enter(instance, outer)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{enters_count} nested enters in {elapsed:.3f}s ({elapsed / enters_count * 1e6:.1f} us/enter)")
+    assert total == enters_count
@@ -0,0 +1,102 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+from typing import Any
+
+import pytest
+
+from beeai_framework.emitter import Emitter, EventMeta
+
+"""
+Benchmarks
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_emitter_dispatch_many_listeners() -> None:
+    listeners_count = 1_000
+    events_count = 100_000
+
+    root = Emitter(namespace=["app"])
+    emitter = root.child(namespace=["llm"])
+    calls = 0
+
+    def callback(data: Any, event: EventMeta) -> None:
+        nonlocal calls
+        calls += 1
+
+    for idx in range(listeners_count):
+        emitter.on(f"event_{idx}", callback)
+
+    start = time.perf_counter()
+    for idx in range(events_count):
+        await emitter.emit(f"event_{idx % listeners_count}", idx)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"\nemitted {events_count} events across {listeners_count} listeners in {elapsed:.3f}s "
+        f"({events_count / elapsed:,.0f} events/s)"
+    )
+    assert calls == events_count
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_emitter_emit_without_subscribers() -> None:
+    events_count = 100_000
+
+    emitter = Emitter(namespace=["app"]).child(namespace=["llm"]).child(namespace=["run"])
+
+    start = time.perf_counter()
+    for idx in range(events_count):
+        await emitter.emit("new_token", idx)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nemitted {events_count} unobserved events in {elapsed:.3f}s ({events_count / elapsed:,.0f} events/s)")
+
+
+@pytest.mark.benchmark
+def test_event_meta_creation() -> None:
+    events_count = 100_000
+
+    emitter = Emitter(namespace=["app"], context={"internal": True}).child(namespace=["llm"])
+
+    start = time.perf_counter()
+    for _ in range(events_count):
+        emitter.create_event("new_token")
+    elapsed = time.perf_counter() - start
+
+    print(f"\ncreated {events_count} events in {elapsed:.3f}s ({events_count / elapsed:,.0f} events/s)")
+
+
+@pytest.mark.benchmark
+def test_emitter_listener_registration() -> None:
+    registrations_count = 100_000
+
+    emitter = Emitter(namespace=["app"])
+
+    def callback(data: Any, event: EventMeta) -> None:
+        pass
+
+    start = time.perf_counter()
+    for _ in range(registrations_count):
+        child = emitter.child(namespace=["llm"])
+        child.on("new_token", callback)
+        child.destroy()
+    elapsed = time.perf_counter() - start
+
+    print(f"\nregistered {registrations_count} child emitters in {elapsed:.3f}s")
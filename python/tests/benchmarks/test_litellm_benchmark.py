@@ -0,0 +1,86 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+from pydantic import BaseModel, Field, create_model
+
+from beeai_framework.adapters.ollama.backend.chat import OllamaChatModel
+from beeai_framework.backend.message import AnyMessage, AssistantMessage, SystemMessage, UserMessage
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+from beeai_framework.tools import StringToolOutput, Tool
+from beeai_framework.tools.tool import AnyTool
+from beeai_framework.tools.types import ToolRunOptions
+
+"""
+Utility functions and classes
+"""
+
+
+class SchemaTool(Tool[BaseModel, ToolRunOptions, StringToolOutput]):
+    description = "Does nothing."
+
+    def __init__(self, index: int) -> None:
+        super().__init__()
+        self._name = f"Tool{index}"
+        self._schema = create_model(
+            f"Tool{index}Input",
+            query=(str, Field(description="The query.")),
+            limit=(int, Field(10, description="The maximal number of results.")),
+            filters=(list[str], Field(default_factory=list, description="The filters.")),
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def input_schema(self) -> type[BaseModel]:
+        return self._schema
+
+    def _create_emitter(self) -> Emitter:
+        return Emitter.root().child(namespace=["tool", "schema"], creator=self)
+
+    async def _run(self, input: BaseModel, options: ToolRunOptions | None, context: RunContext) -> StringToolOutput:
+        return StringToolOutput()
+
+
+"""
+Benchmarks
+"""
+
+
+@pytest.mark.benchmark
+def test_litellm_transform_input_agent_loop() -> None:
+    iterations_count = 10
+    model = OllamaChatModel("llama3.1")
+    tools: list[AnyTool] = [SchemaTool(index) for index in range(20)]
+    messages: list[AnyMessage] = [SystemMessage("You are a helpful assistant. " * 50)]
+    for turn in range(100):
+        messages.append(UserMessage(f"Question number {turn}: " + "lorem ipsum " * 50))
+        messages.append(AssistantMessage(f"Answer number {turn}: " + "dolor sit amet " * 50))
+
+    start = time.perf_counter()
+    for iteration in range(iterations_count):
+        messages.append(UserMessage(f"Iteration {iteration}"))
+        model._transform_input(ChatModelInput(messages=messages[:], tools=tools, temperature=1))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"\n{iterations_count} requests ({len(messages)} messages, {len(tools)} tools) transformed in "
+        f"{elapsed * 1e3:.1f} ms ({elapsed / iterations_count * 1e3:.2f} ms/each)"
+    )
@@ -0,0 +1,109 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.backend.message import (
+    AssistantMessage,
+    MessageTextContent,
+    MessageToolResultContent,
+    ToolMessage,
+    UserMessage,
+)
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.tools import tool
+
+"""
+Utility functions and classes
+"""
+
+
+class Options(BaseModel):
+    temperature: float | None = None
+    stop: list[str] | None = None
+
+
+@tool
+def echo(query: str) -> str:
+    """Returns the given query."""
+    return query
+
+
+def text_message(*texts: str) -> AssistantMessage:
+    return AssistantMessage([MessageTextContent(text=text) for text in texts])
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_generate_key_is_canonical() -> None:
+    key = BaseCache.generate_key({"a": 1, "b": {"x": [1, 2], "y": "z"}})
+
+    assert len(key) == 32
+    assert key == BaseCache.generate_key({"b": {"y": "z", "x": [1, 2]}, "a": 1})
+    assert key != BaseCache.generate_key({"a": 1, "b": {"x": [2, 1], "y": "z"}})
+    assert key != BaseCache.generate_key({"a": "1", "b": {"x": [1, 2], "y": "z"}})
+    assert BaseCache.generate_key({"a": ["bc"]}) != BaseCache.generate_key({"a": ["b", "c"]})
+
+
+@pytest.mark.unit
+def test_generate_key_merges_arguments() -> None:
+    assert BaseCache.generate_key(Options(temperature=0.5)) == BaseCache.generate_key({"temperature": 0.5})
+    assert BaseCache.generate_key(Options(temperature=0.5), {"temperature": 1.0}) == BaseCache.generate_key(
+        {"temperature": 1.0}
+    )
+    assert BaseCache.generate_key(Options(), None) == BaseCache.generate_key({})
+
+
+@pytest.mark.unit
+def test_message_digest() -> None:
+    message = AssistantMessage("Hello", meta={"createdAt": 1})
+    digest = message.cache_digest()
+
+    assert digest == AssistantMessage("Hello", meta={"createdAt": 2}).cache_digest()
+    assert digest != UserMessage("Hello").cache_digest()
+    assert message.cache_digest() is digest  # memoized
+
+    message.merge(AssistantMessage(" world"))
+    assert message.cache_digest() != digest
+    assert message.cache_digest() == text_message("Hello", " world").cache_digest()
+
+    # changes made in place drop the memoized digest
+    message.content[1] = MessageTextContent(text=" there")
+    assert message.cache_digest() == text_message("Hello", " there").cache_digest()
+    content = message.content[0]
+    assert isinstance(content, MessageTextContent)
+    content.text = "Hi"
+    assert message.cache_digest() == text_message("Hi", " there").cache_digest()
+
+    # mutable values cannot be tracked, so they are hashed every time
+    tool_message = ToolMessage(MessageToolResultContent(result={"value": 1}, tool_name="echo", tool_call_id="1"))
+    digest = tool_message.cache_digest()
+    tool_message.content[0].result["value"] = 2
+    assert tool_message.cache_digest() != digest
+
+
+@pytest.mark.unit
+def test_generate_key_with_messages_and_tools() -> None:
+    messages = [UserMessage("Hi"), AssistantMessage("Hello")]
+    key = BaseCache.generate_key({"messages": messages, "tools": [echo]})
+
+    assert key == BaseCache.generate_key({"messages": [UserMessage("Hi"), AssistantMessage("Hello")], "tools": [echo]})
+    assert key != BaseCache.generate_key({"messages": messages, "tools": []})
+    assert key != BaseCache.generate_key({"messages": [*messages, UserMessage("Bye")], "tools": [echo]})
@@ -0,0 +1,147 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from beeai_framework.backend.message import AssistantMessage
+from beeai_framework.backend.types import ChatModelOutput, ChatModelUsage
+from beeai_framework.cache import FileCache
+from beeai_framework.tools import StringToolOutput
+
+"""
+Utility functions and classes
+"""
+
+
+def write_entries(path: Path, worker: int, count: int) -> None:
+    async def write() -> None:
+        cache: FileCache[str] = FileCache(path)
+        for i in range(count):
+            await cache.set(f"{worker}-{i}", f"value {worker}-{i}")
+        cache.close()
+
+    asyncio.run(write())
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_file_cache_persists_values(tmp_path: Path) -> None:
+    cache: FileCache[list[ChatModelOutput] | StringToolOutput] = FileCache(tmp_path / "cache.db")
+    output = ChatModelOutput(
+        messages=[AssistantMessage("Hello!")],
+        usage=ChatModelUsage(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+        finish_reason="stop",
+    )
+    await cache.set("llm", [output])
+    await cache.set("tool", StringToolOutput("result"))
+    cache.close()
+
+    reopened: FileCache[list[ChatModelOutput] | StringToolOutput] = FileCache(tmp_path / "cache.db")
+    assert await reopened.size() == 2
+    assert await reopened.has("llm")
+
+    cached_output = await reopened.get("llm")
+    assert isinstance(cached_output, list)
+    assert cached_output[0].get_text_content() == "Hello!"
+    assert cached_output[0].usage == output.usage
+
+    cached_tool_output = await reopened.get("tool")
+    assert isinstance(cached_tool_output, StringToolOutput)
+    assert cached_tool_output.get_text_content() == "result"
+
+    assert await reopened.delete("tool")
+    assert not await reopened.delete("tool")
+    await reopened.clear()
+    assert await reopened.size() == 0
+    assert await reopened.total_size() == 0
+    reopened.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_file_cache_size_eviction(tmp_path: Path) -> None:
+    cache: FileCache[bytes] = FileCache(tmp_path / "cache.db", max_size=3000, compress=False)
+    for i in range(5):
+        await cache.set(f"key{i}", bytes([i]) * 1000)
+
+    assert await cache.total_size() <= 3000
+    assert not await cache.has("key0")
+    assert await cache.get("key4") == bytes([4]) * 1000
+    cache.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_file_cache_overwrite(tmp_path: Path) -> None:
+    cache: FileCache[bytes] = FileCache(tmp_path / "cache.db", max_size=3000, compress=False)
+    for _ in range(5):
+        await cache.set("key", b"x" * 1000)
+
+    size = await cache.total_size()
+    assert 1000 <= size < 1100
+    assert await cache.size() == 1
+
+    # overwrites do not inflate the total size, so live entries are not evicted
+    await cache.set("other", b"y" * 1000)
+    await cache.set("key", b"z" * 10)
+    assert await cache.get("other") == b"y" * 1000
+    assert await cache.total_size() < 1100
+
+    for i in range(3):
+        await cache.set(f"key{i}", bytes([i]) * 1000)
+    assert await cache.total_size() <= 3000
+    assert not await cache.has("other")
+    assert await cache.get("key2") == bytes([2]) * 1000
+    cache.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_file_cache_ttl(tmp_path: Path) -> None:
+    cache: FileCache[str] = FileCache(tmp_path / "cache.db", ttl=0.1)
+    await cache.set("key", "value")
+    assert await cache.get("key") == "value"
+
+    await asyncio.sleep(0.15)
+    assert await cache.get("key") is None
+    assert await cache.size() == 0
+    cache.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_file_cache_multiple_processes(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=write_entries, args=(path, worker, 50)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    cache: FileCache[str] = FileCache(path)
+    assert await cache.size() == 200
+    assert await cache.get("3-49") == "value 3-49"
+    cache.close()
@@ -0,0 +1,75 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from beeai_framework.backend.message import AnyMessage, AssistantMessage, UserMessage
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+)
+from beeai_framework.cache import PrefixCache, SlidingCache
+from tests.backend.utils import CountingChatModel
+
+"""
+Utility functions and classes
+"""
+
+
+def conversation(length: int) -> list[AnyMessage]:
+    return [UserMessage(f"Message {i}") if i % 2 == 0 else AssistantMessage(f"Message {i}") for i in range(length)]
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_prefix_keys() -> None:
+    keys = PrefixCache.generate_prefix_keys(ChatModelInput(messages=conversation(3)))
+
+    assert len(keys) == 3
+    assert keys[:2] == PrefixCache.generate_prefix_keys(ChatModelInput(messages=conversation(2)))
+    assert keys[0] != PrefixCache.generate_prefix_keys(ChatModelInput(messages=conversation(1), temperature=1))[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_prefix_cache_with_chat_model() -> None:
+    cache: PrefixCache[list[ChatModelOutput]] = PrefixCache(SlidingCache(size=10))
+    model = CountingChatModel()
+    model.config(cache=cache)
+
+    await model.create(messages=conversation(2))
+    await model.create(messages=conversation(2))
+    assert model.calls == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    match = await cache.longest_prefix(ChatModelInput(messages=conversation(5)))
+    assert match is not None
+    assert match.length == 2
+    assert match.value[0].get_text_content() == "Answer #1"
+
+    match = await cache.longest_prefix(ChatModelInput(messages=conversation(2)))
+    assert match is not None and match.length == 2
+
+    assert await cache.longest_prefix(ChatModelInput(messages=[UserMessage("Other"), *conversation(2)])) is None
+
+    stats = cache.stats
+    assert (stats.hits, stats.partial_hits, stats.misses, stats.lookups) == (2, 1, 2, 5)
+
+    cache.reset_stats()
+    assert cache.stats.lookups == 0
@@ -0,0 +1,129 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from beeai_framework.backend.message import AssistantMessage
+from beeai_framework.backend.types import ChatModelOutput
+from beeai_framework.cache import CacheError, RedisCache, RedisServer
+
+"""
+Utility functions and classes
+"""
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncGenerator[RedisServer]:
+    async with RedisServer() as server:
+        yield server
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_redis_cache(server: RedisServer) -> None:
+    cache: RedisCache[list[ChatModelOutput]] = RedisCache(server.url)
+    output = ChatModelOutput(messages=[AssistantMessage("Hello world! " * 100)], finish_reason="stop")
+
+    assert await cache.get("llm") is None
+    await cache.set("llm", [output])
+    assert await cache.has("llm")
+    assert await cache.size() == 1
+
+    [cached] = await cache.get("llm") or []
+    assert cached.get_text_content() == output.get_text_content()
+
+    assert await cache.delete("llm")
+    assert not await cache.delete("llm")
+    assert await cache.size() == 0
+    await cache.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_redis_cache_shared_between_clients(server: RedisServer) -> None:
+    first: RedisCache[str] = RedisCache(server.url, ttl=60)
+    second: RedisCache[str] = RedisCache(server.url)
+    other: RedisCache[str] = RedisCache(server.url, namespace="other")
+
+    await first.set("key", "value")
+    await other.set("key", "other value")
+
+    assert await second.get("key") == "value"
+    assert await other.get("key") == "other value"
+
+    await second.clear()
+    assert await first.size() == 0
+    assert await other.size() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_redis_cache_pipelining(server: RedisServer) -> None:
+    cache: RedisCache[int] = RedisCache(server.url, max_connections=2)
+    await cache.set_many({f"key{i}": i for i in range(100)})
+    commands_count = server.commands_count
+
+    assert await cache.get_many(["key1", "missing", "key99"]) == [1, None, 99]
+    assert await cache.delete_many(["key1", "key2", "missing"]) == 2
+    assert server.commands_count == commands_count + 2
+
+    values = await asyncio.gather(*(cache.get(f"key{i}") for i in range(3, 100)))
+    assert values == list(range(3, 100))
+    assert server.connections_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_redis_cache_ttl(server: RedisServer) -> None:
+    cache: RedisCache[str] = RedisCache(server.url, ttl=0.1)
+    await cache.set("short", "value")
+    await cache.set("long", "value", ttl=60)
+
+    await asyncio.sleep(0.2)
+    assert await cache.get("short") is None
+    assert await cache.get("long") == "value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_redis_cache_authentication() -> None:
+    async with RedisServer(password="secret") as server:
+        cache: RedisCache[str] = RedisCache(server.url.replace("/0", "/1"))
+        await cache.set("key", "value")
+        assert await cache.get("key") == "value"
+
+        unauthorized: RedisCache[str] = RedisCache(server.url.replace("secret", "wrong"))
+        with pytest.raises(CacheError):
+            await unauthorized.get("key")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_redis_cache_unavailable_server() -> None:
+    async with RedisServer() as server:
+        url = server.url
+
+    cache: RedisCache[str] = RedisCache(url, timeout=1)
+    with pytest.raises(CacheError, match="unavailable"):
+        await cache.get("key")
@@ -0,0 +1,221 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from beeai_framework.backend.message import (
+    AnyMessage,
+    AssistantMessage,
+    MessageToolCallContent,
+    MessageToolResultContent,
+    SystemMessage,
+    ToolMessage,
+    UserMessage,
+)
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+)
+from beeai_framework.cache import (
+    BruteForceIndex,
+    HNSWIndex,
+    SemanticCache,
+    SemanticCacheStats,
+    VectorIndex,
+    ngram_embedding,
+)
+from beeai_framework.cache.vector_index import normalize_vector
+from tests.backend.utils import CountingChatModel
+
+"""
+Utility functions and classes
+"""
+
+
+def random_vectors(count: int, dimensions: int, seed: int = 42) -> dict[str, list[float]]:
+    generator = random.Random(seed)
+    return {f"v{index}": normalize_vector([generator.gauss(0, 1) for _ in range(dimensions)]) for index in range(count)}
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("index", [BruteForceIndex(), HNSWIndex(m=8, seed=1)])
+def test_vector_index(index: VectorIndex) -> None:
+    vectors = random_vectors(300, 16)
+    for id, vector in vectors.items():
+        index.add(id, vector)
+    assert len(index) == 300
+
+    for id in ["v0", "v150", "v299"]:
+        (match_id, similarity), *_ = index.search(vectors[id], 3)
+        assert match_id == id
+        assert similarity == pytest.approx(1, abs=1e-5)
+
+    for id in list(vectors)[:200]:
+        assert index.remove(id)
+    assert not index.remove("v0")
+    assert len(index) == 100
+
+    for id in ["v200", "v250", "v299"]:
+        assert index.search(vectors[id], 1)[0][0] == id
+    assert all(id not in {"v0", "v1"} for id, _ in index.search(vectors["v0"], 10))
+
+
+@pytest.mark.unit
+def test_hnsw_index_recall() -> None:
+    vectors = random_vectors(500, 16)
+    queries = list(random_vectors(50, 16, seed=7).values())
+    exact, approximate = BruteForceIndex(), HNSWIndex(m=8, seed=1)
+    for id, vector in vectors.items():
+        exact.add(id, vector)
+        approximate.add(id, vector)
+
+    found = sum(
+        len({id for id, _ in exact.search(query, 5)} & {id for id, _ in approximate.search(query, 5)})
+        for query in queries
+    )
+    assert found / (len(queries) * 5) >= 0.9
+
+
+@pytest.mark.unit
+def test_ngram_embedding() -> None:
+    def similarity(first: str, second: str) -> float:
+        vectors = normalize_vector(ngram_embedding(first)), normalize_vector(ngram_embedding(second))
+        return sum(a * b for a, b in zip(*vectors, strict=True))
+
+    assert similarity("What is the capital of France?", "what is the capital of france?") == pytest.approx(1)
+    assert similarity("What is the capital of France?", "What's the capital of France?") > 0.8
+    assert similarity("What is the capital of France?", "Write a haiku about the sea.") < 0.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_semantic_cache_chat_model() -> None:
+    model = CountingChatModel()
+    cache: SemanticCache[list[ChatModelOutput]] = SemanticCache(threshold=0.9)
+    model.config(cache=cache)
+
+    first = await model.create(
+        messages=[SystemMessage("Be brief."), UserMessage("What is the capital of France? (2025-01-01T10:00:00Z)")]
+    )
+    second = await model.create(
+        messages=[SystemMessage("Be  brief."), UserMessage("What is the capital of France?\n(2025-03-07T18:30:12Z)")]
+    )
+    assert second.get_text_content() == first.get_text_content()
+    assert model.calls == 1
+
+    third = await model.create(messages=[SystemMessage("Be brief."), UserMessage("Write a haiku about the sea.")])
+    assert third.get_text_content() != first.get_text_content()
+
+    # parameters other than messages have to match exactly
+    await model.create(messages=[SystemMessage("Be brief."), UserMessage("What is the capital of France?")], top_k=1)
+    assert model.calls == 3
+
+    assert cache.stats == SemanticCacheStats(semantic_matches=1, misses=3)
+    assert await cache.size() == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_semantic_cache_does_not_mix_up_prompts() -> None:
+    system = SystemMessage(
+        "You are a helpful assistant. Answer concisely and truthfully, and say you don't know when unsure."
+    )
+    model = CountingChatModel()
+    model.config(cache=SemanticCache())
+
+    for first, second in [
+        ("What is the capital of France?", "What is the capital of Spain?"),
+        ("Transfer $100 to Alice", "Transfer $900 to Alice"),
+        ("Answer yes", "Answer no"),
+    ]:
+        calls = model.calls
+        await model.create(messages=[system, UserMessage(first)])
+        await model.create(messages=[system, UserMessage(second)])
+        assert model.calls == calls + 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_semantic_cache_tool_conversations_match_exactly() -> None:
+    def conversation(city: str, temperature: str) -> list[AnyMessage]:
+        return [
+            UserMessage("What is the weather like?"),
+            AssistantMessage(MessageToolCallContent(id="1", tool_name="weather", args=f'{{"city": "{city}"}}')),
+            ToolMessage(MessageToolResultContent(result=temperature, tool_name="weather", tool_call_id="1")),
+        ]
+
+    model = CountingChatModel()
+    cache: SemanticCache[list[ChatModelOutput]] = SemanticCache(threshold=0.5)
+    model.config(cache=cache)
+
+    first = await model.create(messages=conversation("Paris", "20C"))
+    assert (await model.create(messages=conversation("Paris", "-5C"))).get_text_content() != first.get_text_content()
+    assert (await model.create(messages=conversation("Tokyo", "20C"))).get_text_content() != first.get_text_content()
+    assert (await model.create(messages=conversation("Paris", "20C"))).get_text_content() == first.get_text_content()
+
+    assert model.calls == 3
+    assert cache.stats == SemanticCacheStats(exact_matches=1, misses=3)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_semantic_cache_matches_only_cached_outputs() -> None:
+    cache: SemanticCache[str] = SemanticCache(threshold=0.9)
+    first, second = (
+        ChatModelInput(messages=[UserMessage("What is the capital of France?")]),
+        ChatModelInput(messages=[UserMessage("what is the capital of france")]),
+    )
+    first_key, second_key = cache.generate_key(first), cache.generate_key(second)
+
+    # the output of the first conversation is not stored yet (e.g., still being generated or failed)
+    assert await cache.resolve_key(first, first_key) == first_key
+    assert await cache.resolve_key(second, second_key) == second_key
+
+    await cache.set(first_key, "Paris")
+    assert await cache.resolve_key(second, second_key) == first_key
+
+    # evicted in the wrapped cache
+    await cache._cache.delete(first_key)
+    assert await cache.resolve_key(second, second_key) == second_key
+    assert cache.stats == SemanticCacheStats(semantic_matches=1, misses=3)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_semantic_cache_capacity() -> None:
+    cache: SemanticCache[str] = SemanticCache(capacity=2)
+    inputs = [ChatModelInput(messages=[UserMessage(text)]) for text in ["First question", "Second one", "Third"]]
+    for input in inputs:
+        key = cache.generate_key(input)
+        assert await cache.resolve_key(input, key) == key
+        await cache.set(key, "value")
+
+    assert cache.stats == SemanticCacheStats(misses=3)
+
+    # the oldest conversation is not indexed anymore, but it is still cached under its exact key
+    assert await cache.resolve_key(inputs[0], cache.generate_key(inputs[0])) == cache.generate_key(inputs[0])
+    assert cache.stats.exact_matches == 1
+
+    await cache.clear()
+    assert await cache.size() == 0
+
+    with pytest.raises(ValueError):
+        SemanticCache(threshold=2)
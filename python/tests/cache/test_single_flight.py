@@ -0,0 +1,297 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.backend.chat import ChatModel
+from beeai_framework.backend.message import AssistantMessage, UserMessage
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+    ChatModelStructureInput,
+    ChatModelStructureOutput,
+)
+from beeai_framework.cache import SingleFlight, UnconstrainedCache
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+from beeai_framework.tools import StringToolOutput, Tool
+from beeai_framework.tools.types import ToolRunOptions
+
+"""
+Utility functions and classes
+"""
+
+
+class SlowChatModel(ChatModel):
+    model_id = "slow_model"
+    provider_id = "ollama"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return ChatModelOutput(messages=[AssistantMessage("Hello world!")])
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        self.calls += 1
+        for word in ["Hello", " ", "world!"]:
+            await asyncio.sleep(0.02)
+            yield ChatModelOutput(messages=[AssistantMessage(word)])
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        raise NotImplementedError()
+
+
+class SlowToolInput(BaseModel):
+    query: str
+
+
+class SlowTool(Tool[SlowToolInput, ToolRunOptions, StringToolOutput]):
+    name = "Slow"
+    description = "Echoes the query after a while."
+    input_schema = SlowToolInput
+
+    def __init__(self, options: dict[str, Any] | None = None) -> None:
+        super().__init__(options)
+        self.calls = 0
+
+    def _create_emitter(self) -> Emitter:
+        return Emitter.root().child(namespace=["tool", "slow"], creator=self)
+
+    async def _run(self, input: SlowToolInput, options: ToolRunOptions | None, context: RunContext) -> StringToolOutput:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return StringToolOutput(input.query)
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_coalesces_calls() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0.01)
+        return call
+
+    results = await asyncio.gather(*(flights.do("key", work) for _ in range(10)), flights.do("other", work))
+
+    assert results == [1] * 10 + [2]
+    assert calls == 2
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_shares_errors() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(flights.do("key", work) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_survives_leader_cancellation() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+    started = asyncio.Event()
+
+    async def work() -> str:
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flights.do("key", work))
+    await started.wait()
+    follower = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_cancels_abandoned_work() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def work() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    caller = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0.01)
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert "key" not in flights
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_restarts_after_leader_abort() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+    started = asyncio.Event()
+    leader_aborted = asyncio.Event()
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await leader_aborted.wait()
+            raise ValueError("aborted by the leader")
+        await asyncio.sleep(0.01)
+        return "done"
+
+    leader = asyncio.create_task(flights.do("key", work))
+    await started.wait()
+    follower = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    leader_aborted.set()
+
+    assert await follower == "done"
+    assert calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_stream_restarts_after_leader_abort() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    leader_aborted = asyncio.Event()
+    calls = 0
+
+    async def produce() -> AsyncGenerator[int]:
+        nonlocal calls
+        calls += 1
+        first = calls == 1
+        for i in range(4):
+            if first and i == 2:
+                await leader_aborted.wait()
+                raise ValueError("aborted by the leader")
+            await asyncio.sleep(0.01)
+            yield i
+
+    async def lead() -> list[int]:
+        return [chunk async for chunk in flights.stream("key", produce)]
+
+    leader = asyncio.create_task(lead())
+    await asyncio.sleep(0.015)
+    follower = asyncio.create_task(lead())
+    await asyncio.sleep(0.02)
+    leader.cancel()
+    await asyncio.sleep(0)
+    leader_aborted.set()
+
+    assert await follower == [0, 1, 2, 3]
+    assert calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_stream_replay() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def produce() -> AsyncGenerator[int]:
+        nonlocal calls
+        calls += 1
+        for i in range(5):
+            await asyncio.sleep(0.01)
+            yield i
+
+    async def consume(delay: float) -> list[int]:
+        await asyncio.sleep(delay)
+        return [chunk async for chunk in flights.stream("key", produce)]
+
+    results = await asyncio.gather(consume(0), consume(0.025), consume(0.04))
+
+    assert list(results) == [[0, 1, 2, 3, 4]] * 3
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_coalescing() -> None:
+    model = SlowChatModel()
+    model.config(cache=UnconstrainedCache())
+
+    outputs = await asyncio.gather(*(model.create(messages=[UserMessage("Hello!")]) for _ in range(20)))
+    assert model.calls == 1
+    assert all(output.get_text_content() == "Hello world!" for output in outputs)
+
+    outputs = await asyncio.gather(*(model.create(messages=[UserMessage("Hi!")], stream=True) for _ in range(20)))
+    assert model.calls == 2
+    assert all(output.get_text_content() == "Hello world!" for output in outputs)
+    assert await model.cache.size() == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_without_cache_is_not_coalesced() -> None:
+    model = SlowChatModel()
+
+    await asyncio.gather(*(model.create(messages=[UserMessage("Hello!")]) for _ in range(3)))
+    assert model.calls == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tool_coalescing() -> None:
+    tool = SlowTool({"cache": UnconstrainedCache()})
+
+    outputs = await asyncio.gather(*(tool.run({"query": "Hello"}) for _ in range(20)))
+
+    assert tool.calls == 1
+    assert all(output.get_text_content() == "Hello" for output in outputs)
@@ -18,7 +18,7 @@ import asyncio
 import pytest
 import pytest_asyncio
 
-from beeai_framework.cache.sliding_cache import SlidingCache
+from beeai_framework.cache.sliding_cache import SlidingCache, SlidingCacheStats, estimate_size
 
 
 @pytest_asyncio.fixture
@@ -101,3 +101,76 @@ async def test_cache_timed(timed_cache: SlidingCache[str]) -> None:
     assert await timed_cache.size() == 3
     await asyncio.sleep(3)
     assert await timed_cache.size() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_ttl_per_entry(sized_cache: SlidingCache[str]) -> None:
+    await sized_cache.set("key4", "value4", ttl=0.1)
+    assert await sized_cache.get("key4") == "value4"
+
+    await asyncio.sleep(0.2)
+    assert await sized_cache.get("key4") is None
+    assert await sized_cache.size() == 3
+    assert sized_cache.stats.expirations == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_max_bytes() -> None:
+    cache: SlidingCache[str] = SlidingCache(max_bytes=10, sizer=len)
+    await cache.set("a", "1234")
+    await cache.set("b", "1234")
+    assert await cache.get("a") == "1234"
+
+    await cache.set("c", "1234")  # evicts the least recently used entry ("b")
+    assert await cache.has("a")
+    assert await cache.has("b") is False
+    assert await cache.has("c")
+
+    await cache.set("a", "12345678901")  # larger than the whole cache
+    assert await cache.has("a") is False
+
+    assert cache.stats == SlidingCacheStats(hits=1, misses=0, evictions=2, entries=1, bytes=4)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_stats(sized_cache: SlidingCache[str]) -> None:
+    await sized_cache.get("key1")
+    await sized_cache.get("key0")
+    await sized_cache.set("key4", "value4")
+    await sized_cache.set("key5", "value5")
+
+    stats = sized_cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 1, 1, 4)
+    assert stats.bytes == 0
+
+    sized_cache.reset_stats()
+    assert sized_cache.stats.hits == 0
+    assert sized_cache.stats.entries == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_sizes_entries_only_when_needed() -> None:
+    sizes: list[str] = []
+
+    def sizer(value: str) -> int:
+        sizes.append(value)
+        return len(value)
+
+    cache: SlidingCache[str] = SlidingCache(size=4, sizer=sizer)
+    await cache.set("key1", "value1")
+    assert sizes == ["value1"]
+    assert cache.stats.bytes == 6
+
+    cache = SlidingCache(max_bytes=1024)
+    await cache.set("key1", "value1")
+    assert cache.stats.bytes == estimate_size("value1")
+
+
+@pytest.mark.unit
+def test_cache_requires_limit() -> None:
+    with pytest.raises(ValueError):
+        SlidingCache()
@@ -0,0 +1,122 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+
+import pytest
+
+from beeai_framework.cache import SlidingCache, TieredCache, TieredCacheStats, UnconstrainedCache
+
+"""
+Utility functions and classes
+"""
+
+
+class SlowCache(UnconstrainedCache[str]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+        self.sets = 0
+
+    async def get(self, key: str) -> str | None:
+        self.gets += 1
+        return await super().get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.sleep(0.01)
+        self.sets += 1
+        await super().set(key, value)
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_cache_read_through() -> None:
+    l2 = SlowCache()
+    await l2.set("key", "value")
+    cache: TieredCache[str] = TieredCache(SlidingCache(size=10), l2)
+
+    assert await cache.get("key") == "value"
+    assert await cache.get("key") == "value"
+    assert await cache.l1.has("key")
+    assert l2.gets == 1
+    assert cache.stats == TieredCacheStats(l1_hits=1, l2_hits=1)
+
+    cache = TieredCache(SlidingCache(size=10), l2, promote=False)
+    assert await cache.get("key") == "value"
+    assert not await cache.l1.has("key")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_cache_write_through() -> None:
+    l2 = SlowCache()
+    cache: TieredCache[str] = TieredCache(SlidingCache(size=10), l2)
+
+    await cache.set("key", "value")
+    assert await cache.l1.get("key") == "value"
+    assert await l2.get("key") == "value"
+
+    assert await cache.delete("key")
+    assert not await cache.has("key")
+    assert await cache.size() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_cache_write_behind() -> None:
+    l2 = SlowCache()
+    cache: TieredCache[str] = TieredCache(SlidingCache(size=1), l2, write_policy="write_behind")
+
+    await cache.set("a", "1")
+    await cache.set("b", "2")  # evicts "a" from L1 before it is written to L2
+    await cache.set("b", "3")
+    assert l2.sets == 0
+    assert await cache.get("a") == "1"
+    assert await cache.has("b")
+
+    await cache.flush()
+    assert await l2.get("a") == "1"
+    assert await l2.get("b") == "3"
+    assert l2.sets == 2  # pending writes of the same key are coalesced
+    assert await cache.size() == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_cache_negative_caching() -> None:
+    l2 = SlowCache()
+    cache: TieredCache[str] = TieredCache(SlidingCache(size=10), l2, negative_ttl=60)
+
+    assert await cache.get("key") is None
+    assert await cache.get("key") is None
+    assert not await cache.has("key")
+    assert l2.gets == 1
+    assert cache.stats == TieredCacheStats(negative_hits=1, misses=1)
+
+    await cache.set("key", "value")
+    await cache.l1.clear()
+    assert await cache.get("key") == "value"
+    assert l2.gets == 2
+
+
+@pytest.mark.unit
+def test_tiered_cache_invalid_policy() -> None:
+    with pytest.raises(ValueError):
+        TieredCache(SlidingCache(size=10), UnconstrainedCache(), write_policy="write_around")  # type: ignore[arg-type]
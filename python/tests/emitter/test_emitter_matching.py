@@ -0,0 +1,253 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import gc
+import re
+from typing import Any
+
+import pytest
+
+from beeai_framework.emitter import Emitter, EmitterError, EmitterOptions, EventMeta, EventTrace
+from beeai_framework.emitter.matchers import compile_matcher
+from beeai_framework.emitter.types import QueueOverflowPolicy
+
+"""
+Utility functions and classes
+"""
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    def __call__(self, data: Any, event: EventMeta) -> None:
+        self.events.append(event.path)
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_emitter_matchers() -> None:
+    emitter = Emitter(namespace=["app"])
+    by_name, by_path, instance, nested, regex, fn = (Recorder() for _ in range(6))
+
+    emitter.on("update", by_name)
+    emitter.on("app.llm.update", by_path)
+    emitter.match("*", instance)
+    emitter.match("*.*", nested)
+    emitter.match(re.compile(r"app\.llm\."), regex)
+    emitter.match(lambda event: event.name == "start", fn)
+
+    child = emitter.child(namespace=["llm"])
+    await emitter.emit("update", None)
+    await emitter.emit("start", None)
+    await child.emit("update", None)
+
+    assert by_name.events == ["app.update"]
+    assert by_path.events == []
+    assert instance.events == ["app.update", "app.start"]
+    assert nested.events == ["app.update", "app.start", "llm.app.update"]
+    assert regex.events == []
+    assert fn.events == ["app.start"]
+
+    nested_emitter = Emitter(namespace=["app", "llm"])
+    nested_emitter.pipe(emitter)
+    await nested_emitter.emit("update", None)
+
+    assert by_path.events == ["app.llm.update"]
+    assert regex.events == ["app.llm.update"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_emitter_cleanup() -> None:
+    emitter = Emitter(namespace=["app"])
+    recorder = Recorder()
+
+    cleanup = emitter.on("update", recorder)
+    emitter.on("start", recorder, EmitterOptions(once=True))
+
+    await emitter.emit("start", None)
+    await emitter.emit("start", None)
+    await emitter.emit("update", None)
+    cleanup()
+    await emitter.emit("update", None)
+
+    assert recorder.events == ["app.start", "app.update"]
+    assert len(emitter.listeners) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_emitter_skips_events_without_subscribers(monkeypatch: pytest.MonkeyPatch) -> None:
+    root = Emitter(namespace=["app"])
+    child = root.child(namespace=["llm"])
+    created: list[str] = []
+    original_create_event = child.create_event
+
+    def create_event(name: str) -> EventMeta:
+        created.append(name)
+        return original_create_event(name)
+
+    monkeypatch.setattr(child, "create_event", create_event)
+
+    await child.emit("new_token", None)
+    assert created == []
+
+    recorder = Recorder()
+    cleanup = root.on("llm.app.new_token", recorder)
+    await child.emit("new_token", None)
+    await child.emit("finish", None)
+    assert created == ["new_token"]
+    assert recorder.events == ["llm.app.new_token"]
+
+    cleanup()
+    root.match("*.*", recorder)
+    await child.emit("finish", None)
+    assert created == ["new_token", "finish"]
+
+    root.destroy()
+    await child.emit("finish", None)
+    assert created == ["new_token", "finish"]
+
+
+@pytest.mark.unit
+def test_event_meta_lazy_attributes() -> None:
+    emitter = Emitter(namespace=["app"], context={"user": "alice"}, trace=EventTrace(id="g", run_id="r"))
+    event = emitter.create_event("update")
+
+    assert event.path == "app.update"
+    assert event.id == event.id
+    assert event.created_at.tzinfo is not None
+    assert event.context == {"user": "alice"}
+    assert event.context is not emitter.context
+    assert event.trace == emitter.trace
+    assert event.trace is not emitter.trace
+
+
+@pytest.mark.unit
+def test_compiled_matchers_are_shared() -> None:
+    first = compile_matcher("update", ["app", "llm"])
+    assert compile_matcher("update", ["app", "llm"]) is first
+    assert compile_matcher("update", ["app"]) is not first
+    assert compile_matcher("app.llm.update", ["other"]) is compile_matcher("app.llm.update", [])
+    assert compile_matcher(re.compile("app"), ["a"]) is compile_matcher(re.compile("app"), ["b"])
+    assert first.kind == "exact"
+    assert first.key == "app.llm.update"
+
+    with pytest.raises(EmitterError):
+        compile_matcher(123, [])  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_emitter_batched_delivery() -> None:
+    emitter = Emitter(namespace=["app"])
+    batches: list[list[Any]] = []
+
+    def on_batch(batch: list[tuple[Any, EventMeta]], event: EventMeta) -> None:
+        assert event is batch[-1][1]
+        batches.append([data for data, _ in batch])
+
+    emitter.on("new_token", on_batch, EmitterOptions(batch_size=3))
+    for idx in range(7):
+        await emitter.emit("new_token", idx)
+    assert batches == [[0, 1, 2], [3, 4, 5]]
+
+    await emitter.emit("finish", None)
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_emitter_batched_delivery_interval() -> None:
+    emitter = Emitter(namespace=["app"])
+    batches: list[list[Any]] = []
+
+    async def on_batch(batch: list[tuple[Any, EventMeta]], event: EventMeta) -> None:
+        batches.append([data for data, _ in batch])
+
+    emitter.on("new_token", on_batch, EmitterOptions(batch_interval=0.05))
+    await emitter.emit("new_token", 1)
+    await emitter.emit("new_token", 2)
+    assert batches == []
+
+    await asyncio.sleep(0.1)
+    assert batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "overflow,expected",
+    [("drop_oldest", [0, 3, 4]), ("drop_newest", [0, 1, 2]), ("block", [0, 1, 2, 3, 4])],
+)
+async def test_emitter_queued_delivery(overflow: QueueOverflowPolicy, expected: list[int]) -> None:
+    emitter = Emitter(namespace=["app"])
+    received: list[int] = []
+    release = asyncio.Event()
+
+    async def slow_listener(data: int, event: EventMeta) -> None:
+        await release.wait()
+        received.append(data)
+
+    emitter.on("new_token", slow_listener, EmitterOptions(queue_size=2, queue_overflow=overflow))
+
+    async def produce() -> None:
+        for idx in range(5):
+            await emitter.emit("new_token", idx)
+            await asyncio.sleep(0)
+
+    producer = asyncio.create_task(produce())
+    await asyncio.sleep(0.01)
+    assert producer.done() is (overflow != "block")
+
+    release.set()
+    await producer
+    await asyncio.sleep(0.01)
+
+    [stats] = emitter.queue_stats()
+    assert received == expected
+    assert stats.name == "new_token"
+    assert stats.delivered == len(expected)
+    assert stats.dropped == 5 - len(expected)
+
+
+@pytest.mark.unit
+def test_emitter_children_are_tracked_weakly() -> None:
+    parent = Emitter(namespace=["app"])
+
+    child = parent.child(namespace=["llm"])
+    grandchild = child.child(namespace=["run"])
+    assert set(parent._children) == {child}
+
+    child.destroy()
+    assert len(parent._children) == 0
+    assert len(grandchild._index.pipes) == 0
+
+    for _ in range(100):
+        parent.child(namespace=["tool"])
+    gc.collect()
+    assert len(parent._children) == 0
+    assert parent.cleanups == []
+
+    child = parent.child(namespace=["llm"])
+    parent.destroy()
+    assert len(child._index.pipes) == 0
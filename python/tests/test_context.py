@@ -0,0 +1,130 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import time
+
+import pytest
+
+from beeai_framework.cancellation import AbortSignal
+from beeai_framework.context import RunContext, storage
+from beeai_framework.emitter import Emitter
+from beeai_framework.errors import AbortError
+
+"""
+Utility functions and classes
+"""
+
+
+class Instance:
+    def __init__(self) -> None:
+        self.emitter = Emitter.root().child(namespace=["test"])
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_run_context_storage() -> None:
+    instance = Instance()
+
+    async def inner(context: RunContext) -> str:
+        assert storage.get() is context
+        return context.run_id
+
+    async def outer(context: RunContext) -> tuple[str, str]:
+        inner_run_id = await RunContext.enter(instance, inner)
+        assert storage.get() is context
+        return context.run_id, inner_run_id
+
+    outer_run_id, inner_run_id = await RunContext.enter(instance, outer)
+    assert outer_run_id != inner_run_id
+    assert storage.get(None) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_run_context_abort_cancels_run() -> None:
+    instance = Instance()
+    cancelled = False
+
+    async def handler(context: RunContext) -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    start = time.perf_counter()
+    with pytest.raises(AbortError):
+        await RunContext.enter(instance, handler, signal=AbortSignal.timeout(0.05))
+
+    assert cancelled
+    assert time.perf_counter() - start < 1
+    current_task = asyncio.current_task()
+    assert current_task is not None and current_task.cancelling() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_run_context_self_abort() -> None:
+    instance = Instance()
+
+    async def handler(context: RunContext) -> str:
+        context.controller.abort("Aborted by the handler")
+        return "done"
+
+    with pytest.raises(AbortError, match="Aborted by the handler"):
+        await RunContext.enter(instance, handler)
+
+    # the cancellation used for the abort does not leak to the caller
+    await asyncio.sleep(0)
+    current_task = asyncio.current_task()
+    assert current_task is not None and current_task.cancelling() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_run_context_does_not_run_when_aborted() -> None:
+    instance = Instance()
+    signal = AbortSignal()
+    signal._abort("Aborted before start")
+
+    async def handler(context: RunContext) -> None:
+        raise AssertionError("Should not be called.")
+
+    with pytest.raises(AbortError, match="Aborted before start"):
+        await RunContext.enter(instance, handler, signal=signal)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_run_context_releases_parent_signal() -> None:
+    instance = Instance()
+
+    async def inner(context: RunContext) -> int:
+        return 1
+
+    async def outer(context: RunContext) -> int:
+        listeners_before = len(context.signal._listeners)
+        total = sum([await RunContext.enter(instance, inner) for _ in range(10)])
+        assert len(context.signal._listeners) == listeners_before
+        return total
+
+    assert await RunContext.enter(instance, outer) == 10
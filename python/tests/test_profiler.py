@@ -0,0 +1,116 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.profiler import RunProfiler
+from beeai_framework.tools import ToolError, tool
+from beeai_framework.workflows.workflow import Workflow
+
+"""
+Utility functions and classes
+"""
+
+
+@tool
+async def sleepy(seconds: float) -> str:
+    """Sleeps for the given amount of seconds."""
+    await asyncio.sleep(seconds)
+    return "done"
+
+
+class State(BaseModel):
+    counter: int = 0
+
+
+async def call_tool(state: State) -> None:
+    await sleepy.run({"seconds": 0.02})
+    state.counter += 1
+
+
+def create_workflow() -> Workflow[State]:
+    workflow = Workflow[State](State, name="profiled")
+    workflow.add_step("first", call_tool)
+    workflow.add_step("second", call_tool)
+    return workflow
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_profiler_builds_tree() -> None:
+    with RunProfiler() as profiler:
+        await create_workflow().run(State())
+
+    await sleepy.run({"seconds": 0})  # not recorded anymore
+
+    assert len(profiler.roots) == 1
+    root = profiler.roots[0]
+    assert (root.kind, root.name, root.status) == ("workflow", "profiled", "success")
+    assert [(step.kind, step.name) for step in root.children] == [("step", "first"), ("step", "second")]
+
+    for step in root.children:
+        assert [(node.kind, node.name) for node in step.children] == [("tool", "sleepy")]
+        tool_node = step.children[0]
+        assert tool_node.wall_time >= 0.02
+        assert tool_node.await_time > 0
+        assert step.wall_time >= tool_node.wall_time
+        assert step.child_time == tool_node.wall_time
+
+    assert root.child_time == pytest.approx(sum(step.wall_time for step in root.children))
+    assert root.self_time == pytest.approx(root.wall_time - root.child_time)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_profiler_exports() -> None:
+    with RunProfiler() as profiler:
+        await create_workflow().run(State())
+
+    exported = json.loads(profiler.to_json())
+    assert exported[0]["children"][0]["children"][0]["name"] == "sleepy"
+    assert "self_time" in exported[0] and "await_time" in exported[0]
+
+    stacks = profiler.to_collapsed_stacks().splitlines()
+    assert "workflow:profiled;step:first;tool:sleepy" in [line.rsplit(" ", 1)[0] for line in stacks]
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in stacks)
+
+    trace = profiler.to_chrome_trace()
+    assert len(trace["traceEvents"]) == 5
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert {event["cat"] for event in trace["traceEvents"]} == {"workflow", "step", "tool"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_profiler_records_errors() -> None:
+    @tool
+    def failing() -> str:
+        """Always fails."""
+        raise ValueError("boom")
+
+    with RunProfiler() as profiler, pytest.raises(ToolError):
+        await failing.run({})
+
+    assert [(node.name, node.status) for node in profiler.roots] == [("failing", "error")]
+    assert profiler.roots[0].wall_time > 0
@@ -0,0 +1,106 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Generator
+
+import pytest
+
+from beeai_framework.tools import StringToolOutput, ToolExecutor, tool
+
+"""
+Utility functions and classes
+"""
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+@pytest.fixture
+def default_executor() -> Generator[ToolExecutor, None, None]:
+    previous = ToolExecutor.default()
+    executor = ToolExecutor("thread", max_workers=4)
+    ToolExecutor.set_default(executor)
+    yield executor
+    ToolExecutor.set_default(previous)
+    executor.shutdown()
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sync_function_tool_runs_off_loop(default_executor: ToolExecutor) -> None:
+    @tool
+    def thread_name() -> str:
+        """Returns the name of the current thread."""
+        return threading.current_thread().name
+
+    result: StringToolOutput = await thread_name.run({})
+    assert result.get_text_content().startswith("beeai-tool")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sync_function_tools_do_not_block_each_other(default_executor: ToolExecutor) -> None:
+    @tool
+    def sleep() -> str:
+        """Blocks for a while."""
+        time.sleep(0.2)
+        return "done"
+
+    start = time.perf_counter()
+    await asyncio.gather(*[sleep.run({}) for _ in range(4)])
+    assert time.perf_counter() - start < 0.6
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_per_tool_executor_overrides_default(default_executor: ToolExecutor) -> None:
+    @tool
+    def thread_name() -> str:
+        """Returns the name of the current thread."""
+        return threading.current_thread().name
+
+    thread_name.executor = ToolExecutor("inline")
+    result: StringToolOutput = await thread_name.run({})
+    assert result.get_text_content() == threading.current_thread().name
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_process_executor() -> None:
+    executor = ToolExecutor("process", max_workers=1)
+    try:
+        assert await executor.run(get_pid) != os.getpid()
+        # unpicklable work falls back to a thread
+        assert await executor.run(lambda: threading.current_thread().name) != threading.current_thread().name
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.unit
+def test_executor_validation() -> None:
+    with pytest.raises(ValueError):
+        ToolExecutor("thread", max_workers=0)
+    with pytest.raises(ValueError):
+        ToolExecutor("fiber")  # type: ignore[arg-type]